@@ -0,0 +1,304 @@
+import asyncio
+import random
+import threading
+
+import httpx
+from django.conf import settings
+
+from apps.wrapper.classes.circuit_breaker import CircuitBreaker
+from apps.wrapper.classes.metrics import Metrics
+from apps.wrapper.classes.single_flight import SingleFlight
+from apps.wrapper.classes.upstream_cache import UpstreamCache
+from apps.wrapper.exceptions import UpstreamUnavailable
+
+
+class AsyncPokemonApi:
+    """
+    A class that provides non-blocking access to the Pokemon API.
+
+    It mirrors `PokemonApi` on top of `httpx.AsyncClient`, so an ASGI worker
+    can wait on many PokeAPI calls at once. The client is shared by every
+    instance running on the same event loop, and keeps connections alive with
+    the same pool and retry settings as the synchronous client. It is closed
+    together with its loop, when `asyncio.run` or asgiref shut down the async
+    generators of the loop. Responses go through the same `UpstreamCache` and
+    `CircuitBreaker`.
+
+    Attributes:
+        stale (bool): Whether a stale response was served by this instance.
+    """
+
+    _BASE_URI = "https://pokeapi.co/api/v2/"
+    _clients = {}
+    _closers = {}
+    _client_lock = threading.Lock()
+
+    def __init__(self):
+        self._upstream_cache = UpstreamCache()
+        self._single_flight = SingleFlight()
+        self._circuit_breaker = CircuitBreaker()
+        self.stale = False
+
+    @property
+    def BASE_URI(self):  # pylint: disable=invalid-name
+        """
+        Gets the base URI of the object.
+
+        Returns:
+            str: The base URI of the object.
+        """
+
+        return settings.POKEAPI.get("BASE_URI", self._BASE_URI)
+
+    @staticmethod
+    def _build_client() -> httpx.AsyncClient:
+        """
+        Builds a client with the pool and retry settings of PokeAPI.
+
+        Returns:
+            httpx.AsyncClient: The new client.
+        """
+        config = settings.POKEAPI
+        transport = httpx.AsyncHTTPTransport(
+            retries=config["MAX_RETRIES"],
+            limits=httpx.Limits(
+                max_connections=config["POOL_MAXSIZE"],
+                max_keepalive_connections=config["POOL_MAXSIZE"],
+            ),
+        )
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                config["TIMEOUT"], connect=config["CONNECT_TIMEOUT"]
+            ),
+            transport=transport,
+        )
+
+    @classmethod
+    async def get_client(cls) -> httpx.AsyncClient:
+        """
+        Returns the client of the running event loop, creating it on first
+        use.
+
+        Returns:
+            httpx.AsyncClient: The client shared by the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with cls._client_lock:
+            client = cls._clients.get(loop)
+            if client is not None:
+                return client
+            # Forget the clients of loops closed without shutting them down
+            closed = [other for other in cls._clients if other.is_closed()]
+            for other in closed:
+                del cls._clients[other]
+                del cls._closers[other]
+            client = cls._clients[loop] = cls._build_client()
+            closer = cls._closers[loop] = cls._close_with_loop(loop, client)
+        await closer.__anext__()
+        return client
+
+    @classmethod
+    async def _close_with_loop(cls, loop, client: httpx.AsyncClient):
+        """
+        Closes the client of a loop once the loop shuts down its async
+        generators, or `close_client` closes this one.
+
+        Args:
+            loop: The event loop of the client.
+            client (httpx.AsyncClient): The client.
+        """
+        try:
+            yield
+        finally:
+            with cls._client_lock:
+                if cls._clients.get(loop) is client:
+                    del cls._clients[loop]
+                    del cls._closers[loop]
+            await client.aclose()
+
+    @classmethod
+    async def close_client(cls) -> None:
+        """
+        Closes the client of the running event loop.
+        """
+        closer = cls._closers.get(asyncio.get_running_loop())
+        if closer is not None:
+            await closer.aclose()
+
+    @staticmethod
+    def _backoff(attempt: int, response: httpx.Response) -> float:
+        """
+        Computes how long to wait before retrying a request.
+
+        Args:
+            attempt (int): The number of the retry, starting at 1.
+            response (httpx.Response): The response that will be retried.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        config = settings.POKEAPI
+        return config["BACKOFF_FACTOR"] * (2 ** (attempt - 1)) + (
+            random.uniform(0, config["BACKOFF_JITTER"])
+        )
+
+    async def _get(
+        self, endpoint: str, headers: dict = None
+    ) -> httpx.Response:
+        """
+        Sends a GET request to PokeAPI, retrying 429/5xx responses with
+        jittered exponential backoff.
+
+        Args:
+            endpoint (str): The URL to request.
+            headers (dict): Additional headers of the request.
+
+        Returns:
+            httpx.Response: The response of PokeAPI.
+        """
+        config = settings.POKEAPI
+        client = await self.get_client()
+        response = await client.get(endpoint, headers=headers)
+        for attempt in range(1, config["MAX_RETRIES"] + 1):
+            if response.status_code not in config["RETRY_STATUS_FORCELIST"]:
+                break
+            await asyncio.sleep(self._backoff(attempt, response))
+            response = await client.get(endpoint, headers=headers)
+        return response
+
+    async def _get_json(self, endpoint: str, resource: str):
+        """
+        Asynchronous version of `PokemonApi._get_json`.
+
+        Args:
+            endpoint (str): The URL to request.
+            resource (str): The resource type, a key of `CACHE_TTL`.
+
+        Returns:
+            The JSON body, or None if PokeAPI didn't answer with it.
+        """
+        entry = await self._upstream_cache.aget(endpoint)
+        if entry and self._upstream_cache.is_fresh(entry):
+            return entry["data"]
+        if not self._circuit_breaker.allow_request():
+            return self._serve_stale(entry)
+        try:
+            return await self._single_flight.ado(
+                endpoint,
+                lambda: self._fetch_json(endpoint, resource, entry),
+                lambda: self._upstream_cache.aget_fresh(endpoint),
+            )
+        except UpstreamUnavailable:
+            return self._serve_stale(entry)
+
+    def _serve_stale(self, entry: dict):
+        """
+        Falls back to the last known good response of an endpoint.
+
+        Args:
+            entry (dict): The stale cache entry of the endpoint, if any.
+
+        Returns:
+            The JSON body of the entry.
+
+        Raises:
+            UpstreamUnavailable: If there is no entry to fall back to.
+        """
+        if entry is None:
+            raise UpstreamUnavailable()
+        Metrics.incr("upstream.stale")
+        self.stale = True
+        return entry["data"]
+
+    async def _fetch_json(self, endpoint: str, resource: str, entry: dict):
+        """
+        Requests an endpoint from PokeAPI and stores its response in the
+        upstream cache.
+
+        Args:
+            endpoint (str): The URL to request.
+            resource (str): The resource type, a key of `CACHE_TTL`.
+            entry (dict): The stale cache entry of the endpoint, if any.
+
+        Returns:
+            The JSON body, or None if PokeAPI didn't answer with it.
+
+        Raises:
+            UpstreamUnavailable: If PokeAPI can't be reached or answers with
+                                 an error after the retries.
+        """
+        try:
+            response = await self._get(
+                endpoint, self._upstream_cache.conditional_headers(entry)
+            )
+        except httpx.HTTPError as error:
+            self._circuit_breaker.record_failure()
+            raise UpstreamUnavailable() from error
+        if response.status_code in settings.POKEAPI["RETRY_STATUS_FORCELIST"]:
+            self._circuit_breaker.record_failure()
+            raise UpstreamUnavailable()
+        self._circuit_breaker.record_success()
+        if response.status_code == 304 and entry:
+            await self._upstream_cache.aset(
+                endpoint, self._upstream_cache.revalidated(entry)
+            )
+            return entry["data"]
+        if response.status_code == 200:
+            data = response.json()
+            await self._upstream_cache.aset(
+                endpoint,
+                self._upstream_cache.build_entry(
+                    resource,
+                    data,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                ),
+            )
+            return data
+        return None
+
+    async def get_pokemon_list(self, limit: int, offset: int) -> dict:
+        """
+        Retrieves a list of Pokemon from the API.
+
+        Args:
+            limit (int): The maximum number of Pokemon to retrieve.
+            offset (int): The starting position of the Pokemon list.
+
+        Returns:
+            dict: The page of Pokemon retrieved from the API, or an empty
+                  dictionary if PokeAPI didn't return it.
+
+        Raises:
+            UpstreamUnavailable: If PokeAPI is down and nothing is cached.
+        """
+
+        endpoint = f"{self.BASE_URI}pokemon?limit={limit}&offset={offset}"
+        data = await self._get_json(endpoint, "pokemon_list")
+        if data is not None:
+            return data
+        return {}
+
+    async def get_pokemon_by_id(self, pokeapi_id: int) -> dict:
+        """
+        Retrieves a Pokemon from the PokeAPI based on its ID.
+
+        Args:
+            pokeapi_id (int): The ID of the Pokemon to retrieve.
+
+        Returns:
+            dict: A dictionary containing information about the Pokemon. If the
+                  Pokemon does not exist, an empty dictionary is returned.
+
+        Raises:
+            UpstreamUnavailable: If PokeAPI is down and nothing is cached.
+        """
+
+        endpoint = f"{self.BASE_URI}pokemon/{pokeapi_id}"
+        data = await self._get_json(endpoint, "pokemon")
+        if data is not None:
+            return data
+        return {}
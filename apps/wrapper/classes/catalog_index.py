@@ -0,0 +1,204 @@
+import sys
+import threading
+from array import array
+from collections import defaultdict
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from apps.wrapper import models
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+
+
+class CatalogIndex:
+    """
+    A compact, process-wide index of the Pokemon catalog used to filter the
+    list endpoint in memory.
+
+    The ids are kept in an array and the names in a list of interned strings,
+    both in catalog order. A position lookup by id makes the `pokedex_id`
+    filter O(1), and the n-grams of every name, up to `NGRAM` characters, map
+    to the positions that contain them, so a `name` filter only checks the
+    names that share its rarest n-gram.
+
+    The index is rebuilt from `PokemonCatalogEntry` whenever the catalog
+    version of `PokemonCatalog` changes.
+    """
+
+    NGRAM = 3
+
+    _lock = threading.Lock()
+    _current = None
+
+    def __init__(self, entries: Iterable[Tuple[int, str]], version=None):
+        """
+        Builds the index.
+
+        Args:
+            entries (Iterable): The (pokeapi_id, name) pairs of the catalog,
+                                in catalog order.
+            version: The catalog version the entries belong to.
+        """
+        self.version = version
+        self.ids = array("I")
+        self.names = []
+        self._positions = {}
+        ngrams = defaultdict(lambda: array("I"))
+        for position, (pokeapi_id, name) in enumerate(entries):
+            name = sys.intern(name)
+            self.ids.append(pokeapi_id)
+            self.names.append(name)
+            self._positions[pokeapi_id] = position
+            for ngram in self.ngrams(name):
+                ngrams[ngram].append(position)
+        self._ngrams = dict(ngrams)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def ngrams(cls, name: str) -> set:
+        """
+        Returns the distinct substrings of a name of up to `NGRAM`
+        characters.
+
+        Args:
+            name (str): The name of the Pokemon.
+
+        Returns:
+            set: The n-grams of the name.
+        """
+        return {
+            ngram
+            for size in range(1, cls.NGRAM + 1)
+            for ngram in cls.substrings(name, size)
+        }
+
+    @staticmethod
+    def substrings(name: str, size: int) -> Iterator[str]:
+        """
+        Yields the substrings of a name of a given size.
+
+        Args:
+            name (str): The name of the Pokemon.
+            size (int): The size of the substrings.
+
+        Yields:
+            str: Every substring of the name of that size.
+        """
+        for start in range(len(name) - size + 1):
+            end = start + size
+            yield name[start:end]
+
+    @classmethod
+    def current(cls, version: Optional[int] = None) -> "CatalogIndex":
+        """
+        Returns the index of the current catalog version, rebuilding it if
+        the catalog changed since it was built.
+
+        Args:
+            version (int): The current catalog version, if already known.
+
+        Returns:
+            CatalogIndex: The index of the catalog.
+        """
+        if version is None:
+            version = PokemonCatalog.version()
+        index = cls._current
+        if index is not None and index.version == version:
+            return index
+        with cls._lock:
+            index = cls._current
+            if index is None or index.version != version:
+                index = cls._current = cls(
+                    models.PokemonCatalogEntry.objects.values_list(
+                        "pokeapi_id", "name"
+                    ).iterator(),
+                    version,
+                )
+        return index
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Drops the index of this process.
+        """
+        with cls._lock:
+            cls._current = None
+
+    def position(self, pokedex_id: Optional[str]) -> Optional[int]:
+        """
+        Looks up the position of a Pokemon by pokeapi_id.
+
+        Args:
+            pokedex_id (str): The pokeapi_id of the Pokemon.
+
+        Returns:
+            int: The position of the Pokemon, or None if it isn't indexed.
+        """
+        pokedex_id = str(pokedex_id)
+        if not (pokedex_id.isascii() and pokedex_id.isdecimal()):
+            return None
+        return self._positions.get(int(pokedex_id))
+
+    def search(
+        self, name: Optional[str] = None, pokedex_id: Optional[str] = None
+    ) -> Sequence[int]:
+        """
+        Finds the positions of the Pokemon matching the list filters.
+
+        Args:
+            name (str): A substring of the name of the Pokemon.
+            pokedex_id (str): The pokeapi_id of the Pokemon.
+
+        Returns:
+            Sequence: The matching positions, in catalog order.
+        """
+        if pokedex_id:
+            position = self.position(pokedex_id)
+            positions = [] if position is None else [position]
+        elif name:
+            positions = self.candidates(name)
+            if len(name) <= self.NGRAM:
+                return positions
+        else:
+            return range(len(self))
+        if name:
+            positions = [
+                position
+                for position in positions
+                if name in self.names[position]
+            ]
+        return positions
+
+    def candidates(self, name: str) -> Sequence[int]:
+        """
+        Returns the positions of the names that may contain a substring.
+
+        Args:
+            name (str): The substring to look for.
+
+        Returns:
+            Sequence: The positions of the names that contain `name`, if it
+            is at most `NGRAM` characters long, or else the positions of the
+            names that contain its rarest n-gram.
+        """
+        if len(name) <= self.NGRAM:
+            return self._ngrams.get(name, ())
+        return min(
+            (
+                self._ngrams.get(ngram, ())
+                for ngram in self.substrings(name, self.NGRAM)
+            ),
+            key=len,
+        )
+
+    def entry(self, position: int) -> Tuple[int, str]:
+        """
+        Returns the entry at a position.
+
+        Args:
+            position (int): The position of the entry.
+
+        Returns:
+            tuple: The pokeapi_id and the name of the Pokemon.
+        """
+        return self.ids[position], self.names[position]
@@ -0,0 +1,44 @@
+from typing import Dict, Iterable, Iterator, Tuple
+
+
+class CatalogMerge:
+    """
+    A class that merges the Pokemon index of PokeAPI with the local
+    overrides, keyed by pokeapi_id.
+
+    The upstream entries are consumed lazily and each one costs a dict
+    lookup, so the merge runs in linear time and can stream over the pages of
+    PokeAPI. Upstream order is kept; overrides of Pokemon that PokeAPI doesn't
+    know are yielded at the end, by pokeapi_id.
+    """
+
+    def __init__(self, overrides: Dict[int, str]):
+        """
+        Initializes the merge with the local overrides.
+
+        Args:
+            overrides (dict): The name of every override, by pokeapi_id.
+        """
+        self._overrides = overrides
+
+    def merge(
+        self, upstream: Iterable[Tuple[int, str]]
+    ) -> Iterator[Tuple[int, str, bool]]:
+        """
+        Yields the merged entries.
+
+        Args:
+            upstream (Iterable): The (pokeapi_id, name) pairs of PokeAPI.
+
+        Yields:
+            tuple: The pokeapi_id, the name and whether the entry is an
+            override.
+        """
+        pending = dict(self._overrides)
+        for pokeapi_id, name in upstream:
+            if pokeapi_id in pending:
+                yield pokeapi_id, pending.pop(pokeapi_id), True
+            else:
+                yield pokeapi_id, name, False
+        for pokeapi_id in sorted(pending):
+            yield pokeapi_id, pending[pokeapi_id], True
@@ -0,0 +1,120 @@
+import threading
+import time
+
+from django.conf import settings
+
+from apps.wrapper.classes.metrics import Metrics
+
+
+class CircuitBreaker:
+    """
+    A class that stops calling PokeAPI after repeated failures.
+
+    The circuit starts closed. After `CIRCUIT_FAILURE_THRESHOLD` consecutive
+    failures it opens, and every call fails fast without touching the
+    network. Once `CIRCUIT_RESET_TIMEOUT` seconds have passed, it turns
+    half-open and lets a single probe through: a success closes the circuit
+    again, a failure opens it for another timeout.
+
+    The state is shared by every instance with the same name in the process.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    _lock = threading.Lock()
+    _states = {}
+
+    def __init__(self, name: str = "pokeapi"):
+        self.name = name
+        with self._lock:
+            self._states.setdefault(name, self._initial_state())
+
+    @classmethod
+    def _initial_state(cls) -> dict:
+        return {
+            "state": cls.CLOSED,
+            "failures": 0,
+            "opened_at": 0.0,
+            "probe_started_at": None,
+        }
+
+    @classmethod
+    def reset_all(cls) -> None:
+        """
+        Closes every circuit of the process.
+        """
+        with cls._lock:
+            for name in cls._states:
+                cls._states[name] = cls._initial_state()
+
+    @property
+    def state(self) -> str:
+        """
+        Returns the state of the circuit.
+
+        Returns:
+            str: One of `CLOSED`, `OPEN` or `HALF_OPEN`.
+        """
+        with self._lock:
+            return self._states[self.name]["state"]
+
+    def allow_request(self) -> bool:
+        """
+        Checks whether a call may go to PokeAPI.
+
+        Returns:
+            bool: False while the circuit is open, or while it is half-open
+                  and another call is already probing.
+        """
+        reset_timeout = settings.POKEAPI["CIRCUIT_RESET_TIMEOUT"]
+        now = time.monotonic()
+        with self._lock:
+            state = self._states[self.name]
+            if state["state"] == self.OPEN:
+                if now - state["opened_at"] >= reset_timeout:
+                    state["state"] = self.HALF_OPEN
+                    state["probe_started_at"] = None
+            if state["state"] == self.CLOSED:
+                allowed = True
+            elif state["state"] == self.OPEN:
+                allowed = False
+            else:
+                probe_started_at = state["probe_started_at"]
+                allowed = (
+                    probe_started_at is None
+                    or now - probe_started_at >= reset_timeout
+                )
+                if allowed:
+                    state["probe_started_at"] = now
+        if not allowed:
+            Metrics.incr(f"circuit.{self.name}.rejected")
+        return allowed
+
+    def record_success(self) -> None:
+        """
+        Records a successful call, which closes the circuit.
+        """
+        with self._lock:
+            self._states[self.name] = self._initial_state()
+
+    def record_failure(self) -> None:
+        """
+        Records a failed call, which opens the circuit once the threshold is
+        reached or when a probe fails.
+        """
+        threshold = settings.POKEAPI["CIRCUIT_FAILURE_THRESHOLD"]
+        with self._lock:
+            state = self._states[self.name]
+            state["failures"] += 1
+            opened = state["state"] != self.OPEN and (
+                state["state"] == self.HALF_OPEN
+                or state["failures"] >= threshold
+            )
+            if opened:
+                state["state"] = self.OPEN
+                state["opened_at"] = time.monotonic()
+                state["probe_started_at"] = None
+        if opened:
+            Metrics.incr(f"circuit.{self.name}.opened")
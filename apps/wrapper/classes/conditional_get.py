@@ -0,0 +1,91 @@
+import hashlib
+from typing import Union
+
+from django.conf import settings
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+class ConditionalGet:
+    """
+    A class that adds validators and caching headers to the responses of a
+    request, and answers its `If-None-Match` header.
+
+    ETags are strong and cheap to compute before any work is done, from the
+    catalog version of a list page or from the rendered bytes of a detail,
+    so a matching request gets its 304 without running a serializer or
+    calling PokeAPI. The `Cache-Control` header of each action is read from
+    the `HTTP_CACHE` setting.
+    """
+
+    def __init__(self, request: Request):
+        self._etags = {
+            etag.removeprefix("W/")
+            for etag in parse_etags(request.headers.get("If-None-Match", ""))
+        }
+
+    @staticmethod
+    def etag(value: Union[bytes, str]) -> str:
+        """
+        Builds the strong ETag of a value.
+
+        Args:
+            value (bytes | str): The rendered body, or anything that changes
+                                 whenever it does.
+
+        Returns:
+            str: The quoted ETag.
+        """
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        return f'"{hashlib.md5(value).hexdigest()}"'
+
+    def matches(self, etag: str) -> bool:
+        """
+        Checks whether the client already has a representation.
+
+        Args:
+            etag (str): The ETag of the representation.
+
+        Returns:
+            bool: Whether `If-None-Match` lists the ETag, or is `*`.
+        """
+        return etag in self._etags or "*" in self._etags
+
+    @staticmethod
+    def cached(response: Response, action: str, etag: str) -> Response:
+        """
+        Adds the validator and the caching headers of an action to a
+        response.
+
+        Args:
+            response (Response): The response to send.
+            action (str): The action of the response, a key of `HTTP_CACHE`.
+            etag (str): The ETag of the response.
+
+        Returns:
+            Response: The given response.
+        """
+        response["ETag"] = etag
+        cache_control = settings.HTTP_CACHE.get(action)
+        if cache_control:
+            response["Cache-Control"] = cache_control
+        return response
+
+    def not_modified(self, action: str, etag: str) -> Response:
+        """
+        Builds the 304 response of a representation the client already has.
+
+        Args:
+            action (str): The action of the response, a key of `HTTP_CACHE`.
+            etag (str): The ETag of the representation.
+
+        Returns:
+            Response: The 304 response, with its validator and caching
+                      headers.
+        """
+        return self.cached(
+            Response(status=status.HTTP_304_NOT_MODIFIED), action, etag
+        )
@@ -0,0 +1,187 @@
+import gzip
+from typing import Optional
+
+import brotli
+from django.conf import settings
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.wrapper.classes.tiered_cache import TieredCache
+
+
+class ContentEncoding:
+    """
+    A class that negotiates the compression of rendered responses.
+
+    The encoding is picked from the `Accept-Encoding` header of the request,
+    preferring the first one of `ENCODINGS` among those with the highest
+    q-value. Bodies shorter than `COMPRESSION["MIN_SIZE"]` are sent as they
+    are.
+
+    Compressed variants are cached by the ETag of the uncompressed bytes plus
+    their encoding, so a hit doesn't compress anything and a variant is never
+    served after its bytes change.
+    """
+
+    ENCODINGS = ("br", "gzip")
+    KEY_PREFIX = "pokemon:compressed:"
+
+    def __init__(self, request: Request):
+        self.accepted = self.negotiate(
+            request.headers.get("Accept-Encoding", "")
+        )
+        # Keys change with the ETag of the content, so L1 needs no broadcast
+        self._cache = TieredCache(
+            settings.POKEAPI["CACHE_ALIAS"], "compressed", broadcast=False
+        )
+
+    @classmethod
+    def negotiate(cls, accept_encoding: str) -> Optional[str]:
+        """
+        Picks the encoding of a response.
+
+        Args:
+            accept_encoding (str): The `Accept-Encoding` header.
+
+        Returns:
+            str: One of `ENCODINGS`, or None to send the body uncompressed.
+        """
+        qualities = {}
+        for item in accept_encoding.split(","):
+            name, _, params = item.strip().partition(";")
+            quality = 1.0
+            for param in params.split(";"):
+                key, _, value = param.strip().partition("=")
+                if key == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[name.strip().lower()] = quality
+        wildcard = qualities.get("*", 0.0)
+        best, encoding = 0.0, None
+        for name in cls.ENCODINGS:
+            quality = qualities.get(name, wildcard)
+            if quality > best:
+                best, encoding = quality, name
+        return encoding
+
+    def encoding(self, content: bytes) -> Optional[str]:
+        """
+        Returns the encoding of a body.
+
+        Args:
+            content (bytes): The uncompressed body.
+
+        Returns:
+            str: The accepted encoding, or None if the body is too short.
+        """
+        if len(content) < settings.COMPRESSION["MIN_SIZE"]:
+            return None
+        return self.accepted
+
+    @staticmethod
+    def etag(etag: str, encoding: Optional[str]) -> str:
+        """
+        Builds the ETag of a variant, as each of them has its own bytes.
+
+        Args:
+            etag (str): The quoted ETag of the uncompressed body.
+            encoding (str): The encoding of the variant, None for the
+                            uncompressed one.
+
+        Returns:
+            str: The quoted ETag of the variant.
+        """
+        if encoding is None:
+            return etag
+        return f'{etag[:-1]}-{encoding}"'
+
+    @staticmethod
+    def compress(content: bytes, encoding: str) -> bytes:
+        """
+        Compresses a body at the configured level.
+
+        Args:
+            content (bytes): The uncompressed body.
+            encoding (str): One of `ENCODINGS`.
+
+        Returns:
+            bytes: The compressed body.
+        """
+        config = settings.COMPRESSION
+        if encoding == "br":
+            return brotli.compress(content, quality=config["BROTLI_QUALITY"])
+        return gzip.compress(content, config["GZIP_LEVEL"], mtime=0)
+
+    @classmethod
+    def key(cls, etag: str) -> str:
+        """
+        Builds the cache key of a variant.
+
+        Args:
+            etag (str): The ETag of the variant.
+
+        Returns:
+            str: The cache key of the variant.
+        """
+        digest = etag.strip('"')
+        return f"{cls.KEY_PREFIX}{digest}"
+
+    def encode(
+        self, content: bytes, encoding: Optional[str], etag: str
+    ) -> bytes:
+        """
+        Returns the body of a variant, compressing it on a cache miss.
+
+        Args:
+            content (bytes): The uncompressed body.
+            encoding (str): The encoding of the variant, None for the
+                            uncompressed one.
+            etag (str): The ETag of the variant.
+
+        Returns:
+            bytes: The body of the variant.
+        """
+        if encoding is None:
+            return content
+        key = self.key(etag)
+        body = self._cache.get(key)
+        if body is None:
+            body = self.compress(content, encoding)
+            self._cache.set(key, body, settings.COMPRESSION["CACHE_TTL"])
+        return body
+
+    async def aencode(
+        self, content: bytes, encoding: Optional[str], etag: str
+    ) -> bytes:
+        """
+        Asynchronous version of `encode`.
+        """
+        if encoding is None:
+            return content
+        key = self.key(etag)
+        body = await self._cache.aget(key)
+        if body is None:
+            body = self.compress(content, encoding)
+            await self._cache.aset(
+                key, body, settings.COMPRESSION["CACHE_TTL"]
+            )
+        return body
+
+    @staticmethod
+    def vary(response: Response, encoding: Optional[str]) -> Response:
+        """
+        Adds the headers of a negotiated response.
+
+        Args:
+            response (Response): The response to send.
+            encoding (str): The encoding of its body, None if uncompressed.
+
+        Returns:
+            Response: The given response.
+        """
+        response["Vary"] = "Accept-Encoding"
+        if encoding is not None:
+            response["Content-Encoding"] = encoding
+        return response
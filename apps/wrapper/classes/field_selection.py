@@ -0,0 +1,164 @@
+from typing import Optional
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+class FieldSelection:
+    """
+    A class that selects the fields of a serialized object from the `fields`
+    and `exclude` query parameters.
+
+    Both take comma separated field names, with dots to reach the fields of
+    nested serializers, e.g. `?fields=id,name,types,sprites.front_default`
+    or `?exclude=sprites.other,sprites.versions`.
+
+    The selection prunes the fields of a serializer before it runs, so nested
+    serializers that aren't requested are never called. It can also pick the
+    selected fields out of data serialized beforehand, such as the snapshot
+    of a Pokemon.
+    """
+
+    FIELDS_PARAM = "fields"
+    EXCLUDE_PARAM = "exclude"
+
+    def __init__(
+        self, fields: Optional[str] = None, exclude: Optional[str] = None
+    ):
+        """
+        Initializes the selection.
+
+        Args:
+            fields (str): The fields to keep, None to keep all of them.
+            exclude (str): The fields to drop.
+        """
+        self.fields = self.tree(fields) if fields else None
+        self.exclude = self.tree(exclude) if exclude else {}
+
+    @classmethod
+    def from_query_params(cls, query_params) -> "FieldSelection":
+        """
+        Reads the selection of a request.
+
+        Args:
+            query_params (QueryDict): The query parameters of the request.
+
+        Returns:
+            FieldSelection: The selection.
+        """
+        return cls(
+            query_params.get(cls.FIELDS_PARAM, None),
+            query_params.get(cls.EXCLUDE_PARAM, None),
+        )
+
+    def __bool__(self) -> bool:
+        return self.fields is not None or bool(self.exclude)
+
+    @staticmethod
+    def tree(value: str) -> dict:
+        """
+        Parses a list of dotted field names.
+
+        Args:
+            value (str): The comma separated field names.
+
+        Returns:
+            dict: The selected fields by name. A field selected as a whole
+                  maps to None, one selected in part maps to the tree of its
+                  own selected fields.
+        """
+        tree = {}
+        for path in filter(None, (path.strip() for path in value.split(","))):
+            *parents, name = path.split(".")
+            node = tree
+            for parent in parents:
+                child = node.get(parent, {})
+                if child is None:
+                    break
+                node = node.setdefault(parent, child)
+            else:
+                node[name] = None
+        return tree
+
+    def prune(self, serializer: serializers.Serializer):
+        """
+        Drops the fields of a serializer that aren't selected.
+
+        Args:
+            serializer (Serializer): The serializer to prune.
+
+        Returns:
+            Serializer: The given serializer.
+
+        Raises:
+            ValidationError: If a selected field doesn't exist.
+        """
+        self._prune(serializer, self.fields, self.exclude, "")
+        return serializer
+
+    def _prune(self, serializer, fields, exclude, prefix):
+        """
+        Drops the fields of a serializer, or of a nested one, that aren't
+        selected.
+        """
+        unknown = [
+            f"{prefix}{name}"
+            for name in {*(fields or ()), *exclude}
+            if name not in serializer.fields
+        ]
+        if unknown:
+            raise ValidationError({
+                self.FIELDS_PARAM: [f"Unknown fields: {', '.join(unknown)}."]
+            })
+        for name, field in list(serializer.fields.items()):
+            if (fields is not None and name not in fields) or (
+                name in exclude and exclude[name] is None
+            ):
+                del serializer.fields[name]
+                continue
+            nested_fields = fields[name] if fields is not None else None
+            nested_exclude = exclude.get(name) or {}
+            if nested_fields is None and not nested_exclude:
+                continue
+            nested = getattr(field, "child", field)
+            if not isinstance(nested, serializers.Serializer):
+                raise ValidationError({
+                    self.FIELDS_PARAM: [f"{prefix}{name} has no fields."]
+                })
+            self._prune(
+                nested, nested_fields, nested_exclude, f"{prefix}{name}."
+            )
+
+    def select(self, serializer: serializers.Serializer, data: dict) -> dict:
+        """
+        Keeps the selected fields of data that was already serialized.
+
+        Args:
+            serializer (Serializer): The pruned serializer.
+            data (dict): The serialized object, with every field.
+
+        Returns:
+            dict: The serialized object, with only the selected fields.
+        """
+        if not self:
+            return data
+        return self._select(serializer, data)
+
+    @classmethod
+    def _select(cls, serializer, data):
+        """
+        Keeps the fields of a serializer, or of a nested one, in its data.
+        """
+        selected = {}
+        for name, field in serializer.fields.items():
+            value = data.get(name)
+            if value is not None and isinstance(
+                field, serializers.ListSerializer
+            ):
+                value = [cls._select(field.child, item) for item in value]
+            elif value is not None and isinstance(
+                field, serializers.Serializer
+            ):
+                value = cls._select(field, value)
+            selected[name] = value
+        return selected
@@ -0,0 +1,96 @@
+import hashlib
+from typing import Optional
+
+from django.conf import settings
+from django.http import QueryDict
+
+from apps.wrapper.classes.metrics import Metrics
+from apps.wrapper.classes.tiered_cache import TieredCache
+
+
+class ListCache:
+    """
+    A class that caches the pages of the list endpoint.
+
+    Pages are keyed by the catalog version and by their normalized query
+    parameters, so requests that differ only in cookies, parameter order or
+    defaults share an entry. A write to the catalog bumps its version, which
+    makes every cached page unreachable at once; they expire after
+    `POKEMON_LIST["CACHE_TTL"]` seconds. Pages are kept in a `TieredCache`.
+
+    Hits and misses are counted in `Metrics` as `list_cache.hit` and
+    `list_cache.miss`.
+    """
+
+    KEY_PREFIX = "pokemon:list:"
+    # The filters of a page, the only query parameters besides the pagination
+    # ones its key and links are built from
+    FILTER_PARAMS = ("name", "pokedex_id")
+
+    def __init__(self):
+        # Keys change with the catalog version, so L1 needs no broadcast
+        self._cache = TieredCache(
+            settings.POKEMON_LIST["CACHE_ALIAS"], "list", broadcast=False
+        )
+
+    def key(
+        self,
+        version: int,
+        url: str,
+        query_params: dict,
+        limit: int,
+        offset: int,
+        cursor: Optional[str] = None,
+    ) -> str:
+        """
+        Builds the cache key of a page.
+
+        Args:
+            version (int): The catalog version.
+            url (str): The absolute URL of the endpoint, without the query
+                       string, as the page links include it.
+            query_params (dict): The `name` and `pokedex_id` filters.
+            limit (int): The maximum number of pokemons in the page.
+            offset (int): The starting index of the page.
+            cursor (str): The cursor of the page, if paged by cursor.
+
+        Returns:
+            str: The cache key of the page.
+        """
+        canonical = QueryDict(mutable=True)
+        for name in self.FILTER_PARAMS:
+            if query_params.get(name):
+                canonical[name] = query_params[name]
+        canonical["limit"] = limit
+        if cursor is None:
+            canonical["offset"] = offset
+        else:
+            canonical["cursor"] = cursor
+        digest = hashlib.md5(
+            f"{url}?{canonical.urlencode()}".encode("utf-8")
+        ).hexdigest()
+        return f"{self.KEY_PREFIX}{version}:{digest}"
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Retrieves a cached page.
+
+        Args:
+            key (str): The cache key of the page.
+
+        Returns:
+            dict: The page, or None if it isn't cached.
+        """
+        data = self._cache.get(key)
+        Metrics.incr("list_cache.miss" if data is None else "list_cache.hit")
+        return data
+
+    def set(self, key: str, data: dict) -> None:
+        """
+        Stores a page.
+
+        Args:
+            key (str): The cache key of the page.
+            data (dict): The page.
+        """
+        self._cache.set(key, data, settings.POKEMON_LIST["CACHE_TTL"])
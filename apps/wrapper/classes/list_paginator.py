@@ -1,7 +1,14 @@
+import base64
+import binascii
+from bisect import bisect_right
 from collections import OrderedDict
-from typing import List
+from itertools import islice
+from typing import Any, Callable, Iterable, Optional, Sequence, Tuple
 
-from django.core.paginator import EmptyPage, Paginator
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import QueryDict
+from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
 
 
@@ -9,62 +16,219 @@ class ListPaginator:
     """
     A class that paginates a list of objects based on the provided offset and
     limit.
+
+    Only the requested slice is materialized, so a page costs the same
+    whatever the size of the data.
+
+    Sorted data can also be paginated by key with `paginate_cursor`: the
+    `next` link carries an opaque cursor with the last key of the page, so
+    deep pages cost the same as the first one and don't shift when items are
+    added before them.
     """
 
+    CURSOR_PARAM = "cursor"
+    INVALID_CURSOR = "Invalid cursor"
+    # The query parameters, besides the cursor and the limit, kept in the
+    # cursor links
+    LINK_PARAMS = ()
+
     def __init__(self, request: Request):
         self._url_scheme = request.scheme
         self._host = request.get_host()
         self._path_info = request.path_info
+        self._query_params = request.GET.copy()
+
+    @staticmethod
+    def limit_offset(query_params) -> Tuple[int, int]:
+        """
+        Reads the `limit` and `offset` query parameters of a page.
+
+        Missing or invalid values fall back to `PAGE_SIZE` and 0, and `limit`
+        is capped at `POKEMON_LIST["MAX_LIMIT"]`, as DRF's
+        `LimitOffsetPagination` does.
+
+        Args:
+            query_params (QueryDict): The query parameters of the request.
+
+        Returns:
+            tuple: The limit and the offset.
+        """
+        limit = settings.REST_FRAMEWORK["PAGE_SIZE"]
+        offset = 0
+        try:
+            limit = int(query_params.get("limit", limit))
+        except ValueError:
+            pass
+        try:
+            offset = max(0, int(query_params.get("offset", offset)))
+        except ValueError:
+            pass
+        if limit <= 0:
+            limit = settings.REST_FRAMEWORK["PAGE_SIZE"]
+        return min(limit, settings.POKEMON_LIST["MAX_LIMIT"]), offset
+
+    def page_url(self, offset: int, limit: int) -> Optional[str]:
+        """
+        Builds the URL of a page.
+
+        Args:
+            offset (int): The offset of the page.
+            limit (int): The maximum number of items per page.
+
+        Returns:
+            str: The URL of the page, or None without a host and path.
+        """
+        if not (self._host and self._path_info):
+            return None
+        return "{}://{}{}?offset={}&limit={}".format(
+            self._url_scheme, self._host, self._path_info, offset, limit
+        )
 
-    def paginate_list(self, data: List, limit: int, offset: int) -> dict:
+    def paginate_list(
+        self,
+        data: Iterable,
+        limit: int,
+        offset: int,
+        count: Optional[int] = None,
+    ) -> dict:
         """
         Paginates a list of data.
 
         Args:
-            data (List): The list of data to be paginated.
+            data (Iterable): The data to be paginated. A sequence or queryset
+                             is sliced, any other iterable is consumed up to
+                             the end of the page.
             limit (int): The maximum number of items per page.
             offset (int): The number of items to skip before starting the page.
+            count (int): The total number of items, required when `data` is
+                         an iterator.
 
         Returns:
             dict: A dictionary containing the paginated data, along with
             metadata such as the total count, previous and next URLs.
-
-        Raises:
-            EmptyPage: If the requested page is empty.
         """
-        page_number = offset // limit + 1
-        orphans = offset % limit
-        paginator = Paginator(data, limit, orphans=orphans)
-        try:
-            page = paginator.page(page_number)
-        except EmptyPage:
-            page = paginator.page(paginator.num_pages)
-            page.object_list = []
+        if count is None:
+            count = data.count() if isinstance(data, QuerySet) else len(data)
+        end = offset + limit
+        if hasattr(data, "__getitem__"):
+            results = list(data[offset:end])
+        else:
+            results = list(islice(data, offset, end))
 
         previous_url = None
         next_url = None
-        if self._host and self._path_info:
-            if page.has_previous():
-                previous_url = "{}://{}{}?offset={}&limit={}".format(
-                    self._url_scheme,
-                    self._host,
-                    self._path_info,
-                    offset - limit,
-                    limit,
-                )
-            if page.has_next():
-                next_url = "{}://{}{}?offset={}&limit={}".format(
-                    self._url_scheme,
-                    self._host,
-                    self._path_info,
-                    offset + limit,
-                    limit,
-                )
+        if offset > 0:
+            previous_url = self.page_url(max(0, offset - limit), limit)
+        if end < count:
+            next_url = self.page_url(end, limit)
 
         response_dict = OrderedDict([
-            ("count", len(data)),
+            ("count", count),
             ("next", next_url),
             ("previous", previous_url),
-            ("results", page.object_list),
+            ("results", results),
         ])
         return response_dict
+
+    @staticmethod
+    def encode_cursor(key: int) -> str:
+        """
+        Builds the opaque cursor of a key.
+
+        Args:
+            key (int): The last key of a page.
+
+        Returns:
+            str: The cursor.
+        """
+        return base64.urlsafe_b64encode(f"k={key}".encode()).decode()
+
+    def decode_cursor(self, cursor: Optional[str]) -> Optional[int]:
+        """
+        Reads the key of a cursor.
+
+        Args:
+            cursor (str): The cursor, empty or None for the first page.
+
+        Returns:
+            int: The last key of the previous page, or None for the first
+            page.
+
+        Raises:
+            NotFound: If the cursor is malformed.
+        """
+        if not cursor:
+            return None
+        try:
+            value = base64.urlsafe_b64decode(cursor.encode()).decode()
+        except (binascii.Error, UnicodeError, ValueError):
+            raise NotFound(self.INVALID_CURSOR)
+        prefix, _, key = value.partition("=")
+        if prefix != "k" or not (key.isascii() and key.isdecimal()):
+            raise NotFound(self.INVALID_CURSOR)
+        return int(key)
+
+    def cursor_url(self, cursor: str, limit: int) -> Optional[str]:
+        """
+        Builds the URL of a cursor page, keeping the `LINK_PARAMS` query
+        parameters of the request.
+
+        Args:
+            cursor (str): The cursor of the page.
+            limit (int): The maximum number of items per page.
+
+        Returns:
+            str: The URL of the page, or None without a host and path.
+        """
+        if not (self._host and self._path_info):
+            return None
+        query_params = QueryDict(mutable=True)
+        for name in self.LINK_PARAMS:
+            if self._query_params.get(name):
+                query_params[name] = self._query_params[name]
+        query_params[self.CURSOR_PARAM] = cursor
+        query_params["limit"] = limit
+        return "{}://{}{}?{}".format(
+            self._url_scheme,
+            self._host,
+            self._path_info,
+            query_params.urlencode(),
+        )
+
+    def paginate_cursor(
+        self,
+        data: Sequence,
+        limit: int,
+        cursor: Optional[str],
+        key: Callable[[Any], int],
+    ) -> dict:
+        """
+        Paginates sorted data by key.
+
+        Args:
+            data (Sequence): The data to be paginated, sorted by `key`.
+            limit (int): The maximum number of items per page.
+            cursor (str): The cursor of the page, empty or None for the first
+                          one.
+            key (Callable): The function that returns the key of an item.
+
+        Returns:
+            dict: A dictionary containing the page and the URL of the next
+            one.
+
+        Raises:
+            NotFound: If the cursor is malformed.
+        """
+        after = self.decode_cursor(cursor)
+        start = 0 if after is None else bisect_right(data, after, key=key)
+        end = start + limit
+        results = list(data[start:end])
+
+        next_url = None
+        if results and end < len(data):
+            next_url = self.cursor_url(
+                self.encode_cursor(key(results[-1])), limit
+            )
+
+        response_dict = OrderedDict([("next", next_url), ("results", results)])
+        return response_dict
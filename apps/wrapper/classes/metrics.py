@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class Metrics:
+    """
+    A class that keeps process-wide counters of the PokeAPI client.
+
+    Counters are incremented in memory and their deltas are flushed to the
+    shared cache at most every `METRICS_FLUSH_INTERVAL` seconds, so the totals
+    of every worker can be read back from any of them.
+    """
+
+    KEY_PREFIX = "pokeapi:metrics:"
+    NAMES_KEY = "pokeapi:metrics:names"
+
+    _lock = threading.Lock()
+    _counters = Counter()
+    _pending = Counter()
+    _flushed_at = 0.0
+
+    @classmethod
+    def incr(cls, name: str, value: int = 1) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            name (str): The name of the counter.
+            value (int): The amount to add.
+        """
+        interval = settings.POKEAPI["METRICS_FLUSH_INTERVAL"]
+        with cls._lock:
+            cls._counters[name] += value
+            cls._pending[name] += value
+            due = time.monotonic() - cls._flushed_at >= interval
+        if due:
+            cls.flush()
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Adds the counts that weren't flushed yet to the shared totals.
+        """
+        with cls._lock:
+            pending, cls._pending = cls._pending, Counter()
+            cls._flushed_at = time.monotonic()
+        if not pending:
+            return
+        cache = caches[settings.POKEAPI["CACHE_ALIAS"]]
+        names = cache.get(cls.NAMES_KEY, set())
+        if not names.issuperset(pending):
+            cache.set(cls.NAMES_KEY, names | set(pending), None)
+        for name, value in pending.items():
+            key = f"{cls.KEY_PREFIX}{name}"
+            if cache.add(key, value, None):
+                continue
+            try:
+                cache.incr(key, value)
+            except ValueError:
+                cache.add(key, value, None)
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        """
+        Returns the counters of this process.
+
+        Returns:
+            dict: The value of every counter, by name.
+        """
+        with cls._lock:
+            return dict(cls._counters)
+
+    @classmethod
+    def shared_snapshot(cls) -> dict:
+        """
+        Returns the counters of every worker, as flushed to the cache.
+
+        Returns:
+            dict: The value of every counter, by name.
+        """
+        cache = caches[settings.POKEAPI["CACHE_ALIAS"]]
+        names = sorted(cache.get(cls.NAMES_KEY, set()))
+        values = cache.get_many([f"{cls.KEY_PREFIX}{name}" for name in names])
+        return {
+            name: values.get(f"{cls.KEY_PREFIX}{name}", 0) for name in names
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Forgets the counters of this process.
+        """
+        with cls._lock:
+            cls._counters = Counter()
+            cls._pending = Counter()
+            cls._flushed_at = 0.0
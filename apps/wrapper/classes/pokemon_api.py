@@ -1,13 +1,57 @@
+import threading
+
 import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from apps.wrapper.classes.circuit_breaker import CircuitBreaker
+from apps.wrapper.classes.metrics import Metrics
+from apps.wrapper.classes.single_flight import SingleFlight
+from apps.wrapper.classes.upstream_cache import UpstreamCache
+from apps.wrapper.exceptions import UpstreamUnavailable
 
 
 class PokemonApi:
     """
     A class that provides access to the Pokemon API.
+
+    Every instance shares a single process-wide `requests.Session`, so
+    connections to PokeAPI are pooled and kept alive between requests and
+    threads instead of paying a new TCP+TLS handshake each time. Responses are
+    cached by `UpstreamCache` and revalidated with conditional requests once
+    they are stale.
+
+    Calls go through a `CircuitBreaker`. When PokeAPI fails, or while the
+    circuit is open, the last known good response is served instead and
+    `stale` is set, so callers can flag the data as stale.
+
+    Attributes:
+        stale (bool): Whether a stale response was served by this instance.
+        fetched_at (float): When the last response served by this instance
+                            was fetched from PokeAPI, as a timestamp.
     """
 
     _BASE_URI = "https://pokeapi.co/api/v2/"
     _pokemon_list: list = []
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init__(self, revalidate: bool = False):
+        """
+        Initializes the client.
+
+        Args:
+            revalidate (bool): Whether fresh cache entries are revalidated
+                               with PokeAPI too, for callers that need the
+                               current response rather than a cached one.
+        """
+        self._upstream_cache = UpstreamCache()
+        self._single_flight = SingleFlight()
+        self._circuit_breaker = CircuitBreaker()
+        self.revalidate = revalidate
+        self.stale = False
+        self.fetched_at = None
 
     @property
     def BASE_URI(self):  # pylint: disable=invalid-name
@@ -18,9 +62,193 @@ class PokemonApi:
             str: The base URI of the object.
         """
 
-        return self._BASE_URI
+        return settings.POKEAPI.get("BASE_URI", self._BASE_URI)
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Returns the shared session, creating it on first use.
+
+        The session mounts an `HTTPAdapter` configured from
+        `settings.POKEAPI`, with a bounded connection pool and retries with
+        jittered exponential backoff for 429/5xx responses and connection
+        errors.
+
+        Returns:
+            requests.Session: The process-wide session.
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    cls._session = cls._build_session()
+        return cls._session
+
+    @classmethod
+    def close_session(cls) -> None:
+        """
+        Closes the shared session, so the next request builds a new one.
+        """
+        with cls._session_lock:
+            if cls._session is not None:
+                cls._session.close()
+            cls._session = None
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """
+        Builds a session with the pool and retry settings of PokeAPI.
+
+        Returns:
+            requests.Session: The new session.
+        """
+        config = settings.POKEAPI
+        # A read timeout isn't retried, so a hung PokeAPI holds a worker for
+        # TIMEOUT seconds at most before the circuit breaker counts it
+        retry = Retry(
+            total=config["MAX_RETRIES"],
+            read=0,
+            backoff_factor=config["BACKOFF_FACTOR"],
+            backoff_jitter=config["BACKOFF_JITTER"],
+            status_forcelist=config["RETRY_STATUS_FORCELIST"],
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=config["POOL_CONNECTIONS"],
+            pool_maxsize=config["POOL_MAXSIZE"],
+            pool_block=config["POOL_BLOCK"],
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.headers.update({"Connection": "keep-alive"})
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get(self, endpoint: str, headers: dict = None) -> requests.Response:
+        """
+        Sends a GET request to PokeAPI.
+
+        Args:
+            endpoint (str): The URL to request.
+            headers (dict): Additional headers of the request.
+
+        Returns:
+            requests.Response: The response of PokeAPI.
+        """
+        timeout = (
+            settings.POKEAPI["CONNECT_TIMEOUT"],
+            settings.POKEAPI["TIMEOUT"],
+        )
+        if settings.POKEAPI["POOLING"]:
+            return self.get_session().get(
+                endpoint, headers=headers, timeout=timeout
+            )
+        return requests.get(endpoint, headers=headers, timeout=timeout)
+
+    def _get_json(self, endpoint: str, resource: str):
+        """
+        Retrieves the JSON body of an endpoint, going through the upstream
+        cache.
+
+        A fresh cache entry is returned as is. A stale one is revalidated
+        with a conditional request, and reused if PokeAPI answers 304.
+        Concurrent misses of the same endpoint share a single request through
+        `SingleFlight`. With `revalidate`, every entry is revalidated, with a
+        request of its own.
+
+        Args:
+            endpoint (str): The URL to request.
+            resource (str): The resource type, a key of `CACHE_TTL`.
 
-    def get_pokemon_list(self, limit: int, offset: int) -> list:
+        Returns:
+            The JSON body, or None if PokeAPI didn't answer with it.
+        """
+        entry = self._upstream_cache.get(endpoint)
+        if (
+            entry
+            and self._upstream_cache.is_fresh(entry)
+            and not self.revalidate
+        ):
+            self.fetched_at = entry.get("fetched_at")
+            return entry["data"]
+        if not self._circuit_breaker.allow_request():
+            return self._serve_stale(entry)
+        try:
+            if self.revalidate:
+                return self._fetch_json(endpoint, resource, entry)
+            return self._single_flight.do(
+                endpoint,
+                lambda: self._fetch_json(endpoint, resource, entry),
+                lambda: self._upstream_cache.get_fresh(endpoint),
+            )
+        except UpstreamUnavailable:
+            return self._serve_stale(entry)
+
+    def _serve_stale(self, entry: dict):
+        """
+        Falls back to the last known good response of an endpoint.
+
+        Args:
+            entry (dict): The stale cache entry of the endpoint, if any.
+
+        Returns:
+            The JSON body of the entry.
+
+        Raises:
+            UpstreamUnavailable: If there is no entry to fall back to.
+        """
+        if entry is None:
+            raise UpstreamUnavailable()
+        Metrics.incr("upstream.stale")
+        self.stale = True
+        return entry["data"]
+
+    def _fetch_json(self, endpoint: str, resource: str, entry: dict):
+        """
+        Requests an endpoint from PokeAPI and stores its response in the
+        upstream cache.
+
+        Args:
+            endpoint (str): The URL to request.
+            resource (str): The resource type, a key of `CACHE_TTL`.
+            entry (dict): The stale cache entry of the endpoint, if any.
+
+        Returns:
+            The JSON body, or None if PokeAPI didn't answer with it.
+
+        Raises:
+            UpstreamUnavailable: If PokeAPI can't be reached or answers with
+                                 an error after the retries.
+        """
+        try:
+            response = self._get(
+                endpoint, self._upstream_cache.conditional_headers(entry)
+            )
+        except requests.RequestException as error:
+            self._circuit_breaker.record_failure()
+            raise UpstreamUnavailable() from error
+        if response.status_code in settings.POKEAPI["RETRY_STATUS_FORCELIST"]:
+            self._circuit_breaker.record_failure()
+            raise UpstreamUnavailable()
+        self._circuit_breaker.record_success()
+        if response.status_code == 304 and entry:
+            entry = self._upstream_cache.revalidated(entry)
+        elif response.status_code == 200:
+            entry = self._upstream_cache.build_entry(
+                resource,
+                response.json(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        else:
+            return None
+        self._upstream_cache.set(endpoint, entry)
+        self.fetched_at = entry["fetched_at"]
+        return entry["data"]
+
+    def get_pokemon_list(self, limit: int, offset: int) -> dict:
         """
         Retrieves a list of Pokemon from the API.
 
@@ -29,14 +257,18 @@ class PokemonApi:
             offset (int): The starting position of the Pokemon list.
 
         Returns:
-            list: A list of Pokemon objects retrieved from the API.
+            dict: The page of Pokemon retrieved from the API, or an empty
+                  dictionary if PokeAPI didn't return it.
+
+        Raises:
+            UpstreamUnavailable: If PokeAPI is down and nothing is cached.
         """
 
         endpoint = f"{self.BASE_URI}pokemon?limit={limit}&offset={offset}"
-        response = requests.get(endpoint, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        return []
+        data = self._get_json(endpoint, "pokemon_list")
+        if data is not None:
+            return data
+        return {}
 
     def get_pokemon_by_id(self, pokeapi_id: int) -> dict:
         """
@@ -48,10 +280,13 @@ class PokemonApi:
         Returns:
             dict: A dictionary containing information about the Pokemon. If the
                   Pokemon does not exist, an empty dictionary is returned.
+
+        Raises:
+            UpstreamUnavailable: If PokeAPI is down and nothing is cached.
         """
 
         endpoint = f"{self.BASE_URI}pokemon/{pokeapi_id}"
-        response = requests.get(endpoint, timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        data = self._get_json(endpoint, "pokemon")
+        if data is not None:
+            return data
         return {}
@@ -1,22 +1,61 @@
-import re
-
+import asyncio
+import json
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from apps.wrapper import models
+from apps.wrapper.classes.async_pokemon_api import AsyncPokemonApi
+from apps.wrapper.classes.catalog_index import CatalogIndex
+from apps.wrapper.classes.conditional_get import ConditionalGet
+from apps.wrapper.classes.content_encoding import ContentEncoding
+from apps.wrapper.classes.field_selection import FieldSelection
+from apps.wrapper.classes.list_cache import ListCache
 from apps.wrapper.classes.list_paginator import ListPaginator
 from apps.wrapper.classes.pokemon_api import PokemonApi
-from apps.wrapper.serializers import PokemonSerializer
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+from apps.wrapper.classes.pokemon_mirror import PokemonMirror
+from apps.wrapper.classes.rendered_cache import RenderedCache
+from apps.wrapper.exceptions import UpstreamUnavailable
+from apps.wrapper.responses import RenderedResponse
+from apps.wrapper.serializers import PokemonSerializer, PokemonUpdateSerializer
 
 
 class PokemonApiWrapper(ListPaginator):
     """
     A class that wraps the `PokemonApi` class and provides additional
     functionality
+
+    Responses built from stale PokeAPI data, served while PokeAPI is failing,
+    carry the `STALE_HEADER` header.
+
+    The whole catalog can be streamed with `export`, in any of the
+    `EXPORT_OUTPUTS` formats, and many details retrieved at once with
+    `batch`.
     """
 
+    STALE_HEADER = "X-Upstream-Stale"
+    LINK_PARAMS = ListCache.FILTER_PARAMS
+    IDS_PARAM = "ids"
+
+    # PokeAPI requests of every batch of the process, see `batch_executor`
+    _batch_executor = None
+    _batch_semaphores = weakref.WeakKeyDictionary()
+    _batch_lock = threading.Lock()
+    EXPORT_OUTPUTS = {
+        "json": "application/json",
+        "ndjson": "application/x-ndjson",
+    }
+
     def __init__(self, request: Request) -> None:
         """
         Initializes the object with the given request.
@@ -27,170 +66,544 @@ class PokemonApiWrapper(ListPaginator):
         Returns:
             None
         """
-        self._pokemon_list = []
-        self._count = 0
         self._pokemon_api = PokemonApi()
+        self._async_pokemon_api = AsyncPokemonApi()
+        self._list_cache = ListCache()
+        self._rendered_cache = RenderedCache()
+        self._conditional_get = ConditionalGet(request)
+        self._content_encoding = ContentEncoding(request)
         self.base_uri = "{}api/v1/".format(request.build_absolute_uri("/"))
         super().__init__(request)
 
-    @property
-    def pokemon_list(self) -> list:  # pylint: disable=used-before-assignment
+    def mark_stale(self, response: Response, pokemon_api) -> Response:
         """
-        Returns the list of pokemons.
+        Flags a response as stale if the data it was built from was.
+
+        Args:
+            response (Response): The response to flag.
+            pokemon_api: The `PokemonApi` or `AsyncPokemonApi` instance that
+                         provided the data.
 
         Returns:
-            list: The list of pokemons.
+            Response: The given response.
         """
-        return self._pokemon_list
+        if pokemon_api.stale:
+            response[self.STALE_HEADER] = "true"
+        return response
 
-    @pokemon_list.setter
-    def pokemon_list(self, value: list) -> None:
+    def pokemon_entry(self, pokeapi_id: int, name: str) -> dict:
         """
-        Sets the list of pokemons.
+        Builds the list entry of a Pokemon.
 
         Args:
-            value (list): The list of pokemons.
+            pokeapi_id (int): The ID of the Pokemon.
+            name (str): The name of the Pokemon.
+
+        Returns:
+            dict: The name and the URL of the Pokemon.
         """
-        self._pokemon_list = value
+        return {"name": name, "url": f"{self.base_uri}pokemon/{pokeapi_id}/"}
 
-    @property
-    def count(self) -> int:
+    def list(self, query_params, limit, offset, cursor=None):
         """
-        Returns the count of pokemons.
+        Retrieves a list of pokemons based on the given query parameters and
+        pagination settings.
+
+        The pokemons are filtered by the in-memory `CatalogIndex` of the
+        catalog table, and PokeAPI isn't called. Only the entries of the
+        requested page are turned into dictionaries, and the rendered page is
+        kept in the `ListCache` until the catalog changes. Its ETag comes from
+        the catalog version, so a matching `If-None-Match` of a client that
+        accepts no compression is answered with a 304 before any of that.
+        Other clients are revalidated against the ETag of the variant they
+        would be sent, which depends on the size of the cached page.
+
+        Args:
+            query_params (dict): A dictionary containing the query parameters
+                                 for filtering the pokemons. The supported
+                                 parameters are 'name'and 'pokedex_id'.
+            limit (int): The maximum number of pokemons to retrieve.
+            offset (int): The starting index of the retrieved pokemons.
+            cursor (str): The cursor of the page, to page by pokeapi_id
+                          instead of by offset. Empty for the first page.
 
         Returns:
-            int: The count of pokemons.
+            Response: The paginated list of pokemons matching the query
+            parameters.
         """
-        return self._count
+        version = PokemonCatalog.version()
+        key = self._list_cache.key(
+            version,
+            f"{self._url_scheme}://{self._host}{self._path_info}",
+            query_params,
+            limit,
+            offset,
+            cursor,
+        )
+        etag = ConditionalGet.etag(key)
+        if self._content_encoding.accepted is None:
+            if self._conditional_get.matches(etag):
+                return self.not_modified("list", etag)
+        content = self._list_cache.get(key)
+        if content is None:
+            data = self.build_list(
+                CatalogIndex.current(version),
+                query_params,
+                limit,
+                offset,
+                cursor,
+            )
+            content = RenderedCache.render(data)
+            self._list_cache.set(key, content)
+        return self.rendered_response(content, "list", etag)
 
-    @count.setter
-    def count(self, value: int) -> None:
+    def build_list(self, index, query_params, limit, offset, cursor=None):
         """
-        Sets the count of pokemons.
+        Filters and paginates the catalog index.
 
         Args:
-            value (int): The count of pokemons.
+            index (CatalogIndex): The catalog to list.
+            query_params (dict): The `name` and `pokedex_id` filters.
+            limit (int): The maximum number of pokemons to retrieve.
+            offset (int): The starting index of the retrieved pokemons.
+            cursor (str): The cursor of the page, if paged by cursor.
+
+        Returns:
+            dict: The page of pokemons.
         """
-        self._count = value
+        positions = index.search(**query_params)
+        if cursor is None:
+            data = self.paginate_list(positions, limit, offset)
+        else:
+            data = self.paginate_cursor(
+                positions, limit, cursor, key=index.ids.__getitem__
+            )
+        data["results"] = [
+            self.pokemon_entry(*index.entry(position))
+            for position in data["results"]
+        ]
+        return data
 
-    def pokemon_api_list(
-        self,
-        limit: int = settings.REST_FRAMEWORK["PAGE_SIZE"],
-        offset: int = 0,
-    ) -> list:
+    async def alist(self, query_params, limit, offset, cursor=None):
         """
-        Returns the list of pokemons from the `PokemonApi` class.
+        Asynchronous version of `list`.
 
         Args:
-            limit (int): The maximum number of pokemons to return.
-            offset (int): The number of pokemons to skip.
+            query_params (dict): A dictionary containing the query parameters
+                                 for filtering the pokemons. The supported
+                                 parameters are 'name'and 'pokedex_id'.
+            limit (int): The maximum number of pokemons to retrieve.
+            offset (int): The starting index of the retrieved pokemons.
+            cursor (str): The cursor of the page, to page by pokeapi_id
+                          instead of by offset. Empty for the first page.
 
         Returns:
-            list: The list of pokemons.
+            Response: The paginated list of pokemons matching the query
+            parameters.
         """
-        return self._pokemon_api.get_pokemon_list(limit, offset)
+        return await sync_to_async(self.list)(
+            query_params, limit, offset, cursor
+        )
 
-    def filter_pokemons(self, **kwargs) -> None:
+    def export_chunks(self, index: CatalogIndex, output: str) -> Iterator[str]:
         """
-        Filters the list of pokemons based on the given query parameters.
+        Yields the whole catalog as JSON text, `EXPORT_CHUNK_SIZE` entries
+        at a time.
 
         Args:
-            kwargs (dict): The query parameters.
+            index (CatalogIndex): The catalog to export.
+            output (str): `json` for a JSON array, `ndjson` for one JSON
+                          object per line.
+
+        Yields:
+            str: The next chunk of the document.
         """
-        if kwargs.get("name", None):
-            self._pokemon_list = [
-                pokemon
-                for pokemon in self._pokemon_list
-                if kwargs["name"] in pokemon["name"]
-            ]
-        if kwargs.get("pokedex_id", None):
-            regex = r"\/(\d+)\/"
-            self._pokemon_list = [
-                pokemon
-                for pokemon in self._pokemon_list
-                if kwargs["pokedex_id"] == re.findall(regex, pokemon["url"])[0]
-            ]
+        chunk_size = settings.POKEMON_LIST["EXPORT_CHUNK_SIZE"]
+        ndjson = output == "ndjson"
+        if not ndjson:
+            yield "["
+        for start in range(0, len(index), chunk_size):
+            end = min(start + chunk_size, len(index))
+            entries = (
+                json.dumps(self.pokemon_entry(*index.entry(position)))
+                for position in range(start, end)
+            )
+            if ndjson:
+                yield "".join(f"{entry}\n" for entry in entries)
+            else:
+                yield ("," if start else "") + ",".join(entries)
+        if not ndjson:
+            yield "]"
+
+    def export_response(self, chunks, output: str) -> StreamingHttpResponse:
+        """
+        Builds the streaming response of an export.
 
-    @property
-    def db_pokemons(self):
+        Args:
+            chunks: The iterator or async iterator of the document chunks.
+            output (str): `json` or `ndjson`.
+
+        Returns:
+            StreamingHttpResponse: The response that streams the chunks.
         """
-        Retrieves the list of pokemons from the database.
+        response = StreamingHttpResponse(
+            chunks, content_type=self.EXPORT_OUTPUTS[output]
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="pokemon.{output}"'
+        )
+        return response
+
+    @classmethod
+    def export_output(cls, output: Optional[str]) -> str:
+        """
+        Validates the `output` query parameter of an export.
+
+        Args:
+            output (str): The requested output, None for the default.
 
         Returns:
-            list: The list of pokemons.
+            str: The output format.
+
+        Raises:
+            ValidationError: If the output format isn't supported.
+        """
+        output = output or "json"
+        if output not in cls.EXPORT_OUTPUTS:
+            raise ValidationError({
+                "output": [f"Must be one of: {', '.join(cls.EXPORT_OUTPUTS)}."]
+            })
+        return output
+
+    def export(self, output: Optional[str]) -> StreamingHttpResponse:
         """
-        return list(models.Pokemon.objects.all().values("pokeapi_id", "name"))
+        Streams the whole catalog, merged with the local overrides, without
+        building it in memory.
 
-    def replace_urls(self):
+        Args:
+            output (str): `json` (the default) or `ndjson`.
+
+        Returns:
+            StreamingHttpResponse: The catalog export.
+
+        Raises:
+            ValidationError: If the output format isn't supported.
+        """
+        output = self.export_output(output)
+        chunks = self.export_chunks(CatalogIndex.current(), output)
+        return self.export_response(chunks, output)
+
+    async def aexport(self, output: Optional[str]) -> StreamingHttpResponse:
+        """
+        Asynchronous version of `export`, which streams the chunks from an
+        async iterator so ASGI servers don't buffer them.
+
+        Args:
+            output (str): `json` (the default) or `ndjson`.
+
+        Returns:
+            StreamingHttpResponse: The catalog export.
+
+        Raises:
+            ValidationError: If the output format isn't supported.
         """
-        Replaces the base URI in the list of pokemons with the base URI of the
-        PokemonApiWrapper class.
+        output = self.export_output(output)
+        index = await sync_to_async(CatalogIndex.current)()
+
+        async def chunks():
+            for chunk in self.export_chunks(index, output):
+                yield chunk
+
+        return self.export_response(chunks(), output)
+
+    @staticmethod
+    def detail_serializer(
+        selection: FieldSelection, data=None
+    ) -> PokemonSerializer:
         """
-        for index, pokemon in enumerate(self._pokemon_list):
-            self._pokemon_list[index]["url"] = re.sub(
-                rf"{self._pokemon_api.BASE_URI}",
-                f"{self.base_uri}",
-                pokemon["url"],
+        Builds the serializer of a Pokemon detail, with only the selected
+        fields.
+
+        Parameters:
+            selection (FieldSelection): The selected fields.
+            data: The Pokemon instance or PokeAPI data to serialize.
+
+        Returns:
+            PokemonSerializer: The pruned serializer.
+
+        Raises:
+            ValidationError: If a selected field doesn't exist.
+        """
+        return selection.prune(PokemonSerializer(data))
+
+    @classmethod
+    def local_pokemon(cls, pokeapi_id, selection: FieldSelection):
+        """
+        Serializes the local override of a Pokemon.
+
+        The detail is read from the snapshot of the override, a single row.
+        Overrides without one are serialized from their relations, with a
+        query for the Pokemon and one for each kind of slot.
+
+        Parameters:
+            pokeapi_id (str): The ID of the Pokemon to retrieve.
+            selection (FieldSelection): The selected fields.
+
+        Returns:
+            dict: The serialized Pokemon, or None if it isn't overridden.
+        """
+        serializer = cls.detail_serializer(selection)
+        queryset = models.Pokemon.objects.all()
+        try:
+            snapshot = queryset.values_list("snapshot", flat=True).get(
+                pokeapi_id=pokeapi_id
             )
+            if snapshot is None:
+                pokemon = (
+                    queryset.select_related("sprites")
+                    .prefetch_related("ability_slots", "type_slots")
+                    .get(pokeapi_id=pokeapi_id)
+                )
+                snapshot = PokemonUpdateSerializer.serialize(pokemon)
+        except (models.Pokemon.DoesNotExist, ValueError):
+            return None
+        return selection.select(serializer, snapshot)
+
+    @classmethod
+    def stored_pokemon(cls, pokeapi_id, selection: FieldSelection) -> tuple:
+        """
+        Serializes the local override of a Pokemon, or else its entry in the
+        `PokemonMirror`.
 
-    def add_or_update_pokemons(self, db_pokemons):
+        Parameters:
+            pokeapi_id (str): The ID of the Pokemon to retrieve.
+            selection (FieldSelection): The selected fields.
+
+        Returns:
+            tuple: The serialized Pokemon, or None if it isn't stored, and
+                   how long its rendered detail is kept.
         """
-        Adds or updates the list of pokemons in the instance.
+        data = cls.local_pokemon(pokeapi_id, selection)
+        if data is not None:
+            return data, RenderedCache.override_timeout()
+        detail = PokemonMirror.get(pokeapi_id)
+        if detail is None:
+            return None, None
+        serializer = cls.detail_serializer(selection)
+        return selection.select(serializer, detail), cls.detail_timeout()
+
+    @classmethod
+    def stored_pokemons(cls, pokeapi_ids, selection: FieldSelection) -> dict:
         """
-        for index, pokemon in enumerate(self._pokemon_list):
-            index = None
-            for index2, db_pokemon in enumerate(db_pokemons):
-                if db_pokemon["url"] == pokemon["url"]:
-                    self._pokemon_list[index] = db_pokemon
-                    index = index2
-            if index is not None:
-                try:
-                    db_pokemons.pop(index)
-                except IndexError:
-                    pass
+        Serializes the local overrides of many Pokemon, or else their entries
+        in the `PokemonMirror`.
 
-        self._pokemon_list += db_pokemons
+        The overrides are read with a single query, and so are the mirrored
+        details of the rest. Overrides without a snapshot are serialized from
+        their relations, with one more query for the Pokemon and one for each
+        kind of slot.
 
-    def list(self, query_params, limit, offset):
+        Parameters:
+            pokeapi_ids (list): The IDs of the Pokemon to retrieve.
+            selection (FieldSelection): The selected fields.
+
+        Returns:
+            dict: The serialized Pokemon that are stored, by ID.
         """
-        Retrieves a list of pokemons based on the given query parameters and
-        pagination settings.
+        serializer = cls.detail_serializer(selection)
+        overrides = dict(
+            models.Pokemon.objects.filter(
+                pokeapi_id__in=pokeapi_ids
+            ).values_list("pokeapi_id", "snapshot")
+        )
+        details = {
+            pokeapi_id: snapshot
+            for pokeapi_id, snapshot in overrides.items()
+            if snapshot is not None
+        }
+        without_snapshot = [
+            pokeapi_id for pokeapi_id in overrides if pokeapi_id not in details
+        ]
+        if without_snapshot:
+            pokemons = (
+                models.Pokemon.objects.select_related("sprites")
+                .prefetch_related("ability_slots", "type_slots")
+                .filter(pokeapi_id__in=without_snapshot)
+            )
+            for pokemon in pokemons:
+                details[pokemon.pokeapi_id] = (
+                    PokemonUpdateSerializer.serialize(pokemon)
+                )
+        remaining = [
+            pokeapi_id
+            for pokeapi_id in pokeapi_ids
+            if pokeapi_id not in overrides
+        ]
+        if remaining:
+            details.update(PokemonMirror.get_many(remaining))
+        return {
+            pokeapi_id: selection.select(serializer, detail)
+            for pokeapi_id, detail in details.items()
+        }
+
+    @staticmethod
+    def detail_timeout() -> int:
+        """
+        Returns how long the rendered detail of a PokeAPI Pokemon is kept,
+        the TTL of its upstream response.
+
+        Returns:
+            int: The number of seconds.
+        """
+        return settings.POKEAPI["CACHE_TTL"]["pokemon"]
+
+    def not_modified(self, action: str, etag: str) -> Response:
+        """
+        Builds the 304 response of a representation the client already has.
 
         Args:
-            query_params (dict): A dictionary containing the query parameters
-                                 for filtering the pokemons. The supported
-                                 parameters are 'name'and 'pokedex_id'.
-            limit (int): The maximum number of pokemons to retrieve.
-            offset (int): The starting index of the retrieved pokemons.
+            action (str): The action of the response, a key of `HTTP_CACHE`.
+            etag (str): The ETag of the representation.
 
         Returns:
-            Response: The paginated list of pokemons matching the query
-            parameters.
+            Response: The 304 response.
         """
+        response = self._conditional_get.not_modified(action, etag)
+        return ContentEncoding.vary(response, None)
 
-        response = self.pokemon_api_list()
-        self.count = response.get("count", 0)
-        self.pokemon_list = self.pokemon_api_list(limit=self.count).get(
-            "results", []
-        )
-        new_db_pokemons = []
-        for pokemon in self.db_pokemons:
-            pokemon["url"] = (
-                f"{self.base_uri}pokemon/{pokemon.pop('pokeapi_id')}/"
+    def encoded_response(
+        self,
+        content: bytes,
+        body: bytes,
+        action: str,
+        encoding: Optional[str],
+        etag: str,
+    ) -> Response:
+        """
+        Builds the response of a rendered body.
+
+        Args:
+            content (bytes): The rendered body.
+            body (bytes): The body to send, `content` encoded.
+            action (str): The action of the response, a key of `HTTP_CACHE`.
+            encoding (str): The encoding of `body`, None if uncompressed.
+            etag (str): The ETag of `body`.
+
+        Returns:
+            Response: The response, with its validator, caching and encoding
+                      headers.
+        """
+        response = RenderedResponse(content, body=body)
+        ContentEncoding.vary(response, encoding)
+        return ConditionalGet.cached(response, action, etag)
+
+    def rendered_response(
+        self, content: bytes, action: str, etag: str
+    ) -> Response:
+        """
+        Builds the response of a rendered body, compressed if the client
+        accepts it, or a 304 response if the client already has it.
+
+        Args:
+            content (bytes): The rendered body.
+            action (str): The action of the response, a key of `HTTP_CACHE`.
+            etag (str): The ETag of `content`.
+
+        Returns:
+            Response: The response.
+        """
+        encoding = self._content_encoding.encoding(content)
+        etag = ContentEncoding.etag(etag, encoding)
+        if self._conditional_get.matches(etag):
+            return self.not_modified(action, etag)
+        body = self._content_encoding.encode(content, encoding, etag)
+        return self.encoded_response(content, body, action, encoding, etag)
+
+    async def arendered_response(
+        self, content: bytes, action: str, etag: str
+    ) -> Response:
+        """
+        Asynchronous version of `rendered_response`.
+        """
+        encoding = self._content_encoding.encoding(content)
+        etag = ContentEncoding.etag(etag, encoding)
+        if self._conditional_get.matches(etag):
+            return self.not_modified(action, etag)
+        body = await self._content_encoding.aencode(content, encoding, etag)
+        return self.encoded_response(content, body, action, encoding, etag)
+
+    def build_retrieve(self, data, selection: FieldSelection):
+        """
+        Builds the response of a Pokemon retrieved from PokeAPI.
+
+        Parameters:
+            data (dict): The Pokemon data returned by PokeAPI.
+            selection (FieldSelection): The selected fields.
+
+        Returns:
+            Response: The response object containing the Pokemon data if found,
+                      or a 404 Not Found response if the Pokemon does not
+                      exist.
+        """
+        if data:
+            serializer = self.detail_serializer(selection, data)
+            return Response(data=serializer.data, status=status.HTTP_200_OK)
+        return Response(status=status.HTTP_404_NOT_FOUND)
+
+    def retrieve(self, pk):
+        """
+        Retrieves a Pokemon by its ID, preferring the local override, then
+        the mirrored detail, over PokeAPI.
+
+        The rendered detail is served from the `RenderedCache` when it is
+        there, and stored in it otherwise, unless it is stale. Its ETag is
+        the hash of those bytes, so a cached detail the client already has
+        is answered with a 304 without any other work. It is compressed if
+        the client accepts it, see `ContentEncoding`.
+
+        The `fields` and `exclude` query parameters select the fields of the
+        detail, see `FieldSelection`. Such a detail is built with only those
+        fields and isn't kept in the `RenderedCache`.
+
+        Parameters:
+            pk (int): The ID of the Pokemon to retrieve.
+
+        Returns:
+            Response: The response object containing the Pokemon data if found,
+                      or a 404 Not Found response if the Pokemon does not
+                      exist.
+        """
+        selection = FieldSelection.from_query_params(self._query_params)
+        content = None if selection else self._rendered_cache.get(pk)
+        if content is not None:
+            return self.rendered_response(
+                content, "retrieve", ConditionalGet.etag(content)
+            )
+        data, timeout = self.stored_pokemon(pk, selection)
+        if data is not None:
+            content = RenderedCache.render(data)
+            if not selection:
+                self._rendered_cache.set(pk, content, timeout)
+            return self.rendered_response(
+                content, "retrieve", ConditionalGet.etag(content)
+            )
+        data = self._pokemon_api.get_pokemon_by_id(pk)
+        if data and not self._pokemon_api.stale:
+            serializer = self.detail_serializer(selection, data)
+            content = RenderedCache.render(serializer.data)
+            if not selection:
+                self._rendered_cache.set(pk, content, self.detail_timeout())
+            return self.rendered_response(
+                content, "retrieve", ConditionalGet.etag(content)
             )
-            new_db_pokemons.append(pokemon)
-        if "name" in query_params or "pokedex_id" in query_params:
-            self.filter_pokemons(**query_params)
-        self.replace_urls()
-        self.add_or_update_pokemons(new_db_pokemons)
-        return Response(
-            data=self.paginate_list(self._pokemon_list, limit, offset),
-            status=status.HTTP_200_OK,
+        return self.mark_stale(
+            self.build_retrieve(data, selection), self._pokemon_api
         )
 
-    def retrieve(self, pk):
+    async def aretrieve(self, pk):
         """
-        Retrieves a Pokemon by its ID.
+        Asynchronous version of `retrieve`, which waits on PokeAPI without
+        blocking the event loop.
 
         Parameters:
             pk (int): The ID of the Pokemon to retrieve.
@@ -200,9 +613,275 @@ class PokemonApiWrapper(ListPaginator):
                       or a 404 Not Found response if the Pokemon does not
                       exist.
         """
+        selection = FieldSelection.from_query_params(self._query_params)
+        content = None if selection else await self._rendered_cache.aget(pk)
+        if content is not None:
+            return await self.arendered_response(
+                content, "retrieve", ConditionalGet.etag(content)
+            )
+        data, timeout = await sync_to_async(self.stored_pokemon)(pk, selection)
+        if data is not None:
+            content = RenderedCache.render(data)
+            if not selection:
+                await self._rendered_cache.aset(pk, content, timeout)
+            return await self.arendered_response(
+                content, "retrieve", ConditionalGet.etag(content)
+            )
+        data = await self._async_pokemon_api.get_pokemon_by_id(pk)
+        if data and not self._async_pokemon_api.stale:
+            serializer = self.detail_serializer(selection, data)
+            content = RenderedCache.render(serializer.data)
+            if not selection:
+                await self._rendered_cache.aset(
+                    pk, content, self.detail_timeout()
+                )
+            return await self.arendered_response(
+                content, "retrieve", ConditionalGet.etag(content)
+            )
+        return self.mark_stale(
+            self.build_retrieve(data, selection), self._async_pokemon_api
+        )
 
-        response = self._pokemon_api.get_pokemon_by_id(pk)
-        if response:
-            serializer = PokemonSerializer(response)
-            return Response(data=serializer.data, status=status.HTTP_200_OK)
-        return Response(status=status.HTTP_404_NOT_FOUND)
+    @classmethod
+    def batch_ids(cls, value: Optional[str]) -> list:
+        """
+        Parses the `ids` query parameter of a batch.
+
+        Parameters:
+            value (str): Comma separated Pokemon IDs, e.g. `1,4,7`.
+
+        Returns:
+            list: The IDs, without repetitions, in the order they were given.
+
+        Raises:
+            ValidationError: If there are no IDs, too many, or one isn't a
+                             positive integer.
+        """
+        parts = [part.strip() for part in (value or "").split(",")]
+        parts = [part for part in parts if part]
+        if not parts or not all(
+            part.isascii() and part.isdecimal() and int(part) > 0
+            for part in parts
+        ):
+            raise ValidationError({
+                cls.IDS_PARAM: [
+                    "Expected comma separated Pokemon IDs, e.g. `1,4,7`."
+                ]
+            })
+        pokeapi_ids = list(dict.fromkeys(int(part) for part in parts))
+        max_ids = settings.POKEMON_BATCH["MAX_IDS"]
+        if len(pokeapi_ids) > max_ids:
+            raise ValidationError({
+                cls.IDS_PARAM: [f"Ensure there are at most {max_ids} IDs."]
+            })
+        return pokeapi_ids
+
+    def build_batch(self, pokeapi_ids: list, results: dict, stale: bool):
+        """
+        Builds the response of a batch, in the order of its IDs.
+
+        Parameters:
+            pokeapi_ids (list): The IDs of the batch.
+            results (dict): The status code and the serialized Pokemon of
+                            each ID.
+            stale (bool): Whether any Pokemon was served from stale data.
+
+        Returns:
+            Response: The entries of the batch.
+        """
+        response = Response({
+            "count": len(pokeapi_ids),
+            "results": [
+                {
+                    "id": pokeapi_id,
+                    "status": results[pokeapi_id][0],
+                    "detail": results[pokeapi_id][1],
+                }
+                for pokeapi_id in pokeapi_ids
+            ],
+        })
+        if stale:
+            response[self.STALE_HEADER] = "true"
+        return response
+
+    def fetch_pokemon(self, pokeapi_id: int, selection: FieldSelection):
+        """
+        Retrieves a Pokemon of a batch from PokeAPI.
+
+        Parameters:
+            pokeapi_id (int): The ID of the Pokemon.
+            selection (FieldSelection): The selected fields.
+
+        Returns:
+            tuple: The status code, the serialized Pokemon, or None if it
+                   wasn't found, and whether it was served from stale data.
+        """
+        pokemon_api = PokemonApi()
+        try:
+            data = pokemon_api.get_pokemon_by_id(pokeapi_id)
+        except UpstreamUnavailable as error:
+            return (error.status_code, None), False
+        return self.fetched_result(data, selection), pokemon_api.stale
+
+    async def afetch_pokemon(
+        self,
+        pokeapi_id: int,
+        selection: FieldSelection,
+        semaphore: asyncio.Semaphore,
+    ):
+        """
+        Asynchronous version of `fetch_pokemon`, which waits for a slot of
+        the semaphore.
+        """
+        pokemon_api = AsyncPokemonApi()
+        async with semaphore:
+            try:
+                data = await pokemon_api.get_pokemon_by_id(pokeapi_id)
+            except UpstreamUnavailable as error:
+                return (error.status_code, None), False
+        return self.fetched_result(data, selection), pokemon_api.stale
+
+    def fetched_result(self, data: dict, selection: FieldSelection) -> tuple:
+        """
+        Serializes a Pokemon of a batch fetched from PokeAPI.
+
+        Parameters:
+            data (dict): The Pokemon data returned by PokeAPI.
+            selection (FieldSelection): The selected fields.
+
+        Returns:
+            tuple: The status code and the serialized Pokemon, or None if it
+                   doesn't exist.
+        """
+        if not data:
+            return status.HTTP_404_NOT_FOUND, None
+        serializer = self.detail_serializer(selection, data)
+        return status.HTTP_200_OK, serializer.data
+
+    @classmethod
+    def batch_executor(cls) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool shared by every batch of the process,
+        creating it on first use, so no more than
+        `POKEMON_BATCH["CONCURRENCY"]` PokeAPI requests are made at once
+        whatever the number of concurrent batches.
+
+        Returns:
+            ThreadPoolExecutor: The shared thread pool.
+        """
+        with cls._batch_lock:
+            if cls._batch_executor is None:
+                cls._batch_executor = ThreadPoolExecutor(
+                    max_workers=settings.POKEMON_BATCH["CONCURRENCY"],
+                    thread_name_prefix="pokemon-batch",
+                )
+            return cls._batch_executor
+
+    @classmethod
+    def close_batch_executor(cls) -> None:
+        """
+        Shuts the shared thread pool down, so the next batch builds a new one.
+        """
+        with cls._batch_lock:
+            if cls._batch_executor is not None:
+                cls._batch_executor.shutdown()
+            cls._batch_executor = None
+
+    @classmethod
+    def batch_semaphore(cls) -> asyncio.Semaphore:
+        """
+        Asynchronous version of `batch_executor`, which returns the semaphore
+        shared by every batch of the running event loop.
+
+        Returns:
+            asyncio.Semaphore: The shared semaphore.
+        """
+        loop = asyncio.get_running_loop()
+        with cls._batch_lock:
+            if loop not in cls._batch_semaphores:
+                cls._batch_semaphores[loop] = asyncio.Semaphore(
+                    settings.POKEMON_BATCH["CONCURRENCY"]
+                )
+            return cls._batch_semaphores[loop]
+
+    def batch(self, value: Optional[str]):
+        """
+        Retrieves many Pokemon at once, as `retrieve` would one by one.
+
+        The local overrides and the mirrored details are read with a query
+        each, see `stored_pokemons`. The rest are requested from PokeAPI
+        concurrently, through the `batch_executor` of the process.
+        Each entry has its own status code: 200, 404 if the Pokemon doesn't
+        exist, or 503 if PokeAPI is down and it isn't cached. The `fields`
+        and `exclude` query parameters select the fields of every detail.
+
+        Parameters:
+            value (str): Comma separated Pokemon IDs.
+
+        Returns:
+            Response: The entries of the Pokemon, in the order of their IDs.
+
+        Raises:
+            ValidationError: If the IDs or the selected fields are invalid.
+        """
+        pokeapi_ids = self.batch_ids(value)
+        selection = FieldSelection.from_query_params(self._query_params)
+        results = {
+            pokeapi_id: (status.HTTP_200_OK, detail)
+            for pokeapi_id, detail in self.stored_pokemons(
+                pokeapi_ids, selection
+            ).items()
+        }
+        remaining = [
+            pokeapi_id
+            for pokeapi_id in pokeapi_ids
+            if pokeapi_id not in results
+        ]
+        fetched = self.batch_executor().map(
+            lambda pokeapi_id: self.fetch_pokemon(pokeapi_id, selection),
+            remaining,
+        )
+        stale = False
+        for pokeapi_id, (result, fetched_stale) in zip(remaining, fetched):
+            results[pokeapi_id] = result
+            stale = stale or fetched_stale
+        return self.build_batch(pokeapi_ids, results, stale)
+
+    async def abatch(self, value: Optional[str]):
+        """
+        Asynchronous version of `batch`, which waits on PokeAPI without
+        blocking the event loop, with at most `POKEMON_BATCH["CONCURRENCY"]`
+        requests in flight across the batches of the event loop.
+
+        Parameters:
+            value (str): Comma separated Pokemon IDs.
+
+        Returns:
+            Response: The entries of the Pokemon, in the order of their IDs.
+        """
+        pokeapi_ids = self.batch_ids(value)
+        selection = FieldSelection.from_query_params(self._query_params)
+        stored = await sync_to_async(self.stored_pokemons)(
+            pokeapi_ids, selection
+        )
+        results = {
+            pokeapi_id: (status.HTTP_200_OK, detail)
+            for pokeapi_id, detail in stored.items()
+        }
+        remaining = [
+            pokeapi_id
+            for pokeapi_id in pokeapi_ids
+            if pokeapi_id not in results
+        ]
+        semaphore = self.batch_semaphore()
+        fetched = await asyncio.gather(
+            *(
+                self.afetch_pokemon(pokeapi_id, selection, semaphore)
+                for pokeapi_id in remaining
+            )
+        )
+        stale = False
+        for pokeapi_id, (result, fetched_stale) in zip(remaining, fetched):
+            results[pokeapi_id] = result
+            stale = stale or fetched_stale
+        return self.build_batch(pokeapi_ids, results, stale)
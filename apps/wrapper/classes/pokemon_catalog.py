@@ -0,0 +1,202 @@
+import re
+import time
+from itertools import islice
+from typing import Iterator, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from apps.wrapper import models
+from apps.wrapper.classes.catalog_merge import CatalogMerge
+from apps.wrapper.classes.pokemon_api import PokemonApi
+from apps.wrapper.exceptions import UpstreamUnavailable
+
+
+class PokemonCatalog:
+    """
+    A class that keeps the `PokemonCatalogEntry` table in sync with PokeAPI
+    and the local overrides.
+
+    The table holds the id and name of every Pokemon served by the list
+    endpoint, so a list request is answered by the database alone. It is
+    refreshed from PokeAPI by the `sync_pokemon_catalog` command, and
+    `register_override` updates it as soon as a Pokemon is overridden.
+
+    Every write bumps a catalog version kept in the shared cache, which tells
+    the workers to reload what they derived from the table.
+    """
+
+    BATCH_SIZE = 500
+    PAGE_SIZE = 500
+    VERSION_KEY = "pokeapi:catalog:version"
+    URL_ID_REGEX = re.compile(r"/(\d+)/?$")
+
+    def __init__(self):
+        self._pokemon_api = PokemonApi()
+
+    def upstream_entries(self) -> Iterator[Tuple[int, str]]:
+        """
+        Yields every Pokemon of PokeAPI, requesting its index page by page.
+
+        Yields:
+            tuple: The pokeapi_id and the name of the Pokemon, in PokeAPI
+            order.
+
+        Raises:
+            UpstreamUnavailable: If PokeAPI can't be reached or returns no
+                                 Pokemon.
+        """
+        offset = 0
+        count = None
+        while count is None or offset < count:
+            page = self._pokemon_api.get_pokemon_list(self.PAGE_SIZE, offset)
+            results = page.get("results", [])
+            if count is None:
+                count = page.get("count", 0)
+                if not results:
+                    raise UpstreamUnavailable()
+            if not results:
+                return
+            for pokemon in results:
+                match = self.URL_ID_REGEX.search(pokemon["url"])
+                if match:
+                    yield int(match.group(1)), pokemon["name"]
+            offset += len(results)
+
+    @transaction.atomic
+    def sync(self) -> int:
+        """
+        Rebuilds the catalog from PokeAPI and the local overrides.
+
+        The merged entries are streamed from `CatalogMerge` and upserted in
+        batches, then the ones that are neither in PokeAPI nor overridden
+        anymore are deleted.
+
+        Returns:
+            int: The number of entries in the catalog.
+
+        Raises:
+            UpstreamUnavailable: If PokeAPI can't be reached, in which case
+                                 the catalog is left untouched.
+        """
+        overrides = dict(
+            models.Pokemon.objects.values_list("pokeapi_id", "name")
+        )
+        entries = CatalogMerge(overrides).merge(self.upstream_entries())
+        synced = set()
+        while True:
+            batch = [
+                models.PokemonCatalogEntry(
+                    pokeapi_id=pokeapi_id, name=name, is_override=is_override
+                )
+                for pokeapi_id, name, is_override in islice(
+                    entries, self.BATCH_SIZE
+                )
+            ]
+            if not batch:
+                break
+            models.PokemonCatalogEntry.objects.bulk_create(
+                batch,
+                update_conflicts=True,
+                unique_fields=["pokeapi_id"],
+                update_fields=["name", "is_override"],
+            )
+            synced.update(entry.pokeapi_id for entry in batch)
+        removed = list(
+            set(
+                models.PokemonCatalogEntry.objects.values_list(
+                    "pokeapi_id", flat=True
+                )
+            ).difference(synced)
+        )
+        for start in range(0, len(removed), self.BATCH_SIZE):
+            end = start + self.BATCH_SIZE
+            models.PokemonCatalogEntry.objects.filter(
+                pokeapi_id__in=removed[start:end]
+            ).delete()
+        self.changed()
+        return len(synced)
+
+    @classmethod
+    def register_override(cls, pokemon: models.Pokemon) -> None:
+        """
+        Adds or renames the catalog entry of an overridden Pokemon.
+
+        Args:
+            pokemon (Pokemon): The local override.
+        """
+        models.PokemonCatalogEntry.objects.update_or_create(
+            pokeapi_id=pokemon.pokeapi_id,
+            defaults={"name": pokemon.name, "is_override": True},
+        )
+        cls.changed()
+
+    @classmethod
+    def register_overrides(cls, pokemons: list) -> None:
+        """
+        Adds or renames the catalog entries of many overridden Pokemon with a
+        single upsert.
+
+        Args:
+            pokemons (list): The local overrides.
+        """
+        if not pokemons:
+            return
+        models.PokemonCatalogEntry.objects.bulk_create(
+            [
+                models.PokemonCatalogEntry(
+                    pokeapi_id=pokemon.pokeapi_id,
+                    name=pokemon.name,
+                    is_override=True,
+                )
+                for pokemon in pokemons
+            ],
+            update_conflicts=True,
+            unique_fields=["pokeapi_id"],
+            update_fields=["name", "is_override"],
+        )
+        cls.changed()
+
+    @staticmethod
+    def _cache():
+        return caches[settings.POKEAPI["CACHE_ALIAS"]]
+
+    @classmethod
+    def version(cls) -> int:
+        """
+        Returns the catalog version, shared by every worker through the
+        cache.
+
+        Returns:
+            int: The catalog version.
+        """
+        cache = cls._cache()
+        version = cache.get(cls.VERSION_KEY)
+        if version is None:
+            # Seeded from the clock, so a version lost with the cache is
+            # never handed out again
+            cache.add(cls.VERSION_KEY, time.time_ns(), None)
+            version = cache.get(cls.VERSION_KEY)
+        return version
+
+    @classmethod
+    def bump_version(cls) -> None:
+        """
+        Moves the catalog to a new version.
+        """
+        cache = cls._cache()
+        try:
+            cache.incr(cls.VERSION_KEY)
+        except ValueError:
+            cache.add(cls.VERSION_KEY, time.time_ns(), None)
+
+    @classmethod
+    def changed(cls) -> None:
+        """
+        Bumps the catalog version after a write, and again once the write is
+        committed, so a worker that reloaded the catalog in between doesn't
+        keep the uncommitted state.
+        """
+        cls.bump_version()
+        transaction.on_commit(cls.bump_version)
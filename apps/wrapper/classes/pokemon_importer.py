@@ -0,0 +1,240 @@
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+import orjson
+from django.conf import settings
+from django.db import transaction
+from rest_framework.exceptions import ParseError, ValidationError
+from rest_framework.serializers import as_serializer_error
+from rest_framework.settings import api_settings
+
+from apps.wrapper import models
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+from apps.wrapper.serializers import (
+    PokemonSpriteUpdateSerializer,
+    PokemonUpdateSerializer,
+)
+
+
+class PokemonImporter:
+    """
+    A class that upserts Pokemon overrides in bulk, from a JSON array or an
+    NDJSON stream.
+
+    Every item is validated with `PokemonUpdateSerializer`, and the valid ones
+    are written `POKEMON_IMPORT["BATCH_SIZE"]` at a time, each batch in its
+    own transaction with one bulk insert or update per table instead of the
+    queries of a write per Pokemon. Invalid items are reported by their index
+    and don't stop the import.
+
+    As with single writes, an item with the same content hash as the last
+    write of its Pokemon is skipped, and the snapshots, the catalog and the
+    rendered details are kept in sync.
+    """
+
+    MEDIA_TYPE_NDJSON = "application/x-ndjson"
+    SPRITE_FIELDS = list(PokemonSpriteUpdateSerializer.Meta.fields)
+
+    def __init__(self, batch_size: Optional[int] = None):
+        """
+        Initializes the importer.
+
+        Args:
+            batch_size (int): The number of items written per transaction,
+                              `POKEMON_IMPORT["BATCH_SIZE"]` by default.
+        """
+        self.batch_size = batch_size or settings.POKEMON_IMPORT["BATCH_SIZE"]
+        # A single serializer validates every item, as building its fields
+        # costs more than validating one
+        self._serializer = PokemonUpdateSerializer()
+
+    @staticmethod
+    def ndjson(lines: Iterable) -> Iterator:
+        """
+        Parses an NDJSON body line by line, so it is never held in memory as
+        a whole.
+
+        Args:
+            lines (Iterable): The lines of the body, as bytes or str.
+
+        Yields:
+            The item of each line that isn't blank, or a `ParseError` for a
+            line that isn't JSON.
+        """
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError as error:
+                yield ParseError(f"JSON parse error - {error}")
+
+    def run(self, items: Iterable) -> dict:
+        """
+        Validates and writes the given items, batch by batch.
+
+        Args:
+            items (Iterable): The Pokemon to upsert, in the format of the
+                              update endpoint, or `ParseError`s for the ones
+                              that couldn't be parsed.
+
+        Returns:
+            dict: The number of `created`, `updated` and `unchanged` Pokemon,
+                  and the `errors` of the invalid items, by `index`.
+        """
+        report = {"created": 0, "updated": 0, "unchanged": 0, "errors": []}
+        items = enumerate(items)
+        while True:
+            batch = list(islice(items, self.batch_size))
+            if not batch:
+                break
+            # The last item of a Pokemon wins within a batch
+            valid = {}
+            for index, item in batch:
+                data, errors = self.validate(item)
+                if errors:
+                    report["errors"].append({"index": index, "errors": errors})
+                else:
+                    valid[data["pokeapi_id"]] = data
+            for key, count in self.write(list(valid.values())).items():
+                report[key] += count
+        return report
+
+    def validate(self, item) -> tuple:
+        """
+        Validates an item.
+
+        Args:
+            item: The parsed item, or the `ParseError` of its line.
+
+        Returns:
+            tuple: The validated data of the item and None, or None and its
+                   errors.
+        """
+        if isinstance(item, ParseError):
+            return None, {api_settings.NON_FIELD_ERRORS_KEY: [item.detail]}
+        try:
+            return dict(self._serializer.run_validation(item)), None
+        except ValidationError as error:
+            return None, as_serializer_error(error)
+
+    @transaction.atomic
+    def write(self, batch: list) -> dict:
+        """
+        Upserts a batch of validated Pokemon.
+
+        The ability and type slots of the updated Pokemon are replaced rather
+        than diffed, which takes a fixed number of queries for the whole
+        batch.
+
+        Args:
+            batch (list): The validated data of the Pokemon, one per
+                          pokeapi_id.
+
+        Returns:
+            dict: The number of `created`, `updated` and `unchanged` Pokemon.
+        """
+        counts = {"created": 0, "updated": 0, "unchanged": 0}
+        if not batch:
+            return counts
+        existing = {
+            pokemon.pokeapi_id: pokemon
+            for pokemon in models.Pokemon.objects.select_related(
+                "sprites"
+            ).filter(pokeapi_id__in=[data["pokeapi_id"] for data in batch])
+        }
+        written, new_sprites, changed_sprites = [], [], []
+        for data in batch:
+            content_hash = PokemonUpdateSerializer.content_hash(data)
+            pokemon = existing.get(data["pokeapi_id"])
+            if pokemon is None:
+                pokemon = models.Pokemon(pokeapi_id=data["pokeapi_id"])
+                counts["created"] += 1
+            elif (
+                pokemon.content_hash == content_hash
+                and pokemon.snapshot is not None
+            ):
+                counts["unchanged"] += 1
+                continue
+            else:
+                counts["updated"] += 1
+            pokemon.name = data["name"]
+            pokemon.content_hash = content_hash
+            if pokemon.sprites is None:
+                pokemon.sprites = models.PokemonSprite(**data["sprites"])
+                new_sprites.append(pokemon.sprites)
+            elif any(
+                getattr(pokemon.sprites, attr) != value
+                for attr, value in data["sprites"].items()
+            ):
+                for attr, value in data["sprites"].items():
+                    setattr(pokemon.sprites, attr, value)
+                changed_sprites.append(pokemon.sprites)
+            written.append((pokemon, data))
+        if not written:
+            return counts
+
+        models.PokemonSprite.objects.bulk_create(new_sprites)
+        if changed_sprites:
+            models.PokemonSprite.objects.bulk_update(
+                changed_sprites, self.SPRITE_FIELDS
+            )
+        updated = [pokemon for pokemon, _ in written if pokemon.pk]
+        created = [pokemon for pokemon, _ in written if pokemon.pk is None]
+        if updated:
+            models.PokemonAbilitySlot.objects.filter(
+                pokemon__in=updated
+            ).delete()
+            models.PokemonTypeSlot.objects.filter(pokemon__in=updated).delete()
+        models.Pokemon.objects.bulk_create(created)
+        abilities = self.children(
+            models.PokemonAbilitySlot, "abilities", written
+        )
+        types = self.children(models.PokemonTypeSlot, "types", written)
+
+        pokemons = [pokemon for pokemon, _ in written]
+        snapshots = PokemonUpdateSerializer.snapshots([
+            (pokemon, abilities[pokemon.pk], types[pokemon.pk])
+            for pokemon in pokemons
+        ])
+        for pokemon, snapshot in zip(pokemons, snapshots):
+            pokemon.snapshot = snapshot
+        # The created Pokemon were inserted with the rest of their columns
+        models.Pokemon.objects.bulk_update(created, ["snapshot"])
+        models.Pokemon.objects.bulk_update(
+            updated, ["name", "sprites", "content_hash", "snapshot"]
+        )
+        PokemonCatalog.register_overrides(pokemons)
+        for pokemon in pokemons:
+            PokemonUpdateSerializer.rendered(pokemon)
+        return counts
+
+    @staticmethod
+    def children(model, name: str, written: list) -> dict:
+        """
+        Inserts the ability or type slots of written Pokemon with a single
+        insert, after the shared abilities or types they point to.
+
+        Args:
+            model: `PokemonAbilitySlot` or `PokemonTypeSlot`.
+            name (str): The key of the slots in the data, `abilities` or
+                        `types`.
+            written (list): The saved Pokemon, with their validated data.
+
+        Returns:
+            dict: The inserted slots of each Pokemon, by its pk.
+        """
+        slots = iter(
+            PokemonUpdateSerializer.slot_rows(
+                model, [value for _, data in written for value in data[name]]
+            )
+        )
+        rows = {}
+        for pokemon, data in written:
+            rows[pokemon.pk] = [next(slots) for _ in data[name]]
+            for slot in rows[pokemon.pk]:
+                slot.pokemon = pokemon
+        model.objects.bulk_create([
+            slot for pokemon_slots in rows.values() for slot in pokemon_slots
+        ])
+        return rows
@@ -0,0 +1,256 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.wrapper import models
+from apps.wrapper.classes.pokemon_api import PokemonApi
+from apps.wrapper.classes.rate_limiter import RateLimiter
+from apps.wrapper.classes.rendered_cache import RenderedCache
+from apps.wrapper.exceptions import UpstreamUnavailable
+from apps.wrapper.serializers import PokemonSerializer, PokemonUpdateSerializer
+
+
+class PokemonMirror:
+    """
+    A class that mirrors the detail of every Pokemon of the catalog into the
+    `PokemonMirrorEntry` table, so `retrieve` can serve them without PokeAPI.
+
+    A crawl requests the Pokemon whose entry is missing or stale through
+    `PokemonApi`, from a bounded pool of worker threads that share its
+    session, and never faster than `POKEMON_MIRROR["RATE_LIMIT"]` requests
+    per second. Cached PokeAPI responses are revalidated rather than reused,
+    so an entry is as recent as its `fetched_at`. Entries older than
+    `POKEMON_MIRROR["MAX_AGE"]` seconds are stale; a full crawl fetches
+    every entry again.
+
+    Entries are written `POKEMON_MIRROR["BATCH_SIZE"]` at a time, and each
+    crawl is recorded in `PokemonMirrorCrawl` until it fetched every Pokemon
+    it had to. An interrupted or failed crawl is resumed by the next one,
+    which skips the entries fetched since it started.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+    ):
+        """
+        Initializes the mirror.
+
+        Args:
+            concurrency (int): The number of worker threads,
+                               `POKEMON_MIRROR["CONCURRENCY"]` by default.
+            rate_limit (float): The maximum number of requests per second, 0
+                                for no limit, `POKEMON_MIRROR["RATE_LIMIT"]`
+                                by default.
+        """
+        config = settings.POKEMON_MIRROR
+        self.concurrency = concurrency or config["CONCURRENCY"]
+        self._rate_limiter = RateLimiter(
+            config["RATE_LIMIT"] if rate_limit is None else rate_limit
+        )
+        self._rendered_cache = RenderedCache()
+
+    @staticmethod
+    def get(pokeapi_id) -> Optional[dict]:
+        """
+        Reads the mirrored detail of a Pokemon.
+
+        Args:
+            pokeapi_id: The ID of the Pokemon, as found in the URL.
+
+        Returns:
+            dict: The serialized detail, or None if it isn't mirrored.
+        """
+        try:
+            return models.PokemonMirrorEntry.objects.values_list(
+                "detail", flat=True
+            ).get(pokeapi_id=pokeapi_id)
+        except (models.PokemonMirrorEntry.DoesNotExist, ValueError):
+            return None
+
+    @staticmethod
+    def get_many(pokeapi_ids) -> dict:
+        """
+        Reads the mirrored details of many Pokemon with a single query.
+
+        Args:
+            pokeapi_ids (list): The IDs of the Pokemon.
+
+        Returns:
+            dict: The serialized details of the mirrored Pokemon, by ID.
+        """
+        return dict(
+            models.PokemonMirrorEntry.objects.filter(
+                pokeapi_id__in=pokeapi_ids
+            ).values_list("pokeapi_id", "detail")
+        )
+
+    @staticmethod
+    def checkpoint(full: bool) -> models.PokemonMirrorCrawl:
+        """
+        Resumes the unfinished crawl, or starts a new one.
+
+        Args:
+            full (bool): Whether every entry must be fetched again.
+
+        Returns:
+            PokemonMirrorCrawl: The crawl to run.
+        """
+        crawl = (
+            models.PokemonMirrorCrawl.objects.filter(finished_at=None)
+            .order_by("started_at")
+            .first()
+        )
+        if crawl is None:
+            return models.PokemonMirrorCrawl.objects.create(
+                started_at=timezone.now(), full=full
+            )
+        if full and not crawl.full:
+            crawl.full = True
+            crawl.save(update_fields=["full"])
+        return crawl
+
+    @staticmethod
+    def pending(crawl: models.PokemonMirrorCrawl) -> list:
+        """
+        Lists the Pokemon of the catalog a crawl still has to fetch.
+
+        Args:
+            crawl (PokemonMirrorCrawl): The crawl.
+
+        Returns:
+            list: The IDs of the Pokemon, in Pokedex order.
+        """
+        cutoff = crawl.started_at
+        if not crawl.full:
+            cutoff -= timedelta(seconds=settings.POKEMON_MIRROR["MAX_AGE"])
+        fresh = models.PokemonMirrorEntry.objects.filter(
+            fetched_at__gte=cutoff
+        ).values("pokeapi_id")
+        return list(
+            models.PokemonCatalogEntry.objects.exclude(
+                pokeapi_id__in=fresh
+            ).values_list("pokeapi_id", flat=True)
+        )
+
+    def fetch(
+        self, pokeapi_id: int
+    ) -> Tuple[int, str, Optional[dict], Optional[datetime]]:
+        """
+        Requests the detail of a Pokemon from PokeAPI, waiting for the rate
+        limit.
+
+        Args:
+            pokeapi_id (int): The ID of the Pokemon.
+
+        Returns:
+            tuple: The ID, the outcome (`fetched`, `missing` or `failed`),
+                   and the serialized detail and the time PokeAPI returned
+                   it, if it was fetched.
+        """
+        self._rate_limiter.wait()
+        pokemon_api = PokemonApi(revalidate=True)
+        try:
+            data = pokemon_api.get_pokemon_by_id(pokeapi_id)
+        except UpstreamUnavailable:
+            return pokeapi_id, "failed", None, None
+        if pokemon_api.stale:
+            return pokeapi_id, "failed", None, None
+        if not data:
+            return pokeapi_id, "missing", None, None
+        fetched_at = datetime.fromtimestamp(
+            pokemon_api.fetched_at, tz=dt_timezone.utc
+        )
+        return pokeapi_id, "fetched", PokemonSerializer(data).data, fetched_at
+
+    def write(
+        self, details: dict, missing: list, fetched_at: Optional[dict] = None
+    ) -> None:
+        """
+        Upserts fetched entries and deletes the ones PokeAPI doesn't have
+        anymore, dropping the rendered details that changed.
+
+        Args:
+            details (dict): The fetched details, by pokeapi_id.
+            missing (list): The IDs of the Pokemon PokeAPI doesn't have.
+            fetched_at (dict): When PokeAPI returned each detail, by
+                               pokeapi_id. Details without one are stamped
+                               with the current time.
+        """
+        if missing:
+            models.PokemonMirrorEntry.objects.filter(
+                pokeapi_id__in=missing
+            ).delete()
+        for pokeapi_id in missing:
+            self._rendered_cache.delete(pokeapi_id)
+        if not details:
+            return
+        hashes = {
+            pokeapi_id: PokemonUpdateSerializer.content_hash(detail)
+            for pokeapi_id, detail in details.items()
+        }
+        current = dict(
+            models.PokemonMirrorEntry.objects.filter(
+                pokeapi_id__in=list(hashes)
+            ).values_list("pokeapi_id", "content_hash")
+        )
+        fetched_at = fetched_at or {}
+        now = timezone.now()
+        models.PokemonMirrorEntry.objects.bulk_create(
+            [
+                models.PokemonMirrorEntry(
+                    pokeapi_id=pokeapi_id,
+                    detail=detail,
+                    content_hash=hashes[pokeapi_id],
+                    fetched_at=fetched_at.get(pokeapi_id, now),
+                )
+                for pokeapi_id, detail in details.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["pokeapi_id"],
+            update_fields=["detail", "content_hash", "fetched_at"],
+        )
+        for pokeapi_id, key in hashes.items():
+            if current.get(pokeapi_id, key) != key:
+                self._rendered_cache.delete(pokeapi_id)
+
+    def crawl(self, full: bool = False) -> dict:
+        """
+        Fetches the missing and stale entries of the mirror, or every entry
+        with `full`, resuming the unfinished crawl if there is one.
+
+        Args:
+            full (bool): Whether every entry must be fetched again.
+
+        Returns:
+            dict: The number of `pending` Pokemon, and of those `fetched`,
+                  `missing` from PokeAPI and `failed`.
+        """
+        crawl = self.checkpoint(full)
+        pending = self.pending(crawl)
+        report = dict.fromkeys(("fetched", "missing", "failed"), 0)
+        report["pending"] = len(pending)
+        batch_size = settings.POKEMON_MIRROR["BATCH_SIZE"]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for start in range(0, len(pending), batch_size):
+                end = start + batch_size
+                details, missing, fetched = {}, [], {}
+                for pokeapi_id, outcome, detail, fetched_at in executor.map(
+                    self.fetch, pending[start:end]
+                ):
+                    report[outcome] += 1
+                    if outcome == "fetched":
+                        details[pokeapi_id] = detail
+                        fetched[pokeapi_id] = fetched_at
+                    elif outcome == "missing":
+                        missing.append(pokeapi_id)
+                self.write(details, missing, fetched)
+        if not report["failed"]:
+            crawl.finished_at = timezone.now()
+            crawl.save(update_fields=["finished_at"])
+        return report
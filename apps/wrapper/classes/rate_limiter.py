@@ -0,0 +1,37 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    A class that spaces out calls shared by many threads, so they never go
+    faster than a given rate.
+
+    Each call to `wait` reserves the next free slot, `1 / rate` seconds after
+    the previous one, and sleeps until it comes.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Initializes the limiter.
+
+        Args:
+            rate (float): The maximum number of calls per second, 0 for no
+                          limit.
+        """
+        self._interval = 1 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """
+        Blocks until the calling thread may make its call.
+        """
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
@@ -0,0 +1,140 @@
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework.settings import api_settings
+
+from apps.wrapper.classes.tiered_cache import TieredCache
+
+
+class RenderedCache:
+    """
+    A class that caches the rendered bytes of Pokemon details.
+
+    Details are rendered once with the default renderer of the API, when a
+    Pokemon is written locally or fetched from PokeAPI, and served from the
+    cache as they are until the Pokemon is written again. Details of local
+    overrides are kept for `override_timeout` seconds at most, so one
+    rendered from a snapshot read just before a write, and stored just
+    after it, isn't served for longer.
+    """
+
+    KEY_PREFIX = "pokemon:rendered:"
+
+    def __init__(self):
+        self._cache = TieredCache(settings.POKEAPI["CACHE_ALIAS"], "rendered")
+
+    @staticmethod
+    def override_timeout() -> int:
+        """
+        Returns how long the rendered detail of a local override is kept.
+
+        Returns:
+            int: The number of seconds.
+        """
+        return settings.RENDERED_CACHE["OVERRIDE_TTL"]
+
+    @staticmethod
+    def renderer():
+        """
+        Returns the default renderer of the API.
+        """
+        return api_settings.DEFAULT_RENDERER_CLASSES[0]()
+
+    @classmethod
+    def render(cls, data) -> bytes:
+        """
+        Renders data with the default renderer of the API.
+
+        Args:
+            data: The data to render.
+
+        Returns:
+            bytes: The rendered data.
+        """
+        return cls.renderer().render(data)
+
+    def key(self, pokeapi_id) -> Optional[str]:
+        """
+        Builds the cache key of a Pokemon detail.
+
+        Args:
+            pokeapi_id: The ID of the Pokemon, as found in the URL.
+
+        Returns:
+            str: The cache key, or None if the ID isn't numeric.
+        """
+        pokeapi_id = str(pokeapi_id)
+        if not (pokeapi_id.isascii() and pokeapi_id.isdecimal()):
+            return None
+        return f"{self.KEY_PREFIX}detail:{int(pokeapi_id)}"
+
+    def get(self, pokeapi_id) -> Optional[bytes]:
+        """
+        Retrieves the rendered detail of a Pokemon.
+
+        Args:
+            pokeapi_id: The ID of the Pokemon.
+
+        Returns:
+            bytes: The rendered detail, or None if it isn't cached.
+        """
+        key = self.key(pokeapi_id)
+        return None if key is None else self._cache.get(key)
+
+    def set(self, pokeapi_id, content: bytes, timeout: Optional[float]):
+        """
+        Stores the rendered detail of a Pokemon.
+
+        Args:
+            pokeapi_id: The ID of the Pokemon.
+            content (bytes): The rendered detail.
+            timeout (float): The number of seconds it is kept.
+        """
+        key = self.key(pokeapi_id)
+        if key is not None:
+            self._cache.set(key, content, timeout)
+
+    def delete(self, pokeapi_id) -> None:
+        """
+        Drops the rendered detail of a Pokemon.
+
+        Args:
+            pokeapi_id: The ID of the Pokemon.
+        """
+        key = self.key(pokeapi_id)
+        if key is not None:
+            self._cache.delete(key)
+
+    def written(self, pokeapi_id, render) -> None:
+        """
+        Drops the rendered detail of a Pokemon that is being written, and
+        stores the new one once the write is committed.
+
+        Args:
+            pokeapi_id: The ID of the Pokemon.
+            render (Callable): A function that returns the new detail
+                               rendered.
+        """
+        key = self.key(pokeapi_id)
+        if key is None:
+            return
+        self._cache.delete(key)
+        transaction.on_commit(
+            lambda: self._cache.set(key, render(), self.override_timeout())
+        )
+
+    async def aget(self, pokeapi_id) -> Optional[bytes]:
+        """
+        Asynchronous version of `get`.
+        """
+        key = self.key(pokeapi_id)
+        return None if key is None else await self._cache.aget(key)
+
+    async def aset(self, pokeapi_id, content: bytes, timeout):
+        """
+        Asynchronous version of `set`.
+        """
+        key = self.key(pokeapi_id)
+        if key is not None:
+            await self._cache.aset(key, content, timeout)
@@ -0,0 +1,203 @@
+import asyncio
+import copy
+import hashlib
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.wrapper.classes.metrics import Metrics
+
+
+class _Call:
+    """
+    An in-flight call shared by the threads that asked for the same key.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    A class that coalesces concurrent fetches of the same key.
+
+    Inside a process, the first caller of a key becomes the leader and runs
+    the fetch, while the callers that arrive before it finishes wait for its
+    result. Across workers, the leader also holds a lock in the shared cache;
+    a worker that finds the lock taken polls `wait_for` until the other worker
+    publishes the result, instead of fetching it again.
+
+    The number of coalesced callers is counted in `Metrics` as
+    `singleflight.coalesced` (same process) and
+    `singleflight.coalesced_remote` (another worker).
+    """
+
+    KEY_PREFIX = "pokeapi:singleflight:"
+
+    _lock = threading.Lock()
+    _calls = {}
+    _async_calls = {}
+
+    def __init__(self):
+        self._cache = caches[settings.POKEAPI["CACHE_ALIAS"]]
+
+    def lock_key(self, key: str) -> str:
+        """
+        Builds the cache key of the cross-worker lock of a key.
+
+        Args:
+            key (str): The key of the fetch.
+
+        Returns:
+            str: The cache key of the lock.
+        """
+        digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}{digest}"
+
+    def do(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        wait_for: Callable[[], Optional[Any]],
+    ) -> Any:
+        """
+        Runs `fetch` once for all the threads asking for `key`.
+
+        Args:
+            key (str): The key of the fetch, usually an URL.
+            fetch (Callable): The function that fetches the result.
+            wait_for (Callable): A function that returns the result once
+                                 another worker has published it, or None.
+
+        Returns:
+            The result of `fetch`. Waiting callers get a copy of it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.event.wait()
+            Metrics.incr("singleflight.coalesced")
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        Metrics.incr("singleflight.leader")
+        try:
+            call.result = self._do_shared(key, fetch, wait_for)
+            return call.result
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def _do_shared(self, key, fetch, wait_for):
+        """
+        Runs `fetch` unless another worker holds the lock of `key`.
+        """
+        config = settings.POKEAPI
+        lock_key = self.lock_key(key)
+        if self._cache.add(lock_key, 1, config["SINGLE_FLIGHT_LOCK_TIMEOUT"]):
+            try:
+                return fetch()
+            finally:
+                self._cache.delete(lock_key)
+
+        deadline = time.monotonic() + config["SINGLE_FLIGHT_LOCK_TIMEOUT"]
+        while time.monotonic() < deadline:
+            time.sleep(config["SINGLE_FLIGHT_POLL_INTERVAL"])
+            # The lock is released after the result is published
+            released = self._cache.get(lock_key) is None
+            result = wait_for()
+            if result is not None:
+                Metrics.incr("singleflight.coalesced_remote")
+                return result
+            if released:
+                break
+        return fetch()
+
+    async def ado(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        wait_for: Callable[[], Awaitable[Optional[Any]]],
+    ) -> Any:
+        """
+        Asynchronous version of `do`, which coalesces the tasks of the
+        running event loop. If the task that fetches is cancelled, one of
+        the tasks waiting for it fetches instead.
+
+        Args:
+            key (str): The key of the fetch, usually an URL.
+            fetch (Callable): The coroutine function that fetches the result.
+            wait_for (Callable): A coroutine function that returns the result
+                                 once another worker has published it, or
+                                 None.
+
+        Returns:
+            The result of `fetch`. Waiting callers get a copy of it.
+        """
+        loop_key = (id(asyncio.get_running_loop()), key)
+        future = self._async_calls.get(loop_key)
+        if future is not None:
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled, so one of its waiters takes over
+                return await self.ado(key, fetch, wait_for)
+            Metrics.incr("singleflight.coalesced")
+            return copy.deepcopy(result)
+
+        Metrics.incr("singleflight.leader")
+        future = self._async_calls[loop_key] = asyncio.Future()
+        try:
+            result = await self._ado_shared(key, fetch, wait_for)
+            future.set_result(result)
+            return result
+        except Exception as error:
+            future.set_exception(error)
+            # Retrieve the exception, so a future nobody awaited isn't logged
+            future.exception()
+            raise
+        finally:
+            # A cancelled leader cancels the future, see above
+            future.cancel()
+            del self._async_calls[loop_key]
+
+    async def _ado_shared(self, key, fetch, wait_for):
+        """
+        Asynchronous version of `_do_shared`.
+        """
+        config = settings.POKEAPI
+        lock_key = self.lock_key(key)
+        if await self._cache.aadd(
+            lock_key, 1, config["SINGLE_FLIGHT_LOCK_TIMEOUT"]
+        ):
+            try:
+                return await fetch()
+            finally:
+                await self._cache.adelete(lock_key)
+
+        deadline = time.monotonic() + config["SINGLE_FLIGHT_LOCK_TIMEOUT"]
+        while time.monotonic() < deadline:
+            await asyncio.sleep(config["SINGLE_FLIGHT_POLL_INTERVAL"])
+            released = await self._cache.aget(lock_key) is None
+            result = await wait_for()
+            if result is not None:
+                Metrics.incr("singleflight.coalesced_remote")
+                return result
+            if released:
+                break
+        return await fetch()
@@ -0,0 +1,334 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.wrapper.classes.metrics import Metrics
+
+_MISSING = object()
+
+
+class _LruStore:
+    """
+    A process-wide LRU of pickled values, bounded by their total size.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, timeout: float) -> None:
+        with self._lock:
+            self._pop(key)
+            if len(value) > self.max_bytes:
+                return
+            self._entries[key] = (time.monotonic() + timeout, value)
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+
+class TieredCache:
+    """
+    A class that puts a per-process LRU (L1) in front of a shared Django
+    cache backend (L2).
+
+    Reads try L1 first and fall back to L2, copying what they find into L1.
+    L1 is bounded by `TIERED_CACHE["L1_MAX_BYTES"]` bytes of pickled values,
+    evicting the least recently used ones, and keeps entries at most
+    `L1_TIMEOUT` seconds.
+
+    Writes go to both tiers and, for caches created with `broadcast`, append
+    the key to an invalidation log in L2. Every worker reads the log at most
+    every `INVALIDATION_POLL_INTERVAL` seconds and drops the keys written by
+    the others from its L1; if it fell behind by more than
+    `INVALIDATION_LOG_SIZE` writes, it drops its whole L1. Caches whose keys
+    are never rewritten with other values, like versioned ones, don't need
+    to broadcast.
+
+    Hits and misses are counted in `Metrics` as `tiered.<name>.l1.hit`,
+    `tiered.<name>.l1.miss`, `tiered.<name>.l2.hit` and
+    `tiered.<name>.l2.miss`.
+    """
+
+    SEQUENCE_KEY = "tiered:invalidations"
+    LOG_KEY_PREFIX = "tiered:invalidations:"
+
+    _lock = threading.Lock()
+    _l1 = None
+    _sequence = None
+    _polled_at = 0.0
+
+    def __init__(self, alias: str, name: str, broadcast: bool = True):
+        """
+        Initializes the cache.
+
+        Args:
+            alias (str): The alias of the Django cache used as L2.
+            name (str): The name of the cache in the metrics.
+            broadcast (bool): Whether writes invalidate the L1 of the other
+                              workers.
+        """
+        self._l2 = caches[alias]
+        self.name = name
+        self.broadcast = broadcast
+
+    @classmethod
+    def l1(cls) -> _LruStore:
+        """
+        Returns the L1 of this process, creating it on first use.
+
+        Returns:
+            _LruStore: The L1 store.
+        """
+        if cls._l1 is None:
+            with cls._lock:
+                if cls._l1 is None:
+                    cls._l1 = _LruStore(settings.TIERED_CACHE["L1_MAX_BYTES"])
+        return cls._l1
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Drops the L1 of this process and forgets the invalidation log
+        position.
+        """
+        with cls._lock:
+            cls._l1 = None
+            cls._sequence = None
+            cls._polled_at = 0.0
+
+    def _poll_due(self) -> bool:
+        """
+        Checks whether the invalidation log must be read, and claims the
+        read for the calling thread.
+        """
+        interval = settings.TIERED_CACHE["INVALIDATION_POLL_INTERVAL"]
+        with self._lock:
+            if time.monotonic() - self._polled_at < interval:
+                return False
+            TieredCache._polled_at = time.monotonic()
+            return True
+
+    def _log_keys(self, sequence: Optional[int]) -> Optional[list]:
+        """
+        Returns the log keys written since the last read, or None if there
+        are more than the log keeps.
+        """
+        last = TieredCache._sequence
+        if last is None or sequence is None or sequence <= last:
+            return []
+        if sequence - last > settings.TIERED_CACHE["INVALIDATION_LOG_SIZE"]:
+            return None
+        return [
+            f"{self.LOG_KEY_PREFIX}{number}"
+            for number in range(last + 1, sequence + 1)
+        ]
+
+    def _apply_invalidations(
+        self, sequence: Optional[int], log_keys: Optional[list], keys: dict
+    ) -> None:
+        """
+        Drops the invalidated keys from L1, or all of it if some of them may
+        have been missed.
+        """
+        l1 = self.l1()
+        last = TieredCache._sequence
+        if last is not None and (
+            sequence is None
+            or sequence < last
+            or log_keys is None
+            or len(keys) < len(log_keys)
+        ):
+            l1.clear()
+        else:
+            for key in keys.values():
+                l1.delete(key)
+        TieredCache._sequence = sequence
+
+    def _poll(self) -> None:
+        """
+        Reads the invalidation log, if it is due.
+        """
+        if not self._poll_due():
+            return
+        sequence = self._l2.get(self.SEQUENCE_KEY)
+        log_keys = self._log_keys(sequence)
+        keys = self._l2.get_many(log_keys) if log_keys else {}
+        self._apply_invalidations(sequence, log_keys, keys)
+
+    async def _apoll(self) -> None:
+        """
+        Asynchronous version of `_poll`.
+        """
+        if not self._poll_due():
+            return
+        sequence = await self._l2.aget(self.SEQUENCE_KEY)
+        log_keys = self._log_keys(sequence)
+        keys = await self._l2.aget_many(log_keys) if log_keys else {}
+        self._apply_invalidations(sequence, log_keys, keys)
+
+    def _log_timeout(self) -> float:
+        return settings.TIERED_CACHE["INVALIDATION_POLL_INTERVAL"] * 10 + 60
+
+    def _broadcast(self, key: str) -> None:
+        """
+        Appends a key to the invalidation log.
+        """
+        self._l2.add(self.SEQUENCE_KEY, 0, None)
+        sequence = self._l2.incr(self.SEQUENCE_KEY)
+        self._l2.set(
+            f"{self.LOG_KEY_PREFIX}{sequence}", key, self._log_timeout()
+        )
+
+    async def _abroadcast(self, key: str) -> None:
+        """
+        Asynchronous version of `_broadcast`.
+        """
+        await self._l2.aadd(self.SEQUENCE_KEY, 0, None)
+        sequence = await self._l2.aincr(self.SEQUENCE_KEY)
+        await self._l2.aset(
+            f"{self.LOG_KEY_PREFIX}{sequence}", key, self._log_timeout()
+        )
+
+    def _l1_timeout(self, timeout: Optional[float]) -> float:
+        l1_timeout = settings.TIERED_CACHE["L1_TIMEOUT"]
+        return l1_timeout if timeout is None else min(timeout, l1_timeout)
+
+    def _from_l1(self, key: str) -> Any:
+        value = self.l1().get(key)
+        if value is None:
+            Metrics.incr(f"tiered.{self.name}.l1.miss")
+            return _MISSING
+        Metrics.incr(f"tiered.{self.name}.l1.hit")
+        return pickle.loads(value)
+
+    def _from_l2(self, key: str, value: Any, default: Any) -> Any:
+        if value is _MISSING:
+            Metrics.incr(f"tiered.{self.name}.l2.miss")
+            return default
+        Metrics.incr(f"tiered.{self.name}.l2.hit")
+        self.l1().set(key, pickle.dumps(value), self._l1_timeout(None))
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Retrieves a value from L1, or else from L2.
+
+        Args:
+            key (str): The cache key.
+            default: The value returned if the key isn't cached.
+
+        Returns:
+            The cached value, or `default`.
+        """
+        self._poll()
+        value = self._from_l1(key)
+        if value is not _MISSING:
+            return value
+        return self._from_l2(key, self._l2.get(key, _MISSING), default)
+
+    def refresh(self, key: str, default: Any = None) -> Any:
+        """
+        Retrieves a value from L2, replacing the copy of L1. Used when the
+        copy may be older than what another worker has written since.
+
+        Args:
+            key (str): The cache key.
+            default: The value returned if the key isn't cached.
+
+        Returns:
+            The cached value, or `default`.
+        """
+        value = self._l2.get(key, _MISSING)
+        if value is _MISSING:
+            self.l1().delete(key)
+        return self._from_l2(key, value, default)
+
+    def set(self, key: str, value: Any, timeout: Optional[float]) -> None:
+        """
+        Stores a value in both tiers.
+
+        Args:
+            key (str): The cache key.
+            value: The value to store.
+            timeout (float): The number of seconds the value is kept, None to
+                             keep it forever.
+        """
+        self._l2.set(key, value, timeout)
+        if self.broadcast:
+            self._broadcast(key)
+        self.l1().set(key, pickle.dumps(value), self._l1_timeout(timeout))
+
+    def delete(self, key: str) -> None:
+        """
+        Deletes a value from both tiers.
+
+        Args:
+            key (str): The cache key.
+        """
+        self._l2.delete(key)
+        if self.broadcast:
+            self._broadcast(key)
+        self.l1().delete(key)
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        """
+        Asynchronous version of `get`.
+        """
+        await self._apoll()
+        value = self._from_l1(key)
+        if value is not _MISSING:
+            return value
+        value = await self._l2.aget(key, _MISSING)
+        return self._from_l2(key, value, default)
+
+    async def arefresh(self, key: str, default: Any = None) -> Any:
+        """
+        Asynchronous version of `refresh`.
+        """
+        value = await self._l2.aget(key, _MISSING)
+        if value is _MISSING:
+            self.l1().delete(key)
+        return self._from_l2(key, value, default)
+
+    async def aset(self, key: str, value: Any, timeout: Optional[float]):
+        """
+        Asynchronous version of `set`.
+        """
+        await self._l2.aset(key, value, timeout)
+        if self.broadcast:
+            await self._abroadcast(key)
+        self.l1().set(key, pickle.dumps(value), self._l1_timeout(timeout))
@@ -0,0 +1,201 @@
+import hashlib
+import time
+from typing import Optional
+
+from django.conf import settings
+
+from apps.wrapper.classes.tiered_cache import TieredCache
+
+
+class UpstreamCache:
+    """
+    A class that caches PokeAPI responses by endpoint URL.
+
+    Every entry keeps the JSON body together with the `ETag` and
+    `Last-Modified` validators of the response and the time it was fetched
+    or last revalidated. An entry is fresh for the TTL
+    of its resource type; once stale it is kept for `CACHE_STALE_TTL` more
+    seconds, so the next request can revalidate it with a conditional GET
+    and a 304 reply only refreshes its expiry.
+
+    Entries are kept in a `TieredCache`, so hot ones are read from the memory
+    of the worker. A stale entry is read again from the shared cache, since
+    another worker may have refreshed it already.
+    """
+
+    KEY_PREFIX = "pokeapi:upstream:"
+
+    def __init__(self):
+        self._cache = TieredCache(settings.POKEAPI["CACHE_ALIAS"], "upstream")
+
+    def key(self, endpoint: str) -> str:
+        """
+        Builds the cache key of an endpoint.
+
+        Args:
+            endpoint (str): The URL of the endpoint.
+
+        Returns:
+            str: The cache key of the endpoint.
+        """
+        digest = hashlib.md5(endpoint.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}{digest}"
+
+    @staticmethod
+    def is_fresh(entry: dict) -> bool:
+        """
+        Checks whether an entry can be served without asking PokeAPI.
+
+        Args:
+            entry (dict): The cache entry.
+
+        Returns:
+            bool: Whether the entry is still within its TTL.
+        """
+        return entry["expires_at"] > time.time()
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> dict:
+        """
+        Builds the headers that revalidate a stale entry.
+
+        Args:
+            entry (dict): The cache entry, if any.
+
+        Returns:
+            dict: The `If-None-Match`/`If-Modified-Since` headers.
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def build_entry(
+        resource: str, data, etag: str = None, last_modified: str = None
+    ) -> dict:
+        """
+        Builds a cache entry for a resource.
+
+        Args:
+            resource (str): The resource type, a key of `CACHE_TTL`.
+            data: The JSON body of the response.
+            etag (str): The `ETag` header of the response.
+            last_modified (str): The `Last-Modified` header of the response.
+
+        Returns:
+            dict: The cache entry.
+        """
+        ttl = settings.POKEAPI["CACHE_TTL"][resource]
+        fetched_at = time.time()
+        return {
+            "resource": resource,
+            "data": data,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at,
+            "expires_at": fetched_at + ttl,
+        }
+
+    @staticmethod
+    def timeout(entry: dict) -> float:
+        """
+        Returns how long the cache backend must keep an entry.
+
+        Args:
+            entry (dict): The cache entry.
+
+        Returns:
+            float: The number of seconds until the entry is dropped.
+        """
+        return (
+            entry["expires_at"]
+            - time.time()
+            + settings.POKEAPI["CACHE_STALE_TTL"]
+        )
+
+    def revalidated(self, entry: dict) -> dict:
+        """
+        Builds a copy of an entry that PokeAPI reported as not modified.
+
+        Args:
+            entry (dict): The stale cache entry.
+
+        Returns:
+            dict: The entry with a new expiry.
+        """
+        return self.build_entry(
+            entry["resource"],
+            entry["data"],
+            entry["etag"],
+            entry["last_modified"],
+        )
+
+    def get(self, endpoint: str) -> Optional[dict]:
+        """
+        Retrieves the entry of an endpoint, fresh or stale.
+
+        Args:
+            endpoint (str): The URL of the endpoint.
+
+        Returns:
+            dict: The cache entry, or None if there isn't one.
+        """
+        key = self.key(endpoint)
+        entry = self._cache.get(key)
+        if entry and not self.is_fresh(entry):
+            entry = self._cache.refresh(key)
+        return entry
+
+    def set(self, endpoint: str, entry: dict) -> None:
+        """
+        Stores the entry of an endpoint.
+
+        Args:
+            endpoint (str): The URL of the endpoint.
+            entry (dict): The cache entry.
+        """
+        self._cache.set(self.key(endpoint), entry, self.timeout(entry))
+
+    def get_fresh(self, endpoint: str):
+        """
+        Retrieves the JSON body of an endpoint, if its entry is fresh.
+
+        Args:
+            endpoint (str): The URL of the endpoint.
+
+        Returns:
+            The JSON body, or None if there isn't a fresh entry.
+        """
+        entry = self.get(endpoint)
+        if entry and self.is_fresh(entry):
+            return entry["data"]
+        return None
+
+    async def aget(self, endpoint: str) -> Optional[dict]:
+        """
+        Asynchronous version of `get`.
+        """
+        key = self.key(endpoint)
+        entry = await self._cache.aget(key)
+        if entry and not self.is_fresh(entry):
+            entry = await self._cache.arefresh(key)
+        return entry
+
+    async def aset(self, endpoint: str, entry: dict) -> None:
+        """
+        Asynchronous version of `set`.
+        """
+        await self._cache.aset(self.key(endpoint), entry, self.timeout(entry))
+
+    async def aget_fresh(self, endpoint: str):
+        """
+        Asynchronous version of `get_fresh`.
+        """
+        entry = await self.aget(endpoint)
+        if entry and self.is_fresh(entry):
+            return entry["data"]
+        return None
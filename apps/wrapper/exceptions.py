@@ -0,0 +1,13 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class UpstreamUnavailable(APIException):
+    """
+    Raised when PokeAPI can't be reached and there is no cached copy of the
+    requested data to fall back to.
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "PokeAPI is unavailable, try again later."
+    default_code = "upstream_unavailable"
@@ -0,0 +1,71 @@
+import sys
+import time
+
+import orjson
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.wrapper.classes.pokemon_importer import PokemonImporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates or updates Pokemon overrides from a JSON array or an NDJSON"
+        " file, in the format of the update endpoint."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The file to import, - for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=["json", "ndjson"],
+            help=(
+                "The format of the file. Files ending in .ndjson or .jsonl are"
+                " read as NDJSON, and any other as a JSON array."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="The number of Pokemon written per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        output = options["format"] or (
+            "ndjson" if path.endswith((".ndjson", ".jsonl")) else "json"
+        )
+        importer = PokemonImporter(options["batch_size"])
+        try:
+            file = sys.stdin.buffer if path == "-" else open(path, "rb")
+        except OSError as error:
+            raise CommandError(str(error)) from error
+        start = time.perf_counter()
+        with file:
+            if output == "ndjson":
+                report = importer.run(importer.ndjson(file))
+            else:
+                try:
+                    items = orjson.loads(file.read())
+                except orjson.JSONDecodeError as error:
+                    raise CommandError(
+                        f"JSON parse error - {error}"
+                    ) from error
+                if not isinstance(items, list):
+                    raise CommandError("The file isn't a JSON array.")
+                report = importer.run(items)
+        elapsed = time.perf_counter() - start
+
+        for error in report["errors"]:
+            self.stderr.write(
+                f"Item {error['index']}:"
+                f" {orjson.dumps(error['errors']).decode()}"
+            )
+        rows = report["created"] + report["updated"] + report["unchanged"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {rows} Pokemon ({report['created']} created,"
+                f" {report['updated']} updated, {report['unchanged']}"
+                f" unchanged) in {elapsed:.2f}s, {rows / elapsed:.0f} rows/s;"
+                f" {len(report['errors'])} invalid."
+            )
+        )
@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.wrapper import models
+from apps.wrapper.classes.pokemon_mirror import PokemonMirror
+
+
+class Command(BaseCommand):
+    help = (
+        "Mirrors the details of the Pokemon of the catalog from PokeAPI,"
+        " fetching only the missing and stale ones and resuming an"
+        " interrupted crawl."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Fetch every Pokemon again, not only the stale ones.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="The number of concurrent requests to PokeAPI.",
+        )
+        parser.add_argument(
+            "--rate-limit",
+            type=float,
+            help="The maximum number of requests per second, 0 for no limit.",
+        )
+
+    def handle(self, *args, **options):
+        if not models.PokemonCatalogEntry.objects.exists():
+            raise CommandError(
+                "The catalog is empty, run sync_pokemon_catalog first."
+            )
+        mirror = PokemonMirror(options["concurrency"], options["rate_limit"])
+        start = time.perf_counter()
+        report = mirror.crawl(options["full"])
+        elapsed = time.perf_counter() - start
+
+        requests = report["fetched"] + report["missing"] + report["failed"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Mirrored {report['fetched']} of {report['pending']} pending"
+                f" Pokemon ({report['missing']} missing, {report['failed']}"
+                f" failed) in {elapsed:.2f}s,"
+                f" {requests / elapsed if elapsed else 0:.1f} requests/s."
+            )
+        )
+        if report["failed"]:
+            self.stderr.write(
+                self.style.WARNING(
+                    f"{report['failed']} Pokemon couldn't be fetched, run the"
+                    " command again to resume the crawl."
+                )
+            )
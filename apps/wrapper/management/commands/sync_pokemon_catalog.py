@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+from apps.wrapper.exceptions import UpstreamUnavailable
+
+
+class Command(BaseCommand):
+    help = "Refreshes the Pokemon catalog of the list endpoint from PokeAPI."
+
+    def handle(self, *args, **options):
+        try:
+            count = PokemonCatalog().sync()
+        except UpstreamUnavailable as error:
+            raise CommandError(str(error.detail)) from error
+        self.stdout.write(
+            self.style.SUCCESS(f"Synced {count} Pokemon into the catalog.")
+        )
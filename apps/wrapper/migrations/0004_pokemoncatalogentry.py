@@ -0,0 +1,58 @@
+# Generated by Django 4.2.30 on 2026-10-17 18:58
+
+from django.db import migrations, models
+
+
+def seed_overrides(apps, schema_editor):
+    """
+    Adds the existing overrides to the catalog, until the next sync brings in
+    the rest of PokeAPI.
+    """
+    Pokemon = apps.get_model('wrapper', 'Pokemon')
+    PokemonCatalogEntry = apps.get_model('wrapper', 'PokemonCatalogEntry')
+    PokemonCatalogEntry.objects.bulk_create(
+        [
+            PokemonCatalogEntry(
+                pokeapi_id=pokeapi_id, name=name, is_override=True
+            )
+            for pokeapi_id, name in Pokemon.objects.values_list(
+                'pokeapi_id', 'name'
+            )
+        ],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [('wrapper', '0003_remove_pokemon_sprites_pokemon_sprites')]
+
+    operations = [
+        migrations.CreateModel(
+            name='PokemonCatalogEntry',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'pokeapi_id',
+                    models.PositiveIntegerField(
+                        unique=True, verbose_name='Pokedex ID'
+                    ),
+                ),
+                ('name', models.CharField(db_index=True, max_length=255)),
+                ('is_override', models.BooleanField(default=False)),
+            ],
+            options={
+                'verbose_name': 'Pokemon catalog entry',
+                'verbose_name_plural': 'Pokemon catalog entries',
+                'ordering': ('pokeapi_id',),
+            },
+        ),
+        migrations.RunPython(seed_overrides, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-17 19:27
+
+from django.db import migrations, models
+
+SPRITE_FIELDS = (
+    'back_default',
+    'back_female',
+    'back_shiny',
+    'back_shiny_female',
+    'front_default',
+    'front_female',
+    'front_shiny',
+    'front_shiny_female',
+    'other',
+    'versions',
+)
+
+
+def backfill_snapshots(apps, schema_editor):
+    """
+    Serializes the existing overrides as `PokemonSerializer` does.
+    """
+    Pokemon = apps.get_model('wrapper', 'Pokemon')
+    queryset = Pokemon.objects.select_related('sprites').prefetch_related(
+        'abilities', 'types'
+    )
+    pokemons = []
+    for pokemon in queryset.iterator(chunk_size=500):
+        sprites = pokemon.sprites
+        pokemon.snapshot = {
+            'id': pokemon.id,
+            'name': pokemon.name,
+            'abilities': [
+                {
+                    'ability': ability.ability,
+                    'slot': ability.slot,
+                    'is_hidden': ability.is_hidden,
+                }
+                for ability in pokemon.abilities.all()
+            ],
+            'sprites': (
+                {name: getattr(sprites, name) for name in SPRITE_FIELDS}
+                if sprites
+                else None
+            ),
+            'types': [
+                {'slot': type.slot, 'type': type.type}
+                for type in pokemon.types.all()
+            ],
+        }
+        pokemons.append(pokemon)
+    Pokemon.objects.bulk_update(pokemons, ['snapshot'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [('wrapper', '0004_pokemoncatalogentry')]
+
+    operations = [
+        migrations.AddField(
+            model_name='pokemon',
+            name='snapshot',
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+# Generated by Django 4.2.30 on 2026-10-17 19:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [('wrapper', '0005_pokemon_snapshot')]
+
+    operations = [
+        migrations.AddField(
+            model_name='pokemon',
+            name='content_hash',
+            field=models.CharField(default='', editable=False, max_length=64),
+        )
+    ]
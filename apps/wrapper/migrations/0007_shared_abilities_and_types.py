@@ -0,0 +1,94 @@
+# Generated by Django 4.2.30 on 2026-10-17 20:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [('wrapper', '0006_pokemon_content_hash')]
+
+    operations = [
+        migrations.CreateModel(
+            name='PokemonAbilitySlot',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('slot', models.PositiveIntegerField(null=True)),
+                ('is_hidden', models.BooleanField(default=False)),
+                (
+                    'pokemon',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='ability_slots',
+                        to='wrapper.pokemon',
+                    ),
+                ),
+                (
+                    'pokemon_ability',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='slots',
+                        to='wrapper.pokemonability',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Pokemon ability slot',
+                'verbose_name_plural': 'Pokemon ability slots',
+                'ordering': ('id',),
+            },
+        ),
+        migrations.CreateModel(
+            name='PokemonTypeSlot',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('slot', models.PositiveIntegerField(null=True)),
+                (
+                    'pokemon',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='type_slots',
+                        to='wrapper.pokemon',
+                    ),
+                ),
+                (
+                    'pokemon_type',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='slots',
+                        to='wrapper.pokemontype',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Pokemon type slot',
+                'verbose_name_plural': 'Pokemon type slots',
+                'ordering': ('id',),
+            },
+        ),
+        migrations.AddField(
+            model_name='pokemonability',
+            name='content_hash',
+            field=models.CharField(max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='pokemontype',
+            name='content_hash',
+            field=models.CharField(max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,118 @@
+# Generated by Django 4.2.30 on 2026-10-17 20:05
+
+import hashlib
+import json
+
+from django.db import migrations
+
+# The shared model, its value, the slot model, the foreign key of the slot,
+# the fields moved to the slot and the relation of `Pokemon`
+RELATIONS = (
+    (
+        'PokemonAbility',
+        'ability',
+        'PokemonAbilitySlot',
+        'pokemon_ability',
+        ('slot', 'is_hidden'),
+        'abilities',
+    ),
+    (
+        'PokemonType',
+        'type',
+        'PokemonTypeSlot',
+        'pokemon_type',
+        ('slot',),
+        'types',
+    ),
+)
+
+
+def content_hash(value):
+    """
+    Hashes a value as `PokemonUpdateSerializer.content_hash` does.
+    """
+    content = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def share_rows(apps, schema_editor):
+    """
+    Keeps one ability or type per value, and moves the slots of the Pokemon
+    to the slot tables.
+    """
+    Pokemon = apps.get_model('wrapper', 'Pokemon')
+    for name, value, slot_name, foreign_key, moved, relation in RELATIONS:
+        Shared = apps.get_model('wrapper', name)
+        Slot = apps.get_model('wrapper', slot_name)
+        field = Pokemon._meta.get_field(relation)
+        Through = field.remote_field.through
+        shared, moved_values, kept = {}, {}, []
+        for row in Shared.objects.order_by('id').iterator(chunk_size=500):
+            key = content_hash(getattr(row, value))
+            if key not in shared:
+                shared[key] = row.id
+                row.content_hash = key
+                kept.append(row)
+            moved_values[row.id] = (
+                shared[key],
+                {attr: getattr(row, attr) for attr in moved},
+            )
+        Shared.objects.bulk_update(kept, ['content_hash'], batch_size=500)
+        slots = []
+        for link in Through.objects.order_by('id').iterator(chunk_size=500):
+            shared_id, attrs = moved_values[
+                getattr(link, field.m2m_reverse_name())
+            ]
+            slots.append(
+                Slot(
+                    pokemon_id=link.pokemon_id,
+                    **{f'{foreign_key}_id': shared_id},
+                    **attrs,
+                )
+            )
+        Slot.objects.bulk_create(slots, batch_size=500)
+        Shared.objects.filter(content_hash__isnull=True).delete()
+
+
+def copy_rows(apps, schema_editor):
+    """
+    Gives each Pokemon its own copy of its abilities and types again.
+    """
+    Pokemon = apps.get_model('wrapper', 'Pokemon')
+    for name, value, slot_name, foreign_key, moved, relation in RELATIONS:
+        Shared = apps.get_model('wrapper', name)
+        Slot = apps.get_model('wrapper', slot_name)
+        field = Pokemon._meta.get_field(relation)
+        Through = field.remote_field.through
+        slots = list(Slot.objects.select_related(foreign_key).order_by('id'))
+        copies = Shared.objects.bulk_create(
+            [
+                Shared(
+                    **{value: getattr(getattr(slot, foreign_key), value)},
+                    **{attr: getattr(slot, attr) for attr in moved},
+                )
+                for slot in slots
+            ],
+            batch_size=500,
+        )
+        Through.objects.bulk_create(
+            [
+                Through(
+                    pokemon_id=slot.pokemon_id,
+                    **{field.m2m_reverse_name(): copy.id},
+                )
+                for slot, copy in zip(slots, copies)
+            ],
+            batch_size=500,
+        )
+        Slot.objects.all().delete()
+        Shared.objects.filter(content_hash__isnull=False).delete()
+
+
+class Migration(migrations.Migration):
+    # The rows are moved in a migration of their own, so the foreign key
+    # checks deferred by the moves run when it commits, before 0009 alters
+    # the tables
+    dependencies = [('wrapper', '0007_shared_abilities_and_types')]
+
+    operations = [migrations.RunPython(share_rows, copy_rows)]
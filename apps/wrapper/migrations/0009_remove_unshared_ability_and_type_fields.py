@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-17 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [('wrapper', '0008_share_ability_and_type_rows')]
+
+    operations = [
+        migrations.RemoveField(model_name='pokemon', name='abilities'),
+        migrations.RemoveField(model_name='pokemon', name='types'),
+        migrations.RemoveField(model_name='pokemonability', name='slot'),
+        migrations.RemoveField(model_name='pokemonability', name='is_hidden'),
+        migrations.RemoveField(model_name='pokemontype', name='slot'),
+        migrations.AlterField(
+            model_name='pokemonability',
+            name='content_hash',
+            field=models.CharField(max_length=64, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='pokemontype',
+            name='content_hash',
+            field=models.CharField(max_length=64, unique=True),
+        ),
+        migrations.AddField(
+            model_name='pokemon',
+            name='abilities',
+            field=models.ManyToManyField(
+                through='wrapper.PokemonAbilitySlot', to='wrapper.pokemonability'
+            ),
+        ),
+        migrations.AddField(
+            model_name='pokemon',
+            name='types',
+            field=models.ManyToManyField(
+                through='wrapper.PokemonTypeSlot', to='wrapper.pokemontype'
+            ),
+        ),
+    ]
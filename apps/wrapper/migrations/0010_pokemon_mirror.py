@@ -0,0 +1,61 @@
+# Generated by Django 4.2.30 on 2026-10-17 19:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('wrapper', '0009_remove_unshared_ability_and_type_fields')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PokemonMirrorCrawl',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('started_at', models.DateTimeField()),
+                ('finished_at', models.DateTimeField(null=True)),
+                ('full', models.BooleanField(default=False)),
+            ],
+            options={
+                'verbose_name': 'Pokemon mirror crawl',
+                'verbose_name_plural': 'Pokemon mirror crawls',
+            },
+        ),
+        migrations.CreateModel(
+            name='PokemonMirrorEntry',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'pokeapi_id',
+                    models.PositiveIntegerField(
+                        unique=True, verbose_name='Pokedex ID'
+                    ),
+                ),
+                ('detail', models.JSONField()),
+                ('content_hash', models.CharField(max_length=64)),
+                ('fetched_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Pokemon mirror entry',
+                'verbose_name_plural': 'Pokemon mirror entries',
+                'ordering': ('pokeapi_id',),
+            },
+        ),
+    ]
@@ -3,15 +3,18 @@ from django.db import models
 
 class PokemonAbility(models.Model):
     """
-    Model representing a Pokemon's ability.
+    Model representing an ability, shared by every Pokemon that has it.
     """
 
     ability = models.JSONField(default=list)
-    slot = models.PositiveIntegerField(null=True)
-    is_hidden = models.BooleanField(default=False)
+    # The hash of `ability`, so each ability is stored once
+    content_hash = models.CharField(max_length=64, unique=True)
 
     def __str__(self) -> str:
-        return "Pokemon ability " + str(self.slot if self.slot else "")
+        name = (
+            self.ability.get("name") if isinstance(self.ability, dict) else ""
+        )
+        return "Pokemon ability " + str(name or "")
 
     class Meta:
         verbose_name = "Pokemon ability"
@@ -41,14 +44,16 @@ class PokemonSprite(models.Model):
 
 class PokemonType(models.Model):
     """
-    Model representing a Pokemon's type.
+    Model representing a type, shared by every Pokemon that has it.
     """
 
-    slot = models.PositiveIntegerField(null=True)
     type = models.JSONField(default=dict)
+    # The hash of `type`, so each type is stored once
+    content_hash = models.CharField(max_length=64, unique=True)
 
     def __str__(self) -> str:
-        return "Pokemon type " + str(self.slot if self.slot else "")
+        name = self.type.get("name") if isinstance(self.type, dict) else ""
+        return "Pokemon type " + str(name or "")
 
     class Meta:
         verbose_name = "Pokemon type"
@@ -64,11 +69,19 @@ class Pokemon(models.Model):
         db_index=True, verbose_name="Pokedex ID"
     )
     name = models.CharField(max_length=255)
-    abilities = models.ManyToManyField(PokemonAbility)
+    abilities = models.ManyToManyField(
+        PokemonAbility, through="PokemonAbilitySlot"
+    )
     sprites = models.ForeignKey(
         PokemonSprite, on_delete=models.CASCADE, null=True
     )
-    types = models.ManyToManyField(PokemonType)
+    types = models.ManyToManyField(PokemonType, through="PokemonTypeSlot")
+    # The serialized detail, kept in sync by `PokemonUpdateSerializer`, so a
+    # detail is read from a single row
+    snapshot = models.JSONField(null=True, editable=False)
+    # The hash of the data of the last write, to skip writes that don't
+    # change anything
+    content_hash = models.CharField(max_length=64, editable=False, default="")
 
     def __str__(self) -> str:
         return self.name
@@ -76,3 +89,136 @@ class Pokemon(models.Model):
     class Meta:
         verbose_name = "Pokemon"
         verbose_name_plural = "Pokemons"
+
+
+class PokemonAbilitySlotManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related("pokemon_ability")
+
+
+class PokemonAbilitySlot(models.Model):
+    """
+    Model representing an ability of a Pokemon, in its slot.
+    """
+
+    pokemon = models.ForeignKey(
+        Pokemon, on_delete=models.CASCADE, related_name="ability_slots"
+    )
+    pokemon_ability = models.ForeignKey(
+        PokemonAbility, on_delete=models.PROTECT, related_name="slots"
+    )
+    slot = models.PositiveIntegerField(null=True)
+    is_hidden = models.BooleanField(default=False)
+
+    # The shared ability is joined, as `ability` reads it
+    objects = PokemonAbilitySlotManager()
+
+    @property
+    def ability(self):
+        return self.pokemon_ability.ability
+
+    def __str__(self) -> str:
+        return "Pokemon ability " + str(self.slot if self.slot else "")
+
+    class Meta:
+        ordering = ("id",)
+        verbose_name = "Pokemon ability slot"
+        verbose_name_plural = "Pokemon ability slots"
+
+
+class PokemonTypeSlotManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related("pokemon_type")
+
+
+class PokemonTypeSlot(models.Model):
+    """
+    Model representing a type of a Pokemon, in its slot.
+    """
+
+    pokemon = models.ForeignKey(
+        Pokemon, on_delete=models.CASCADE, related_name="type_slots"
+    )
+    pokemon_type = models.ForeignKey(
+        PokemonType, on_delete=models.PROTECT, related_name="slots"
+    )
+    slot = models.PositiveIntegerField(null=True)
+
+    # The shared type is joined, as `type` reads it
+    objects = PokemonTypeSlotManager()
+
+    @property
+    def type(self):
+        return self.pokemon_type.type
+
+    def __str__(self) -> str:
+        return "Pokemon type " + str(self.slot if self.slot else "")
+
+    class Meta:
+        ordering = ("id",)
+        verbose_name = "Pokemon type slot"
+        verbose_name_plural = "Pokemon type slots"
+
+
+class PokemonCatalogEntry(models.Model):
+    """
+    Model representing a Pokemon of the list endpoint: every Pokemon of
+    PokeAPI merged with the local overrides.
+    """
+
+    pokeapi_id = models.PositiveIntegerField(
+        unique=True, verbose_name="Pokedex ID"
+    )
+    name = models.CharField(max_length=255, db_index=True)
+    is_override = models.BooleanField(default=False)
+
+    def __str__(self) -> str:
+        return self.name
+
+    class Meta:
+        ordering = ("pokeapi_id",)
+        verbose_name = "Pokemon catalog entry"
+        verbose_name_plural = "Pokemon catalog entries"
+
+
+class PokemonMirrorEntry(models.Model):
+    """
+    Model representing the detail of a PokeAPI Pokemon, mirrored locally so
+    it can be served without PokeAPI.
+    """
+
+    pokeapi_id = models.PositiveIntegerField(
+        unique=True, verbose_name="Pokedex ID"
+    )
+    # The detail as `PokemonSerializer` serializes it
+    detail = models.JSONField()
+    content_hash = models.CharField(max_length=64)
+    fetched_at = models.DateTimeField(db_index=True)
+
+    def __str__(self) -> str:
+        return str(self.detail.get("name", self.pokeapi_id))
+
+    class Meta:
+        ordering = ("pokeapi_id",)
+        verbose_name = "Pokemon mirror entry"
+        verbose_name_plural = "Pokemon mirror entries"
+
+
+class PokemonMirrorCrawl(models.Model):
+    """
+    Model representing a crawl of the Pokemon mirror. An unfinished crawl is
+    resumed by the next one.
+    """
+
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True)
+    # Whether every entry fetched before `started_at` is crawled again, or
+    # only the missing and stale ones
+    full = models.BooleanField(default=False)
+
+    def __str__(self) -> str:
+        return f"Pokemon mirror crawl of {self.started_at}"
+
+    class Meta:
+        verbose_name = "Pokemon mirror crawl"
+        verbose_name_plural = "Pokemon mirror crawls"
@@ -0,0 +1,49 @@
+import io
+import re
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from apps.wrapper.renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """
+    A JSON parser that decodes with orjson.
+
+    orjson only reads UTF-8 and always rejects `NaN` and `Infinity`, so any
+    other encoding, or a non strict `STRICT_JSON` setting, is parsed by
+    `JSONParser`. So are bodies with integers of 19 digits or more, which
+    orjson may read as floats when they don't fit in 64 bits.
+    """
+
+    renderer_class = ORJSONRenderer
+    LONG_NUMBER = re.compile(rb"[0-9]{19}")
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as JSON and returns the resulting data.
+
+        Args:
+            stream: The request body.
+            media_type (str): The media type of the body.
+            parser_context (dict): The context of the view.
+
+        Returns:
+            The parsed data.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if not self.strict or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        content = stream.read()
+        if self.LONG_NUMBER.search(content):
+            return super().parse(
+                io.BytesIO(content), media_type, parser_context
+            )
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
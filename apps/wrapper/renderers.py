@@ -0,0 +1,59 @@
+import re
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    A JSON renderer that encodes with orjson.
+
+    Its output is the same bytes as `JSONRenderer` with the default
+    `COMPACT_JSON` and `UNICODE_JSON` settings: objects the encoder of DRF
+    handles differently from orjson, such as dates, are still passed to it,
+    and U+2028/U+2029 are escaped. Anything else, an indented response, data
+    orjson can't encode or floats below 1e-4 or from 1e16 on, which orjson
+    writes in another notation, is rendered by `JSONRenderer`.
+
+    The one difference left is that NaN and infinities, which `JSONRenderer`
+    refuses to render, are rendered as `null`.
+    """
+
+    OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    # Floats orjson writes as 1e-7 or 0.00001, and json as 1e-07 or 1e-05
+    OTHER_NOTATION = re.compile(
+        rb"[0-9]e-?[0-9]+(?:[,}\]]|$)|(?:^|[-:,\[])0\.0000"
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renders `data` into JSON, returning a bytestring.
+
+        Args:
+            data: The data to render.
+            accepted_media_type (str): The media type the client accepted.
+            renderer_context (dict): The context of the view.
+
+        Returns:
+            bytes: The rendered data.
+        """
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.OTHER_NOTATION.search(content):
+            return super().render(data, accepted_media_type, renderer_context)
+        if b"\xe2\x80\xa8" in content or b"\xe2\x80\xa9" in content:
+            content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return content
@@ -0,0 +1,62 @@
+import json
+
+from rest_framework.response import Response
+
+
+class RenderedResponse(Response):
+    """
+    A DRF response whose body was rendered ahead of time, so neither a
+    serializer nor a renderer runs when it is returned.
+
+    `data` is only parsed back from the body if something reads it. The body
+    sent can be an encoded version of the rendered one, such as a compressed
+    variant.
+    """
+
+    def __init__(
+        self,
+        content: bytes,
+        content_type: str = "application/json",
+        status=None,
+        headers=None,
+        body: bytes = None,
+    ):
+        """
+        Initializes the response with its rendered body.
+
+        Args:
+            content (bytes): The rendered body.
+            content_type (str): The media type of the body.
+            status (int): The status code of the response.
+            headers (dict): Extra headers of the response.
+            body (bytes): The body to send, if it isn't `content`.
+        """
+        self._content_bytes = content
+        self._body = content if body is None else body
+        super().__init__(
+            data=None,
+            status=status,
+            headers=headers,
+            content_type=content_type,
+        )
+
+    @property
+    def data(self):
+        """
+        Returns the data of the body, parsing it on first access.
+        """
+        if self._data is None:
+            self._data = json.loads(self._content_bytes)
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    @property
+    def rendered_content(self) -> bytes:
+        """
+        Returns the body rendered ahead of time.
+        """
+        self["Content-Type"] = self.content_type
+        return self._body
@@ -1,7 +1,13 @@
+import hashlib
+import json
+from collections import defaultdict
+
 from django.db import transaction
 from rest_framework import serializers
 
 from apps.wrapper import models
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+from apps.wrapper.classes.rendered_cache import RenderedCache
 
 
 class PokemonListSerializer(serializers.Serializer):
@@ -44,12 +50,12 @@ class PokemonAbilityUpdateSerializer(
     Serializer for updating a Pokemon's ability.
 
     This serializer extends the `PokemonAbilitySerializer` to allow updates
-    to the PokemonAbility model. It inherits fields and validation from
+    to the PokemonAbilitySlot model. It inherits fields and validation from
     the base class and links them to the model for database updates.
     """
 
     class Meta:
-        model = models.PokemonAbility
+        model = models.PokemonAbilitySlot
         fields = ("ability", "slot", "is_hidden")
 
 
@@ -138,12 +144,12 @@ class PokemonTypeUpdateSerializer(
     Serializer for updating a Pokemon's type.
 
     This serializer extends the `PokemonTypeSerializer` to allow updates
-    to the PokemonType model. It inherits fields and validation from
+    to the PokemonTypeSlot model. It inherits fields and validation from
     the base class and links them to the model for database updates.
     """
 
     class Meta:
-        model = models.PokemonType
+        model = models.PokemonTypeSlot
         fields = ("slot", "type")
 
 
@@ -172,14 +178,252 @@ class PokemonUpdateSerializer(serializers.ModelSerializer):
     sprites = PokemonSpriteUpdateSerializer()
     types = PokemonTypeUpdateSerializer(many=True)
 
+    # The foreign key of the slots of each relation to their shared row, and
+    # the key of its value
+    SHARED_FIELDS = {
+        models.PokemonAbilitySlot: ("pokemon_ability", "ability"),
+        models.PokemonTypeSlot: ("pokemon_type", "type"),
+    }
+
     class Meta:
         model = models.Pokemon
         fields = ("id", "name", "abilities", "sprites", "types")
 
+    @staticmethod
+    def rendered(pokemon) -> None:
+        """
+        Replaces the rendered detail of a Pokemon, from its snapshot, once
+        it is written.
+
+        Args:
+            pokemon (Pokemon): The written Pokemon instance.
+        """
+        RenderedCache().written(
+            pokemon.pokeapi_id, lambda: RenderedCache.render(pokemon.snapshot)
+        )
+
+    @staticmethod
+    def content_hash(validated_data: dict) -> str:
+        """
+        Hashes the validated data of a Pokemon, so a write that doesn't change
+        anything can be told apart without reading its relations.
+
+        Args:
+            validated_data (dict): The validated data of the Pokemon.
+
+        Returns:
+            str: The SHA-256 digest of the data.
+        """
+        content = json.dumps(validated_data, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def shared_rows(cls, model, field: str, values: list) -> dict:
+        """
+        Returns the shared abilities or types of the given values, inserting
+        the ones that aren't stored yet.
+
+        Rows are addressed by the hash of their value, so the values that are
+        already stored take a single query.
+
+        Args:
+            model: `PokemonAbility` or `PokemonType`.
+            field (str): The field of the value, `ability` or `type`.
+            values (list): The values of the rows.
+
+        Returns:
+            dict: The rows, by the content hash of their value.
+        """
+        values = {cls.content_hash(value): value for value in values}
+        if not values:
+            return {}
+        rows = model.objects.in_bulk(list(values), field_name="content_hash")
+        missing = [key for key in values if key not in rows]
+        if missing:
+            # Rows inserted by a concurrent write are read back below
+            model.objects.bulk_create(
+                [
+                    model(**{field: values[key], "content_hash": key})
+                    for key in missing
+                ],
+                ignore_conflicts=True,
+            )
+            rows.update(
+                model.objects.in_bulk(missing, field_name="content_hash")
+            )
+        return rows
+
+    @classmethod
+    def slot_rows(cls, model, values: list) -> list:
+        """
+        Builds the slots of the given validated values, with their shared
+        abilities or types.
+
+        Args:
+            model: `PokemonAbilitySlot` or `PokemonTypeSlot`.
+            values (list): The validated data of the slots.
+
+        Returns:
+            list: The unsaved slots, in the order of `values`.
+        """
+        field_name, name = cls.SHARED_FIELDS[model]
+        field = model._meta.get_field(field_name)
+        rows = cls.shared_rows(
+            field.related_model, name, [value[name] for value in values]
+        )
+        slots = []
+        for value in values:
+            attrs = {key: item for key, item in value.items() if key != name}
+            attrs[field.name] = rows[cls.content_hash(value[name])]
+            slots.append(model(**attrs))
+        return slots
+
+    @classmethod
+    def sync_children(cls, manager, values: list) -> list:
+        """
+        Makes the ability or type slots of a Pokemon match the given values.
+
+        Slots whose values are already there are kept, the missing ones are
+        inserted with a single insert, pointing to the shared abilities or
+        types of their values, and the rest are deleted.
+
+        Args:
+            manager: The `ability_slots` or `type_slots` manager of the
+                     Pokemon.
+            values (list): The validated data of the slots.
+
+        Returns:
+            list: The slots, in the order of `values`.
+        """
+
+        def key(row: dict) -> str:
+            return json.dumps(row, sort_keys=True, default=str)
+
+        fields = list(values[0]) if values else []
+        current = defaultdict(list)
+        for row in manager.all():
+            values_of_row = {field: getattr(row, field) for field in fields}
+            current[key(values_of_row)].append(row)
+        rows, new = [], []
+        for value in values:
+            matches = current.get(key(value))
+            if matches:
+                rows.append(matches.pop())
+            else:
+                rows.append(None)
+                new.append(value)
+        stale = [row.pk for matches in current.values() for row in matches]
+        if stale:
+            manager.model.objects.filter(pk__in=stale).delete()
+        if new:
+            slots = iter(cls.add_children(manager, new))
+            rows = [row or next(slots) for row in rows]
+        return rows
+
+    @classmethod
+    def add_children(cls, manager, values: list) -> list:
+        """
+        Inserts ability or type slots of a Pokemon with a single insert.
+
+        Args:
+            manager: The `ability_slots` or `type_slots` manager of the
+                     Pokemon.
+            values (list): The validated data of the slots.
+
+        Returns:
+            list: The inserted slots, in the order of `values`.
+        """
+        slots = cls.slot_rows(manager.model, values)
+        for slot in slots:
+            slot.pokemon = manager.instance
+        return manager.model.objects.bulk_create(slots)
+
+    @classmethod
+    def snapshot(cls, pokemon, abilities: list, types: list) -> dict:
+        """
+        Serializes the detail of a Pokemon from the objects just written,
+        instead of reading them back.
+
+        Args:
+            pokemon (Pokemon): The written Pokemon instance.
+            abilities (list): Its abilities.
+            types (list): Its types.
+
+        Returns:
+            dict: The serialized detail.
+        """
+        return cls.snapshots([(pokemon, abilities, types)])[0]
+
+    @classmethod
+    def serialize(cls, pokemon) -> dict:
+        """
+        Serializes the detail of a Pokemon from its relations, as its
+        snapshot holds it.
+
+        Args:
+            pokemon (Pokemon): The Pokemon instance, ideally with its sprites
+                               joined and its slots prefetched.
+
+        Returns:
+            dict: The serialized detail.
+        """
+        return cls.snapshot(
+            pokemon,
+            list(pokemon.ability_slots.all()),
+            list(pokemon.type_slots.all()),
+        )
+
+    @staticmethod
+    def snapshots(written: list) -> list:
+        """
+        Serializes the details of many Pokemon with a single serializer.
+
+        Abilities and types are listed by slot, so a detail doesn't depend on
+        the order they were written in.
+
+        Args:
+            written (list): The written Pokemon instances, each with its
+                            abilities and types.
+
+        Returns:
+            list: The serialized details, in the same order.
+        """
+
+        def by_slot(slots: list) -> list:
+            return sorted(
+                slots,
+                key=lambda row: (row.slot is None, row.slot or 0, row.pk or 0),
+            )
+
+        return PokemonSerializer(
+            [
+                {
+                    "id": pokemon.id,
+                    "name": pokemon.name,
+                    "abilities": by_slot(abilities),
+                    "sprites": pokemon.sprites,
+                    "types": by_slot(types),
+                }
+                for pokemon, abilities, types in written
+            ],
+            many=True,
+        ).data
+
+    def to_representation(self, instance):
+        """
+        Serializes a Pokemon from its snapshot, or from its relations when it
+        has none.
+        """
+        snapshot = getattr(instance, "snapshot", None)
+        if snapshot is None:
+            snapshot = self.serialize(instance)
+        return {**snapshot, "id": instance.pokeapi_id}
+
     @transaction.atomic
     def create(self, validated_data):
         """
-        Creates a new Pokemon instance in the database.
+        Creates a new Pokemon instance in the database, with the snapshot of
+        its detail, and adds it to the catalog of the list endpoint.
 
         Args:
             validated_data (dict): A dictionary containing the validated data
@@ -194,25 +438,34 @@ class PokemonUpdateSerializer(serializers.ModelSerializer):
         Returns:
             Pokemon: The newly created Pokemon instance.
         """
+        content_hash = self.content_hash(validated_data)
         abilities = validated_data.pop("abilities")
         sprites = validated_data.pop("sprites")
         types = validated_data.pop("types")
-        pokemon = models.Pokemon.objects.create(**validated_data)
-        for ability in abilities:
-            ability_model = models.PokemonAbility.objects.create(**ability)
-            pokemon.abilities.add(ability_model)
-        for type in types:
-            type_model = models.PokemonType.objects.create(**type)
-            pokemon.types.add(type_model)
-        sprite_model = models.PokemonSprite.objects.create(**sprites)
-        pokemon.sprites = sprite_model
-        pokemon.save()
+        validated_data["sprites"] = models.PokemonSprite.objects.create(
+            **sprites
+        )
+        pokemon = models.Pokemon.objects.create(
+            content_hash=content_hash, **validated_data
+        )
+        abilities = self.add_children(pokemon.ability_slots, abilities)
+        types = self.add_children(pokemon.type_slots, types)
+        pokemon.snapshot = self.snapshot(pokemon, abilities, types)
+        pokemon.save(update_fields=["snapshot"])
+        PokemonCatalog.register_override(pokemon)
+        self.rendered(pokemon)
         return pokemon
 
     @transaction.atomic
     def update(self, instance, validated_data):
         """
-        Updates an instance of a Pokemon with the given validated data.
+        Updates an instance of a Pokemon and the snapshot of its detail with
+        the given validated data, and renames its entry in the catalog of the
+        list endpoint.
+
+        Only what changed is written: unchanged abilities, types and sprites
+        are kept, and data with the same content hash as the last write
+        doesn't write anything.
 
         Args:
             instance (Pokemon): The Pokemon instance to be updated.
@@ -225,19 +478,36 @@ class PokemonUpdateSerializer(serializers.ModelSerializer):
         Raises:
             None
         """
-        abilities = validated_data.pop("abilities")
+        content_hash = self.content_hash(validated_data)
+        if (
+            content_hash == instance.content_hash
+            and instance.snapshot is not None
+        ):
+            return instance
+        abilities = self.sync_children(
+            instance.ability_slots, validated_data.pop("abilities")
+        )
+        types = self.sync_children(
+            instance.type_slots, validated_data.pop("types")
+        )
         sprites = validated_data.pop("sprites")
-        types = validated_data.pop("types")
-        instance.abilities.all().delete()
-        instance.types.all().delete()
-        instance.sprites.delete()
-        for ability in abilities:
-            ability_model = models.PokemonAbility.objects.create(**ability)
-            instance.abilities.add(ability_model)
-        for type in types:
-            type_model = models.PokemonType.objects.create(**type)
-            instance.types.add(type_model)
-        sprite_model = models.PokemonSprite.objects.create(**sprites)
-        instance.sprites = sprite_model
+        if instance.sprites is None:
+            instance.sprites = models.PokemonSprite.objects.create(**sprites)
+        else:
+            changed = [
+                attr
+                for attr, value in sprites.items()
+                if getattr(instance.sprites, attr) != value
+            ]
+            for attr in changed:
+                setattr(instance.sprites, attr, sprites[attr])
+            if changed:
+                instance.sprites.save(update_fields=changed)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.content_hash = content_hash
+        instance.snapshot = self.snapshot(instance, abilities, types)
         instance.save()
-        return super().update(instance, validated_data)
+        PokemonCatalog.register_override(instance)
+        self.rendered(instance)
+        return instance
@@ -0,0 +1,60 @@
+import pytest
+
+from apps.wrapper import models
+from apps.wrapper.classes.catalog_index import CatalogIndex
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+from tests.stub_pokeapi import NAMES
+
+
+@pytest.fixture
+def index():
+    return CatalogIndex(enumerate(NAMES, start=1))
+
+
+class TestCatalogIndex:
+    @pytest.mark.parametrize(
+        "name", ["a", "ch", "char", "saur", "pidgeo", "zzz", "bulbasaurs"]
+    )
+    def test_name_search_matches_a_scan(self, index, name):
+        expected = [
+            position
+            for position, pokemon in enumerate(NAMES)
+            if name in pokemon
+        ]
+
+        assert list(index.search(name=name)) == expected
+
+    def test_pokedex_id_search(self, index):
+        assert list(index.search(pokedex_id="4")) == [3]
+        assert list(index.search(pokedex_id="4", name="char")) == [3]
+        assert list(index.search(pokedex_id="4", name="squirt")) == []
+        assert list(index.search(pokedex_id="999")) == []
+        assert list(index.search(pokedex_id="four")) == []
+        assert list(index.search(pokedex_id="\u00b2")) == []
+
+    def test_no_filters_match_everything(self, index):
+        assert index.search() == range(len(NAMES))
+        assert index.entry(0) == (1, "bulbasaur")
+
+
+@pytest.mark.django_db
+class TestCatalogIndexVersion:
+    def test_rebuilt_when_the_catalog_changes(self):
+        models.PokemonCatalogEntry.objects.create(
+            pokeapi_id=1, name="bulbasaur"
+        )
+        index = CatalogIndex.current()
+        assert CatalogIndex.current() is index
+
+        models.PokemonCatalogEntry.objects.create(pokeapi_id=2, name="ivysaur")
+        PokemonCatalog.bump_version()
+
+        assert len(CatalogIndex.current()) == 2
+
+    def test_list_filter_ignores_non_ascii_digits(
+        self, api_client, stub_pokeapi, pokemon_catalog
+    ):
+        response = api_client.get("/api/v1/pokemon/?pokedex_id=%C2%B2")
+
+        assert response.status_code == 200
+        assert response.data["results"] == []
@@ -0,0 +1,46 @@
+import pytest
+
+from apps.wrapper import models
+from apps.wrapper.classes.catalog_merge import CatalogMerge
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+
+
+class TestCatalogMerge:
+    def test_overrides_replace_upstream_entries_in_order(self):
+        upstream = [(1, "bulbasaur"), (2, "ivysaur"), (3, "venusaur")]
+
+        merged = list(
+            CatalogMerge({2: "ivy", 50: "new", 40: "other"}).merge(upstream)
+        )
+
+        assert merged == [
+            (1, "bulbasaur", False),
+            (2, "ivy", True),
+            (3, "venusaur", False),
+            (40, "other", True),
+            (50, "new", True),
+        ]
+
+    def test_upstream_is_consumed_lazily(self):
+        def upstream():
+            yield 1, "bulbasaur"
+            raise AssertionError("read past the first entry")
+
+        merged = CatalogMerge({}).merge(upstream())
+
+        assert next(merged) == (1, "bulbasaur", False)
+
+
+@pytest.mark.django_db
+class TestPokemonCatalogSync:
+    def test_sync_pages_through_upstream(
+        self, monkeypatch, stub_pokeapi, db_pokemon
+    ):
+        monkeypatch.setattr(PokemonCatalog, "PAGE_SIZE", 6)
+        monkeypatch.setattr(PokemonCatalog, "BATCH_SIZE", 4)
+
+        assert PokemonCatalog().sync() == stub_pokeapi.count
+        assert stub_pokeapi.requests == 4
+        assert list(
+            models.PokemonCatalogEntry.objects.values_list("name", flat=True)
+        ) == [db_pokemon.name, *map(stub_pokeapi.name, range(2, 21))]
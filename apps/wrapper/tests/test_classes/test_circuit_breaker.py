@@ -0,0 +1,103 @@
+import time
+
+import pytest
+
+from apps.wrapper.classes.circuit_breaker import CircuitBreaker
+from apps.wrapper.classes.pokemon_api import PokemonApi
+from apps.wrapper.classes.pokemon_api_wrapper import PokemonApiWrapper
+from apps.wrapper.exceptions import UpstreamUnavailable
+
+
+@pytest.fixture
+def breaker_settings(settings, stub_pokeapi):
+    settings.POKEAPI = {
+        **settings.POKEAPI,
+        "MAX_RETRIES": 0,
+        "CACHE_TTL": {"pokemon_list": 0, "pokemon": 0},
+        "CIRCUIT_FAILURE_THRESHOLD": 2,
+        "CIRCUIT_RESET_TIMEOUT": 0.2,
+    }
+    PokemonApi.close_session()
+    return settings
+
+
+class TestCircuitBreaker:
+    def test_opens_after_repeated_failures(
+        self, breaker_settings, stub_pokeapi
+    ):
+        api = PokemonApi()
+        stub_pokeapi.failures = [503, 503]
+        for pokeapi_id in (1, 2):
+            with pytest.raises(UpstreamUnavailable):
+                api.get_pokemon_by_id(pokeapi_id)
+        requests = stub_pokeapi.requests
+
+        with pytest.raises(UpstreamUnavailable):
+            api.get_pokemon_by_id(3)
+
+        assert CircuitBreaker().state == CircuitBreaker.OPEN
+        assert stub_pokeapi.requests == requests
+
+    def test_fails_fast_with_stale_data(self, breaker_settings, stub_pokeapi):
+        api = PokemonApi()
+        fresh = api.get_pokemon_by_id(1)
+        stub_pokeapi.failures = [503, 503]
+        for pokeapi_id in (2, 3):
+            with pytest.raises(UpstreamUnavailable):
+                api.get_pokemon_by_id(pokeapi_id)
+        requests = stub_pokeapi.requests
+
+        stale_api = PokemonApi()
+        data = stale_api.get_pokemon_by_id(1)
+
+        assert data == fresh
+        assert stale_api.stale
+        assert stub_pokeapi.requests == requests
+
+    def test_half_open_probe_recovers(self, breaker_settings, stub_pokeapi):
+        api = PokemonApi()
+        stub_pokeapi.failures = [503, 503]
+        for pokeapi_id in (1, 2):
+            with pytest.raises(UpstreamUnavailable):
+                api.get_pokemon_by_id(pokeapi_id)
+        time.sleep(0.2)
+
+        data = PokemonApi().get_pokemon_by_id(1)
+
+        assert data["id"] == 1
+        assert CircuitBreaker().state == CircuitBreaker.CLOSED
+
+    def test_network_errors_open_the_circuit(self, breaker_settings):
+        breaker_settings.POKEAPI = {
+            **breaker_settings.POKEAPI,
+            "BASE_URI": "http://127.0.0.1:9/api/v2/",
+        }
+        for pokeapi_id in (1, 2):
+            with pytest.raises(UpstreamUnavailable):
+                PokemonApi().get_pokemon_by_id(pokeapi_id)
+
+        assert CircuitBreaker().state == CircuitBreaker.OPEN
+
+
+@pytest.mark.django_db
+class TestStaleResponses:
+    def test_retrieve_is_marked_stale(
+        self, breaker_settings, stub_pokeapi, api_client
+    ):
+        api_client.get("/api/v1/pokemon/4/")
+        stub_pokeapi.failures = [503, 503]
+
+        response = api_client.get("/api/v1/pokemon/4/")
+
+        assert response.status_code == 200
+        assert response.data["name"] == "charmander"
+        assert response[PokemonApiWrapper.STALE_HEADER] == "true"
+
+    def test_unavailable_without_stale_data(
+        self, breaker_settings, stub_pokeapi, api_client
+    ):
+        stub_pokeapi.failures = [503, 503]
+
+        response = api_client.get("/api/v1/pokemon/4/")
+
+        assert response.status_code == 503
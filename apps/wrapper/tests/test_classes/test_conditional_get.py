@@ -0,0 +1,83 @@
+import pytest
+from django.test import RequestFactory
+
+from apps.wrapper.classes.conditional_get import ConditionalGet
+from apps.wrapper.classes.rendered_cache import RenderedCache
+
+
+class TestConditionalGetMatches:
+    @pytest.mark.parametrize(
+        "header, matches",
+        [
+            ('"abc"', True),
+            ('"xyz", W/"abc"', True),
+            ("*", True),
+            ('"xyz"', False),
+            ("", False),
+        ],
+    )
+    def test_if_none_match(self, header, matches):
+        request = RequestFactory().get("/", HTTP_IF_NONE_MATCH=header)
+
+        assert ConditionalGet(request).matches('"abc"') is matches
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    def test_list_pages_are_revalidated(
+        self, api_client, stub_pokeapi, pokemon_catalog, monkeypatch
+    ):
+        response = api_client.get("/api/v1/pokemon/?limit=5")
+        etag = response["ETag"]
+
+        def render(data):
+            raise AssertionError("The page was built again")
+
+        monkeypatch.setattr(RenderedCache, "render", render)
+        response = api_client.get(
+            "/api/v1/pokemon/?limit=5", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response["ETag"] == etag
+        assert response["Cache-Control"] == "public, max-age=60, s-maxage=300"
+
+    def test_catalog_writes_change_the_list_etag(
+        self, api_client, stub_pokeapi, pokemon_catalog, pokemon_params
+    ):
+        etag = api_client.get("/api/v1/pokemon/")["ETag"]
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        response = api_client.get("/api/v1/pokemon/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_details_are_revalidated(self, api_client, stub_pokeapi):
+        response = api_client.get("/api/v1/pokemon/1/")
+        etag = response["ETag"]
+        requests = stub_pokeapi.requests
+        response = api_client.get(
+            "/api/v1/pokemon/1/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 304
+        assert stub_pokeapi.requests == requests
+        assert (
+            response["Cache-Control"] == "public, max-age=300, s-maxage=3600"
+        )
+
+    def test_cache_control_is_configurable(
+        self, api_client, stub_pokeapi, settings
+    ):
+        settings.HTTP_CACHE = {"retrieve": "no-cache"}
+        response = api_client.get("/api/v1/pokemon/1/")
+
+        assert response["Cache-Control"] == "no-cache"
+        assert response["ETag"] == ConditionalGet.etag(response.content)
+
+    def test_missing_details_have_no_validator(self, api_client, stub_pokeapi):
+        response = api_client.get("/api/v1/pokemon/9999/")
+
+        assert response.status_code == 404
+        assert not response.has_header("ETag")
@@ -0,0 +1,128 @@
+import gzip
+
+import brotli
+import pytest
+from django.core.cache import caches
+
+from apps.wrapper.classes.content_encoding import ContentEncoding
+from apps.wrapper.classes.tiered_cache import TieredCache
+
+
+class TestContentEncodingNegotiate:
+    @pytest.mark.parametrize(
+        "accept_encoding, encoding",
+        [
+            ("gzip, deflate, br", "br"),
+            ("gzip", "gzip"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("br;q=0, *", "gzip"),
+            ("identity", None),
+            ("", None),
+        ],
+    )
+    def test_negotiate(self, accept_encoding, encoding):
+        assert ContentEncoding.negotiate(accept_encoding) == encoding
+
+
+@pytest.mark.django_db
+class TestContentEncoding:
+    @pytest.mark.parametrize(
+        "encoding, decompress",
+        [("br", brotli.decompress), ("gzip", gzip.decompress)],
+    )
+    def test_details_are_compressed(
+        self, api_client, stub_pokeapi, settings, encoding, decompress
+    ):
+        settings.COMPRESSION = dict(settings.COMPRESSION, MIN_SIZE=0)
+        plain = api_client.get("/api/v1/pokemon/1/")
+        response = api_client.get(
+            "/api/v1/pokemon/1/", HTTP_ACCEPT_ENCODING=encoding
+        )
+
+        assert response["Content-Encoding"] == encoding
+        assert response["Vary"] == "Accept-Encoding"
+        assert decompress(response.content) == plain.content
+        assert response["ETag"] == plain["ETag"][:-1] + f'-{encoding}"'
+        assert response.data == plain.data
+
+    def test_variants_are_compressed_once(
+        self, api_client, stub_pokeapi, settings, monkeypatch
+    ):
+        settings.COMPRESSION = dict(settings.COMPRESSION, MIN_SIZE=0)
+        first = api_client.get("/api/v1/pokemon/1/", HTTP_ACCEPT_ENCODING="br")
+
+        def compress(content, encoding):
+            raise AssertionError("The variant was compressed again")
+
+        monkeypatch.setattr(ContentEncoding, "compress", compress)
+        second = api_client.get(
+            "/api/v1/pokemon/1/", HTTP_ACCEPT_ENCODING="br"
+        )
+
+        assert second.content == first.content
+
+    def test_variants_are_not_broadcast(
+        self, api_client, stub_pokeapi, settings
+    ):
+        settings.COMPRESSION = dict(settings.COMPRESSION, MIN_SIZE=0)
+        l2 = caches[settings.POKEAPI["CACHE_ALIAS"]]
+        api_client.get("/api/v1/pokemon/1/")
+        sequence = l2.get(TieredCache.SEQUENCE_KEY)
+
+        response = api_client.get(
+            "/api/v1/pokemon/1/", HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        assert response["Content-Encoding"] == "gzip"
+        assert l2.get(TieredCache.SEQUENCE_KEY) == sequence
+
+    def test_short_bodies_are_not_compressed(
+        self, api_client, stub_pokeapi, settings
+    ):
+        settings.COMPRESSION = dict(settings.COMPRESSION, MIN_SIZE=10**6)
+        response = api_client.get(
+            "/api/v1/pokemon/1/", HTTP_ACCEPT_ENCODING="br"
+        )
+
+        assert not response.has_header("Content-Encoding")
+        assert response["Vary"] == "Accept-Encoding"
+
+    def test_list_variants_are_revalidated(
+        self, api_client, stub_pokeapi, pokemon_catalog, settings
+    ):
+        settings.COMPRESSION = dict(settings.COMPRESSION, MIN_SIZE=0)
+        response = api_client.get(
+            "/api/v1/pokemon/", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        response = api_client.get(
+            "/api/v1/pokemon/",
+            HTTP_ACCEPT_ENCODING="gzip",
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+
+        assert response.status_code == 304
+        assert response["ETag"].endswith('-gzip"')
+
+    def test_short_list_pages_are_revalidated_uncompressed(
+        self, api_client, stub_pokeapi, pokemon_catalog, settings
+    ):
+        settings.COMPRESSION = dict(settings.COMPRESSION, MIN_SIZE=10**6)
+        etag = api_client.get("/api/v1/pokemon/")["ETag"]
+
+        response = api_client.get(
+            "/api/v1/pokemon/",
+            HTTP_ACCEPT_ENCODING="gzip",
+            HTTP_IF_NONE_MATCH=ContentEncoding.etag(etag, "gzip"),
+        )
+
+        assert response.status_code == 200
+        assert response["ETag"] == etag
+        assert not response.has_header("Content-Encoding")
+
+        response = api_client.get(
+            "/api/v1/pokemon/",
+            HTTP_ACCEPT_ENCODING="gzip",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        assert response.status_code == 304
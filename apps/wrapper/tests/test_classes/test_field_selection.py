@@ -0,0 +1,96 @@
+import pytest
+from rest_framework.exceptions import ValidationError
+
+from apps.wrapper.classes.field_selection import FieldSelection
+from apps.wrapper.classes.rendered_cache import RenderedCache
+from apps.wrapper.serializers import PokemonSerializer, PokemonSpriteSerializer
+
+
+class TestFieldSelectionTree:
+    @pytest.mark.parametrize(
+        "value, tree",
+        [
+            ("id, name", {"id": None, "name": None}),
+            ("sprites.front_default", {"sprites": {"front_default": None}}),
+            ("sprites,sprites.front_default", {"sprites": None}),
+            ("sprites.front_default,sprites", {"sprites": None}),
+            (",", {}),
+        ],
+    )
+    def test_tree(self, value, tree):
+        assert FieldSelection.tree(value) == tree
+
+
+class TestFieldSelectionPrune:
+    def test_unrequested_serializers_are_dropped(self):
+        serializer = FieldSelection("id,sprites.front_default").prune(
+            PokemonSerializer()
+        )
+
+        assert list(serializer.fields) == ["id", "sprites"]
+        assert list(serializer.fields["sprites"].fields) == ["front_default"]
+
+    def test_exclude(self, monkeypatch):
+        def to_representation(self, instance):
+            raise AssertionError("Excluded sprites were serialized")
+
+        monkeypatch.setattr(
+            PokemonSpriteSerializer, "to_representation", to_representation
+        )
+        serializer = FieldSelection(exclude="sprites,abilities").prune(
+            PokemonSerializer({"id": 1, "name": "bulbasaur", "types": []})
+        )
+
+        assert serializer.data == {"id": 1, "name": "bulbasaur", "types": []}
+
+    @pytest.mark.parametrize(
+        "fields, exclude",
+        [("id,height", None), (None, "sprites.shiny"), ("name.first", None)],
+    )
+    def test_invalid_fields(self, fields, exclude):
+        with pytest.raises(ValidationError):
+            FieldSelection(fields, exclude).prune(PokemonSerializer())
+
+
+@pytest.mark.django_db
+class TestFieldSelection:
+    def test_upstream_details(self, api_client, stub_pokeapi):
+        response = api_client.get(
+            "/api/v1/pokemon/1/?fields=id,name,types,sprites.front_default"
+        )
+
+        assert response.status_code == 200
+        assert set(response.data) == {"id", "name", "types", "sprites"}
+        assert set(response.data["sprites"]) == {"front_default"}
+        assert RenderedCache().get(1) is None
+
+    def test_local_details(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_params,
+        django_assert_num_queries,
+    ):
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+
+        with django_assert_num_queries(1):
+            response = api_client.get(
+                "/api/v1/pokemon/1/?fields=name,sprites.front_default"
+            )
+        assert response.data == {
+            "name": pokemon_params["name"],
+            "sprites": {
+                "front_default": pokemon_params["sprites"]["front_default"]
+            },
+        }
+
+        with django_assert_num_queries(1):
+            response = api_client.get(
+                "/api/v1/pokemon/1/?exclude=sprites,types"
+            )
+        assert set(response.data) == {"id", "name", "abilities"}
+
+    def test_unknown_fields(self, api_client, stub_pokeapi):
+        response = api_client.get("/api/v1/pokemon/1/?fields=height")
+
+        assert response.status_code == 400
@@ -0,0 +1,88 @@
+import datetime
+import decimal
+import io
+import uuid
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from apps.wrapper.parsers import ORJSONParser
+from apps.wrapper.renderers import ORJSONRenderer
+from tests.stub_pokeapi import StubPokeApi
+
+
+class TestORJSONRenderer:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            StubPokeApi().pokemon(1),
+            {"name": "flabébé", "line": "a b c"},
+            {"at": datetime.datetime(2024, 1, 2, 3, 4, 5, 678901)},
+            {"on": datetime.date(2024, 1, 2), "id": uuid.UUID(int=1)},
+            {"weight": decimal.Decimal("6.9"), "ids": {1, 2}},
+            {1: "int keys", "big": 2**70},
+            {"small": 1e-7, "large": 1e16, "tiny": [1e-5, -4.5e-5]},
+            {"plain": [0.0001, 1e15, 0.5], "text": "1e5 0.00001"},
+            ReturnDict({"id": 1}, serializer=None),
+            [],
+        ],
+    )
+    def test_renders_the_same_bytes(self, data):
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_renders_the_request_data(self, pokemon_params):
+        assert ORJSONRenderer().render(pokemon_params) == (
+            JSONRenderer().render(pokemon_params)
+        )
+
+    def test_indented_responses(self):
+        data = {"id": 1}
+        media_type = "application/json; indent=4"
+
+        assert ORJSONRenderer().render(data, media_type) == (
+            JSONRenderer().render(data, media_type)
+        )
+
+    def test_non_finite_floats_are_null(self):
+        data = {"nan": float("nan"), "inf": [float("inf"), -float("inf")]}
+
+        with pytest.raises(ValueError):
+            JSONRenderer().render(data)
+        assert (
+            ORJSONRenderer().render(data) == b'{"nan":null,"inf":[null,null]}'
+        )
+
+    def test_unencodable_data(self):
+        with pytest.raises(TypeError):
+            ORJSONRenderer().render({"object": object()})
+
+
+class TestORJSONParser:
+    def test_parses_like_the_default_parser(self, pokemon_params):
+        content = JSONRenderer().render(pokemon_params)
+
+        assert ORJSONParser().parse(io.BytesIO(content)) == (
+            JSONParser().parse(io.BytesIO(content))
+        )
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b'{"big": 18446744073709551616, "small": -9223372036854775809}',
+            b'{"ids": [123456789012345678901234567890], "id": 1}',
+            b'{"weight": 1e-7, "height": 1e16}',
+        ],
+    )
+    def test_parses_numbers_like_the_default_parser(self, content):
+        # Compared by repr, since 2**64 == float(2**64)
+        assert repr(ORJSONParser().parse(io.BytesIO(content))) == repr(
+            JSONParser().parse(io.BytesIO(content))
+        )
+
+    @pytest.mark.parametrize("content", [b"", b"{", b'{"height": NaN}'])
+    def test_invalid_json(self, content):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(content))
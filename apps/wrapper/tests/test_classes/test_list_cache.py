@@ -0,0 +1,79 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from django.core.cache import cache
+
+from apps.wrapper import models
+from apps.wrapper.classes.list_cache import ListCache
+from apps.wrapper.classes.metrics import Metrics
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+
+
+class TestListCacheKey:
+    def test_equivalent_requests_share_a_key(self):
+        cache = ListCache()
+        url = "http://testserver/api/v1/pokemon/"
+
+        key = cache.key(1, url, {"name": "char", "pokedex_id": None}, 10, 0)
+
+        assert key == cache.key(
+            1, url, {"pokedex_id": "", "name": "char"}, 10, 0
+        )
+        assert key != cache.key(2, url, {"name": "char"}, 10, 0)
+        assert key != cache.key(1, url, {"name": "char"}, 10, 0, "")
+
+
+@pytest.mark.django_db
+class TestListCache:
+    def test_pages_are_shared_across_cookies(
+        self, api_client, stub_pokeapi, pokemon_catalog
+    ):
+        api_client.cookies["sessionid"] = "first"
+        first = api_client.get("/api/v1/pokemon/?limit=5&offset=0")
+        api_client.cookies["sessionid"] = "second"
+        second = api_client.get("/api/v1/pokemon/?offset=0&limit=5")
+
+        assert first.data == second.data
+        assert Metrics.snapshot()["list_cache.hit"] == 1
+        assert Metrics.snapshot()["list_cache.miss"] == 1
+
+    def test_links_only_keep_the_canonical_params(
+        self, api_client, stub_pokeapi, pokemon_catalog
+    ):
+        api_client.get("/api/v1/pokemon/?cursor=&limit=2&foo=evil")
+
+        response = api_client.get("/api/v1/pokemon/?cursor=&limit=2")
+
+        assert "foo" not in response.data["next"]
+        assert Metrics.snapshot()["list_cache.hit"] == 1
+
+        response = api_client.get(
+            "/api/v1/pokemon/?cursor=&limit=2&name=saur&foo=evil"
+        )
+
+        query = parse_qs(urlsplit(response.data["next"]).query)
+        assert query.keys() == {"name", "cursor", "limit"}
+        assert query["name"] == ["saur"]
+
+    def test_catalog_writes_invalidate_pages(
+        self, api_client, stub_pokeapi, pokemon_catalog, pokemon_params
+    ):
+        api_client.get("/api/v1/pokemon/")
+        models.PokemonCatalogEntry.objects.filter(pokeapi_id=2).update(
+            name="changed"
+        )
+        response = api_client.get("/api/v1/pokemon/")
+        assert response.data["results"][1]["name"] == "ivysaur"
+
+        response = api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        assert response.status_code in (200, 201)
+        response = api_client.get("/api/v1/pokemon/")
+
+        assert response.data["results"][0]["name"] == pokemon_params["name"]
+        assert response.data["results"][1]["name"] == "changed"
+
+    def test_versions_are_not_reused_after_a_cache_flush(self):
+        version = PokemonCatalog.version()
+        cache.clear()
+
+        assert PokemonCatalog.version() != version
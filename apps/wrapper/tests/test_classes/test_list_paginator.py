@@ -0,0 +1,72 @@
+import pytest
+from django.test import RequestFactory
+from rest_framework.exceptions import NotFound
+
+from apps.wrapper.classes.list_paginator import ListPaginator
+
+
+@pytest.fixture
+def paginator():
+    return ListPaginator(RequestFactory().get("/api/v1/pokemon/"))
+
+
+class TestListPaginator:
+    def test_offset_not_multiple_of_limit(self, paginator):
+        data = paginator.paginate_list(list(range(20)), limit=5, offset=3)
+
+        assert data["count"] == 20
+        assert data["results"] == [3, 4, 5, 6, 7]
+        assert data["previous"].endswith("/api/v1/pokemon/?offset=0&limit=5")
+        assert data["next"].endswith("/api/v1/pokemon/?offset=8&limit=5")
+
+    def test_iterator_with_count(self, paginator):
+        data = paginator.paginate_list(
+            iter(range(20)), limit=5, offset=15, count=20
+        )
+
+        assert data["results"] == [15, 16, 17, 18, 19]
+        assert data["next"] is None
+        assert data["previous"].endswith("?offset=10&limit=5")
+
+    def test_only_the_page_is_read(self, paginator):
+        data = paginator.paginate_list(range(10**12), limit=2, offset=10**11)
+
+        assert data["count"] == 10**12
+        assert data["results"] == [10**11, 10**11 + 1]
+
+    def test_offset_past_the_end(self, paginator):
+        data = paginator.paginate_list(list(range(20)), limit=10, offset=20)
+
+        assert data["results"] == []
+        assert data["next"] is None
+        assert data["previous"].endswith("?offset=10&limit=10")
+
+    def test_cursor_pages(self, paginator):
+        data = list(range(0, 40, 2))
+
+        first = paginator.paginate_cursor(data, 5, "", key=lambda item: item)
+        cursor = first["next"].split("cursor=")[1].split("&")[0]
+        second = paginator.paginate_cursor(
+            data, 5, cursor, key=lambda item: item
+        )
+
+        assert first["results"] == [0, 2, 4, 6, 8]
+        assert second["results"] == [10, 12, 14, 16, 18]
+        assert paginator.decode_cursor(cursor) == 8
+
+    def test_cursor_is_stable_when_items_are_added(self, paginator):
+        cursor = paginator.encode_cursor(8)
+
+        data = paginator.paginate_cursor(
+            [1, 3, 5, 7, 8, 9, 11], 2, cursor, key=lambda item: item
+        )
+
+        assert data["results"] == [9, 11]
+        assert data["next"] is None
+
+    @pytest.mark.parametrize(
+        "cursor", ["%%%", "bm9wZQ==", "az1hYmM=", "az3Csg=="]
+    )
+    def test_invalid_cursor(self, paginator, cursor):
+        with pytest.raises(NotFound):
+            paginator.decode_cursor(cursor)
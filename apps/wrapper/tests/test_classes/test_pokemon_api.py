@@ -0,0 +1,105 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from apps.wrapper.classes.pokemon_api import PokemonApi
+from apps.wrapper.exceptions import UpstreamUnavailable
+
+
+class TestPokemonApiSession:
+    def test_session_is_shared(self, stub_pokeapi):
+        # Test that every instance and thread uses the same session
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = set(
+                executor.map(
+                    lambda _: id(PokemonApi().get_session()), range(8)
+                )
+            )
+        assert len(sessions) == 1
+
+    def test_session_uses_pool_settings(self, stub_pokeapi, settings):
+        settings.POKEAPI = {**settings.POKEAPI, "POOL_MAXSIZE": 7}
+        PokemonApi.close_session()
+
+        adapter = PokemonApi.get_session().get_adapter(stub_pokeapi.base_uri)
+
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == settings.POKEAPI["MAX_RETRIES"]
+        assert 429 in adapter.max_retries.status_forcelist
+
+    def test_connections_are_kept_alive(self, stub_pokeapi):
+        api = PokemonApi()
+        for pokeapi_id in range(1, 6):
+            assert api.get_pokemon_by_id(pokeapi_id)["id"] == pokeapi_id
+
+        assert stub_pokeapi.requests == 5
+        assert stub_pokeapi.connections == 1
+
+    def test_pooling_disabled(self, stub_pokeapi, settings):
+        settings.POKEAPI = {**settings.POKEAPI, "POOLING": False}
+        api = PokemonApi()
+        for pokeapi_id in range(1, 4):
+            api.get_pokemon_by_id(pokeapi_id)
+
+        assert stub_pokeapi.connections == 3
+
+    def test_retries_server_errors(self, stub_pokeapi):
+        stub_pokeapi.failures = [503, 429]
+
+        data = PokemonApi().get_pokemon_list(limit=5, offset=0)
+
+        assert stub_pokeapi.requests == 3
+        assert data["count"] == stub_pokeapi.count
+        assert len(data["results"]) == 5
+
+    def test_read_timeouts_are_not_retried(self, stub_pokeapi, settings):
+        settings.POKEAPI = {**settings.POKEAPI, "TIMEOUT": 0.1}
+        stub_pokeapi.latency = 0.3
+
+        with pytest.raises(UpstreamUnavailable):
+            PokemonApi().get_pokemon_by_id(1)
+        time.sleep(0.5)
+
+        assert stub_pokeapi.requests == 1
+
+
+class TestPokemonApiCache:
+    def test_fresh_entries_skip_upstream(self, stub_pokeapi):
+        api = PokemonApi()
+        first = api.get_pokemon_by_id(1)
+        second = PokemonApi().get_pokemon_by_id(1)
+
+        assert first == second
+        assert stub_pokeapi.requests == 1
+
+    def test_ttl_is_per_resource(self, stub_pokeapi, settings):
+        settings.POKEAPI = {
+            **settings.POKEAPI,
+            "CACHE_TTL": {"pokemon_list": 0, "pokemon": 60},
+        }
+        api = PokemonApi()
+        for _ in range(2):
+            api.get_pokemon_by_id(1)
+            api.get_pokemon_list(limit=5, offset=0)
+
+        assert stub_pokeapi.requests == 3
+
+    def test_stale_entries_are_revalidated(self, stub_pokeapi, settings):
+        settings.POKEAPI = {
+            **settings.POKEAPI,
+            "CACHE_TTL": {"pokemon_list": 0, "pokemon": 0},
+        }
+        api = PokemonApi()
+        first = api.get_pokemon_list(limit=5, offset=0)
+        second = api.get_pokemon_list(limit=5, offset=0)
+
+        assert first == second
+        assert stub_pokeapi.requests == 2
+        assert stub_pokeapi.not_modified == 1
+
+    def test_different_urls_are_cached_apart(self, stub_pokeapi):
+        api = PokemonApi()
+        assert len(api.get_pokemon_list(limit=5, offset=0)["results"]) == 5
+        assert len(api.get_pokemon_list(limit=3, offset=0)["results"]) == 3
+        assert stub_pokeapi.requests == 2
@@ -0,0 +1,181 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.wrapper import models
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+
+
+@pytest.mark.django_db
+class TestPokemonCatalog:
+    def test_sync_merges_overrides(self, stub_pokeapi, db_pokemon):
+        count = PokemonCatalog().sync()
+
+        entries = models.PokemonCatalogEntry.objects.all()
+        assert count == stub_pokeapi.count
+        assert [entry.pokeapi_id for entry in entries] == list(range(1, 21))
+        assert entries[0].name == db_pokemon.name
+        assert entries[0].is_override
+        assert entries[1].name == stub_pokeapi.name(2)
+        assert not entries[1].is_override
+
+    def test_sync_removes_dropped_pokemons(self, stub_pokeapi):
+        models.PokemonCatalogEntry.objects.create(
+            pokeapi_id=999, name="missingno"
+        )
+
+        PokemonCatalog().sync()
+
+        assert not models.PokemonCatalogEntry.objects.filter(
+            pokeapi_id=999
+        ).exists()
+
+    def test_sync_keeps_catalog_when_upstream_is_down(self, settings):
+        settings.POKEAPI = {
+            **settings.POKEAPI,
+            "BASE_URI": "http://127.0.0.1:9/api/v2/",
+            "MAX_RETRIES": 0,
+        }
+        models.PokemonCatalogEntry.objects.create(
+            pokeapi_id=1, name="bulbasaur"
+        )
+
+        with pytest.raises(CommandError):
+            call_command("sync_pokemon_catalog")
+
+        assert models.PokemonCatalogEntry.objects.count() == 1
+
+    def test_override_updates_catalog(
+        self, stub_pokeapi, pokemon_catalog, db_pokemon
+    ):
+        entry = models.PokemonCatalogEntry.objects.get(pokeapi_id=1)
+
+        assert entry.name == db_pokemon.name
+        assert entry.is_override
+
+
+@pytest.mark.django_db
+class TestPokemonCatalogList:
+    def test_list_is_served_by_the_database(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_catalog,
+        django_assert_num_queries,
+    ):
+        api_client.get("/api/v1/pokemon/")
+        requests = stub_pokeapi.requests
+
+        with django_assert_num_queries(0):
+            response = api_client.get("/api/v1/pokemon/?offset=10&limit=5")
+
+        assert response.status_code == 200
+        assert response.data["count"] == stub_pokeapi.count
+        assert [p["name"] for p in response.data["results"]] == [
+            stub_pokeapi.name(pokeapi_id) for pokeapi_id in range(11, 16)
+        ]
+        assert stub_pokeapi.requests == requests
+
+    def test_list_filters(self, api_client, stub_pokeapi, pokemon_catalog):
+        response = api_client.get("/api/v1/pokemon/?name=char")
+        assert [p["name"] for p in response.data["results"]] == [
+            "charmander",
+            "charmeleon",
+            "charizard",
+        ]
+
+        response = api_client.get("/api/v1/pokemon/?pokedex_id=7")
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["url"].endswith(
+            "/api/v1/pokemon/7/"
+        )
+
+        response = api_client.get("/api/v1/pokemon/?pokedex_id=seven")
+        assert response.data["count"] == 0
+
+    def test_list_shows_new_overrides(
+        self, api_client, stub_pokeapi, pokemon_catalog, pokemon_params
+    ):
+        pokemon_params["id"] = 5000
+        response = api_client.put(
+            "/api/v1/pokemon/5000/", pokemon_params, format="json"
+        )
+        assert response.status_code in (200, 201)
+
+        response = api_client.get("/api/v1/pokemon/?pokedex_id=5000")
+
+        assert response.data["results"][0]["name"] == pokemon_params["name"]
+
+    def test_list_cursor_walks_the_catalog(
+        self, api_client, stub_pokeapi, pokemon_catalog
+    ):
+        url = "/api/v1/pokemon/?cursor=&limit=7"
+        names = []
+        while url:
+            response = api_client.get(url)
+            assert response.status_code == 200
+            names += [p["name"] for p in response.data["results"]]
+            url = response.data["next"]
+
+        assert names == list(map(stub_pokeapi.name, range(1, 21)))
+
+    def test_list_invalid_cursor(self, api_client):
+        response = api_client.get("/api/v1/pokemon/?cursor=nope")
+
+        assert response.status_code == 404
+
+    def test_list_limit_is_capped(
+        self, settings, api_client, stub_pokeapi, pokemon_catalog
+    ):
+        settings.POKEMON_LIST = {**settings.POKEMON_LIST, "MAX_LIMIT": 5}
+
+        response = api_client.get("/api/v1/pokemon/?limit=1000")
+        assert len(response.data["results"]) == 5
+        assert response.data["next"].endswith("?offset=5&limit=5")
+
+        response = api_client.get("/api/v1/pokemon/?limit=abc&offset=-1")
+        assert len(response.data["results"]) == 5
+        assert response.data["previous"] is None
+
+
+@pytest.mark.django_db
+class TestPokemonCatalogExport:
+    def test_export_json(
+        self, settings, api_client, stub_pokeapi, pokemon_catalog, db_pokemon
+    ):
+        settings.POKEMON_LIST = {
+            **settings.POKEMON_LIST,
+            "EXPORT_CHUNK_SIZE": 6,
+        }
+
+        response = api_client.get("/api/v1/pokemon/export/")
+
+        assert response.streaming
+        assert response["Content-Type"] == "application/json"
+        chunks = list(response.streaming_content)
+        data = json.loads(b"".join(chunks))
+        assert len(chunks) == 6
+        assert len(data) == stub_pokeapi.count
+        assert data[0]["name"] == db_pokemon.name
+        assert data[-1]["url"].endswith("/api/v1/pokemon/20/")
+
+    def test_export_ndjson(self, api_client, stub_pokeapi, pokemon_catalog):
+        response = api_client.get("/api/v1/pokemon/export/?output=ndjson")
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert [json.loads(line)["name"] for line in lines] == list(
+            map(stub_pokeapi.name, range(1, 21))
+        )
+
+    def test_export_empty_catalog(self, api_client):
+        response = api_client.get("/api/v1/pokemon/export/")
+
+        assert json.loads(b"".join(response.streaming_content)) == []
+
+    def test_export_invalid_output(self, api_client):
+        response = api_client.get("/api/v1/pokemon/export/?output=xml")
+
+        assert response.status_code == 400
@@ -0,0 +1,139 @@
+import copy
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.wrapper import models
+from apps.wrapper.classes.pokemon_importer import PokemonImporter
+from apps.wrapper.serializers import PokemonUpdateSerializer
+
+
+def items(pokemon_params, pokeapi_ids):
+    result = []
+    for pokeapi_id in pokeapi_ids:
+        item = copy.deepcopy(pokemon_params)
+        item["id"] = pokeapi_id
+        item["name"] = f"imported-{pokeapi_id}"
+        result.append(item)
+    return result
+
+
+@pytest.mark.django_db
+class TestPokemonImporter:
+    def test_creates_pokemons(self, pokemon_params):
+        report = PokemonImporter().run(items(pokemon_params, [1, 2, 3]))
+
+        assert report == {
+            "created": 3,
+            "updated": 0,
+            "unchanged": 0,
+            "errors": [],
+        }
+        for pokemon in models.Pokemon.objects.all():
+            assert pokemon.snapshot == PokemonUpdateSerializer.serialize(
+                pokemon
+            )
+        assert set(
+            models.PokemonCatalogEntry.objects.filter(
+                is_override=True
+            ).values_list("name", flat=True)
+        ) == {"imported-1", "imported-2", "imported-3"}
+
+    def test_updates_pokemons(self, pokemon_params):
+        PokemonImporter().run(items(pokemon_params, [1, 2]))
+        batch = items(pokemon_params, [1, 2])
+        batch[0]["types"] = []
+        batch[0]["sprites"]["front_shiny"] = None
+
+        report = PokemonImporter().run(batch)
+
+        assert report == {
+            "created": 0,
+            "updated": 1,
+            "unchanged": 1,
+            "errors": [],
+        }
+        pokemon = models.Pokemon.objects.get(pokeapi_id=1)
+        assert pokemon.snapshot == PokemonUpdateSerializer.serialize(pokemon)
+        assert pokemon.snapshot["types"] == []
+        assert models.PokemonAbilitySlot.objects.count() == 4
+        assert models.PokemonTypeSlot.objects.count() == 2
+        assert models.PokemonType.objects.count() == 2
+        assert models.PokemonSprite.objects.count() == 2
+
+    def test_reports_invalid_items(self, pokemon_params):
+        batch = items(pokemon_params, [1, 2])
+        del batch[0]["name"]
+        lines = [json.dumps(item) for item in batch]
+
+        report = PokemonImporter(batch_size=1).run(
+            PokemonImporter.ndjson(["{", "", *lines])
+        )
+
+        assert report["created"] == 1
+        assert [error["index"] for error in report["errors"]] == [0, 1]
+        assert "non_field_errors" in report["errors"][0]["errors"]
+        assert "name" in report["errors"][1]["errors"]
+        assert models.Pokemon.objects.get().pokeapi_id == 2
+
+    def test_queries_dont_grow_with_the_batch(self, pokemon_params):
+        def queries(pokeapi_ids):
+            with CaptureQueriesContext(connection) as context:
+                PokemonImporter().run(items(pokemon_params, pokeapi_ids))
+            return len(context.captured_queries)
+
+        # The first import also inserts the shared abilities and types
+        queries([100])
+        assert queries(range(1, 3)) == queries(range(3, 23))
+
+
+@pytest.mark.django_db
+class TestPokemonImportEndpoint:
+    def test_json_array(self, api_client, pokemon_params):
+        response = api_client.post(
+            "/api/v1/pokemon/import/",
+            items(pokemon_params, [1, 2]),
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response.data["created"] == 2
+        detail = api_client.get("/api/v1/pokemon/2/")
+        assert detail.data["name"] == "imported-2"
+
+    def test_ndjson(self, api_client, pokemon_params):
+        body = "\n".join(
+            json.dumps(item) for item in items(pokemon_params, [1, 2])
+        )
+
+        response = api_client.post(
+            "/api/v1/pokemon/import/",
+            body,
+            content_type=PokemonImporter.MEDIA_TYPE_NDJSON,
+        )
+
+        assert response.status_code == 200
+        assert response.data["created"] == 2
+
+    def test_rejects_objects(self, api_client, pokemon_params):
+        response = api_client.post(
+            "/api/v1/pokemon/import/", pokemon_params, format="json"
+        )
+
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_import_command(tmp_path, pokemon_params, capsys):
+    path = tmp_path / "pokemon.ndjson"
+    path.write_text(
+        "\n".join(json.dumps(item) for item in items(pokemon_params, [1, 2]))
+    )
+
+    call_command("import_pokemon", str(path), "--batch-size", "1")
+
+    assert "Imported 2 Pokemon (2 created" in capsys.readouterr().out
+    assert models.Pokemon.objects.count() == 2
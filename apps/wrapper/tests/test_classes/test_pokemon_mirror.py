@@ -0,0 +1,160 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from apps.wrapper import models
+from apps.wrapper.classes.pokemon_api import PokemonApi
+from apps.wrapper.classes.pokemon_mirror import PokemonMirror
+from apps.wrapper.classes.rate_limiter import RateLimiter
+from apps.wrapper.classes.rendered_cache import RenderedCache
+from apps.wrapper.classes.tiered_cache import TieredCache
+from apps.wrapper.classes.upstream_cache import UpstreamCache
+from apps.wrapper.serializers import PokemonSerializer
+
+
+@pytest.mark.django_db
+class TestPokemonMirror:
+    def test_mirrors_the_catalog(self, stub_pokeapi, pokemon_catalog):
+        report = PokemonMirror(concurrency=4, rate_limit=0).crawl()
+
+        assert report == {
+            "pending": stub_pokeapi.count,
+            "fetched": stub_pokeapi.count,
+            "missing": 0,
+            "failed": 0,
+        }
+        assert models.PokemonMirrorEntry.objects.count() == stub_pokeapi.count
+        assert (
+            PokemonMirror.get(7)
+            == PokemonSerializer(stub_pokeapi.pokemon(7)).data
+        )
+        assert not models.PokemonMirrorCrawl.objects.filter(
+            finished_at=None
+        ).exists()
+
+    def test_fetches_only_stale_entries(self, stub_pokeapi, pokemon_catalog):
+        PokemonMirror(rate_limit=0).crawl()
+        models.PokemonMirrorEntry.objects.filter(pokeapi_id__lte=3).update(
+            fetched_at=timezone.now() - timedelta(days=30)
+        )
+
+        report = PokemonMirror(rate_limit=0).crawl()
+
+        assert report["pending"] == report["fetched"] == 3
+
+    def test_full_crawl_fetches_everything(
+        self, stub_pokeapi, pokemon_catalog
+    ):
+        PokemonMirror(rate_limit=0).crawl()
+
+        report = PokemonMirror(rate_limit=0).crawl(full=True)
+
+        assert report["fetched"] == stub_pokeapi.count
+
+    def test_resumes_a_failed_crawl(
+        self, settings, stub_pokeapi, pokemon_catalog
+    ):
+        stub_pokeapi.failures = [503] * (settings.POKEAPI["MAX_RETRIES"] + 1)
+
+        report = PokemonMirror(concurrency=1, rate_limit=0).crawl(full=True)
+
+        assert report["failed"] == 1
+        crawl = models.PokemonMirrorCrawl.objects.get()
+        assert crawl.finished_at is None
+
+        report = PokemonMirror(rate_limit=0).crawl(full=True)
+
+        assert report == {
+            "pending": 1,
+            "fetched": 1,
+            "missing": 0,
+            "failed": 0,
+        }
+        crawl.refresh_from_db()
+        assert crawl.finished_at is not None
+        assert models.PokemonMirrorEntry.objects.count() == stub_pokeapi.count
+
+    def test_revalidates_cached_details(self, stub_pokeapi, pokemon_catalog):
+        PokemonApi().get_pokemon_by_id(1)
+        requests = stub_pokeapi.requests
+        start = timezone.now()
+
+        report = PokemonMirror(rate_limit=0).crawl()
+
+        assert report["fetched"] == stub_pokeapi.count
+        assert stub_pokeapi.requests - requests == stub_pokeapi.count
+        assert stub_pokeapi.not_modified == 1
+        entry = models.PokemonMirrorEntry.objects.get(pokeapi_id=1)
+        assert entry.fetched_at >= start
+        assert entry.fetched_at.timestamp() == pytest.approx(
+            UpstreamCache().get(f"{stub_pokeapi.base_uri}pokemon/1")[
+                "fetched_at"
+            ]
+        )
+
+    def test_drops_missing_and_changed_entries(
+        self, stub_pokeapi, pokemon_catalog
+    ):
+        PokemonMirror(rate_limit=0).crawl()
+        cache.clear()
+        TieredCache.reset()
+        rendered_cache = RenderedCache()
+        for pokeapi_id in (1, 2, stub_pokeapi.count):
+            rendered_cache.set(pokeapi_id, b"{}", None)
+        models.PokemonMirrorEntry.objects.filter(pokeapi_id=1).update(
+            content_hash="outdated"
+        )
+        stub_pokeapi.count -= 1
+
+        report = PokemonMirror(rate_limit=0).crawl(full=True)
+
+        assert report["missing"] == 1
+        assert PokemonMirror.get(stub_pokeapi.count + 1) is None
+        assert rendered_cache.get(1) is None
+        assert rendered_cache.get(2) == b"{}"
+        assert rendered_cache.get(stub_pokeapi.count + 1) is None
+
+    def test_retrieve_reads_the_mirror(
+        self, api_client, stub_pokeapi, pokemon_catalog
+    ):
+        PokemonMirror(rate_limit=0).crawl()
+        cache.clear()
+        TieredCache.reset()
+        requests = stub_pokeapi.requests
+
+        response = api_client.get("/api/v1/pokemon/5/")
+
+        assert response.status_code == 200
+        assert response.json() == PokemonMirror.get(5)
+        assert stub_pokeapi.requests == requests
+
+    def test_get_ignores_non_numeric_ids(self):
+        assert PokemonMirror.get("bulbasaur") is None
+
+
+class TestRateLimiter:
+    def test_spaces_out_calls(self):
+        limiter = RateLimiter(50)
+
+        start = timezone.now()
+        for _ in range(6):
+            limiter.wait()
+
+        assert timezone.now() - start >= timedelta(seconds=0.1)
+
+
+@pytest.mark.django_db
+class TestMirrorPokemonCommand:
+    def test_mirrors_pokemon(self, capsys, stub_pokeapi, pokemon_catalog):
+        call_command("mirror_pokemon", "--rate-limit", "0")
+
+        out = capsys.readouterr().out
+        assert f"Mirrored {stub_pokeapi.count} of" in out
+        assert models.PokemonMirrorEntry.objects.count() == stub_pokeapi.count
+
+    def test_requires_the_catalog(self):
+        with pytest.raises(CommandError, match="sync_pokemon_catalog"):
+            call_command("mirror_pokemon")
@@ -0,0 +1,169 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection, migrations
+from django.db.migrations.executor import MigrationExecutor
+from django.db.migrations.loader import MigrationLoader
+
+from apps.wrapper import models
+from apps.wrapper.serializers import PokemonUpdateSerializer
+
+
+def serialized(pokeapi_id):
+    pokemon = models.Pokemon.objects.get(pokeapi_id=pokeapi_id)
+    return pokemon.snapshot, PokemonUpdateSerializer.serialize(pokemon)
+
+
+@pytest.fixture
+def migrate(transactional_db):
+    def run(target):
+        executor = MigrationExecutor(connection)
+        executor.migrate([("wrapper", target)])
+        return executor.loader.project_state(("wrapper", target)).apps
+
+    yield run
+    call_command("migrate", verbosity=0)
+
+
+@pytest.mark.django_db
+class TestPokemonSnapshot:
+    def test_writes_keep_the_snapshot(
+        self, api_client, stub_pokeapi, pokemon_params
+    ):
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        snapshot, data = serialized(1)
+        assert snapshot == data
+
+        pokemon_params["name"] = "renamed"
+        pokemon_params["types"] = []
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        snapshot, data = serialized(1)
+        assert snapshot == data
+        assert snapshot["name"] == "renamed"
+
+    def test_slots_are_listed_in_order(
+        self, api_client, stub_pokeapi, pokemon_params
+    ):
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        first, third = pokemon_params["abilities"]
+        pokemon_params["abilities"] = [dict(third, is_hidden=False), first]
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+
+        snapshot, data = serialized(1)
+
+        assert snapshot == data
+        assert [row["slot"] for row in snapshot["abilities"]] == [1, 3]
+
+    def test_details_are_read_from_the_snapshot(
+        self, api_client, stub_pokeapi, pokemon_params
+    ):
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        models.Pokemon.objects.update(snapshot={"id": 1, "name": "snapshot"})
+
+        response = api_client.get("/api/v1/pokemon/1/?fields=name")
+
+        assert response.data == {"name": "snapshot"}
+
+    def test_overrides_without_snapshot(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_params,
+        django_assert_num_queries,
+    ):
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        snapshot, _ = serialized(1)
+        models.Pokemon.objects.update(snapshot=None)
+
+        # The snapshot, then the Pokemon with its relations
+        with django_assert_num_queries(4):
+            response = api_client.get("/api/v1/pokemon/1/")
+
+        assert response.data == snapshot
+
+    def test_updates_keep_unchanged_children(
+        self, api_client, stub_pokeapi, pokemon_params
+    ):
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        pokemon = models.Pokemon.objects.get(pokeapi_id=1)
+        abilities = set(pokemon.ability_slots.values_list("pk", flat=True))
+        types = set(pokemon.type_slots.values_list("pk", flat=True))
+
+        pokemon_params["abilities"] = pokemon_params["abilities"][:1]
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+
+        assert (
+            set(pokemon.ability_slots.values_list("pk", flat=True)) < abilities
+        )
+        assert set(pokemon.type_slots.values_list("pk", flat=True)) == types
+        assert models.PokemonAbilitySlot.objects.count() == 1
+        snapshot, data = serialized(1)
+        assert snapshot == data
+
+    def test_abilities_and_types_are_shared(
+        self, api_client, stub_pokeapi, pokemon_params
+    ):
+        api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        pokemon_params["name"] = "ivysaur"
+        api_client.put("/api/v1/pokemon/2/", pokemon_params)
+
+        assert models.PokemonAbility.objects.count() == 2
+        assert models.PokemonType.objects.count() == 2
+        assert models.PokemonAbilitySlot.objects.count() == 4
+        assert (
+            models.Pokemon.objects.filter(types__type__name="grass").count()
+            == 2
+        )
+        assert serialized(2)[0]["abilities"] == serialized(1)[0]["abilities"]
+
+
+class TestPokemonMigrations:
+    def test_rows_are_shared_in_their_own_migration(self):
+        # PostgreSQL can't alter a table with foreign key checks still
+        # pending in the same transaction
+        migration = MigrationLoader(None).get_migration(
+            "wrapper", "0008_share_ability_and_type_rows"
+        )
+
+        assert all(
+            isinstance(operation, migrations.RunPython)
+            for operation in migration.operations
+        )
+
+    def test_backfill_and_sharing(self, migrate, pokemon_params):
+        old_apps = migrate("0004_pokemoncatalogentry")
+        Pokemon = old_apps.get_model("wrapper", "Pokemon")
+        PokemonAbility = old_apps.get_model("wrapper", "PokemonAbility")
+        PokemonSprite = old_apps.get_model("wrapper", "PokemonSprite")
+        PokemonType = old_apps.get_model("wrapper", "PokemonType")
+        for pokeapi_id in (1, 2):
+            pokemon = Pokemon.objects.create(
+                pokeapi_id=pokeapi_id,
+                name=pokemon_params["name"],
+                sprites=PokemonSprite.objects.create(
+                    **pokemon_params["sprites"]
+                ),
+            )
+            pokemon.abilities.set([
+                PokemonAbility.objects.create(**ability)
+                for ability in pokemon_params["abilities"]
+            ])
+            pokemon.types.set([
+                PokemonType.objects.create(**type)
+                for type in pokemon_params["types"]
+            ])
+
+        migrate("0005_pokemon_snapshot")
+        call_command("migrate", verbosity=0)
+
+        assert models.PokemonAbility.objects.count() == 2
+        assert models.PokemonType.objects.count() == 2
+        for pokeapi_id in (1, 2):
+            snapshot, data = serialized(pokeapi_id)
+            assert snapshot == data
+            assert [
+                (ability["slot"], ability["is_hidden"])
+                for ability in snapshot["abilities"]
+            ] == [
+                (ability["slot"], ability["is_hidden"])
+                for ability in pokemon_params["abilities"]
+            ]
@@ -0,0 +1,98 @@
+import json
+import time
+
+import pytest
+
+from apps.wrapper.classes.metrics import Metrics
+from apps.wrapper.classes.rendered_cache import RenderedCache
+from apps.wrapper.responses import RenderedResponse
+
+
+class TestRenderedResponse:
+    def test_data_is_parsed_on_first_access(self):
+        response = RenderedResponse(b'{"id": 1}')
+
+        assert response._data is None
+        assert response.rendered_content == b'{"id": 1}'
+        assert response.data == {"id": 1}
+
+
+@pytest.mark.django_db
+class TestRenderedCache:
+    def test_details_are_rendered_once(
+        self, api_client, stub_pokeapi, monkeypatch
+    ):
+        first = api_client.get("/api/v1/pokemon/1/")
+        requests = stub_pokeapi.requests
+
+        def render(data):
+            raise AssertionError("The detail was rendered again")
+
+        monkeypatch.setattr(RenderedCache, "render", render)
+        second = api_client.get("/api/v1/pokemon/1/")
+
+        assert second.content == first.content
+        assert stub_pokeapi.requests == requests
+        assert Metrics.snapshot()["tiered.rendered.l1.hit"] == 1
+
+    def test_missing_details_are_not_cached(self, api_client, stub_pokeapi):
+        response = api_client.get("/api/v1/pokemon/9999/")
+
+        assert response.status_code == 404
+        assert RenderedCache().get(9999) is None
+
+    def test_non_ascii_digit_ids_are_not_found(self, api_client, stub_pokeapi):
+        response = api_client.get("/api/v1/pokemon/%C2%B2/")
+
+        assert response.status_code == 404
+        assert RenderedCache().key("\u00b2") is None
+
+    def test_writes_replace_the_detail(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_params,
+        django_capture_on_commit_callbacks,
+    ):
+        api_client.get("/api/v1/pokemon/1/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        assert response.status_code in (200, 201)
+        cached = json.loads(RenderedCache().get(1))
+        response = api_client.get("/api/v1/pokemon/1/")
+
+        assert cached["name"] == pokemon_params["name"]
+        assert response.data["name"] == pokemon_params["name"]
+
+    def test_list_pages_are_served_rendered(
+        self, api_client, stub_pokeapi, pokemon_catalog
+    ):
+        first = api_client.get("/api/v1/pokemon/?limit=5")
+        second = api_client.get("/api/v1/pokemon/?limit=5")
+
+        assert isinstance(second, RenderedResponse)
+        assert second.content == first.content
+        assert len(second.data["results"]) == 5
+
+    def test_late_stale_details_expire(
+        self,
+        settings,
+        api_client,
+        stub_pokeapi,
+        pokemon_params,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.RENDERED_CACHE = {"OVERRIDE_TTL": 1}
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.put("/api/v1/pokemon/1/", pokemon_params)
+        # A reader that read the snapshot before the write stores it after
+        RenderedCache().set(
+            1, b'{"name": "stale"}', RenderedCache.override_timeout()
+        )
+        assert api_client.get("/api/v1/pokemon/1/").data["name"] == "stale"
+
+        time.sleep(1.1)
+
+        response = api_client.get("/api/v1/pokemon/1/")
+        assert response.data["name"] == pokemon_params["name"]
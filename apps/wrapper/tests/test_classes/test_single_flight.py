@@ -0,0 +1,141 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import async_to_sync
+
+from apps.wrapper.classes.async_pokemon_api import AsyncPokemonApi
+from apps.wrapper.classes.metrics import Metrics
+from apps.wrapper.classes.pokemon_api import PokemonApi
+from apps.wrapper.classes.single_flight import SingleFlight
+from apps.wrapper.classes.upstream_cache import UpstreamCache
+
+
+class TestSingleFlight:
+    def test_concurrent_threads_share_one_request(self, stub_pokeapi):
+        stub_pokeapi.latency = 0.2
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda _: PokemonApi().get_pokemon_list(20, 0), range(8)
+                )
+            )
+
+        assert stub_pokeapi.requests == 1
+        assert all(result == results[0] for result in results)
+        assert Metrics.snapshot()["singleflight.coalesced"] == 7
+
+    def test_waiting_callers_get_a_copy(self, stub_pokeapi):
+        stub_pokeapi.latency = 0.2
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first, second = executor.map(
+                lambda _: PokemonApi().get_pokemon_by_id(1), range(2)
+            )
+
+        assert first == second
+        assert first is not second
+
+    def test_concurrent_tasks_share_one_request(self, stub_pokeapi):
+        stub_pokeapi.latency = 0.2
+
+        async def fetch_all():
+            api = AsyncPokemonApi()
+            try:
+                return await asyncio.gather(
+                    *(api.get_pokemon_by_id(1) for _ in range(8))
+                )
+            finally:
+                await AsyncPokemonApi.close_client()
+
+        results = async_to_sync(fetch_all)()
+
+        assert stub_pokeapi.requests == 1
+        assert all(result["id"] == 1 for result in results)
+        assert Metrics.snapshot()["singleflight.coalesced"] == 7
+
+    def test_waiting_tasks_survive_a_cancelled_leader(self, stub_pokeapi):
+        stub_pokeapi.latency = 0.3
+
+        async def fetch_all():
+            api = AsyncPokemonApi()
+            try:
+                leader = asyncio.create_task(api.get_pokemon_by_id(1))
+                await asyncio.sleep(0.05)
+                waiters = [
+                    asyncio.create_task(api.get_pokemon_by_id(1))
+                    for _ in range(3)
+                ]
+                await asyncio.sleep(0.05)
+                leader.cancel()
+                return await asyncio.wait_for(asyncio.gather(*waiters), 5)
+            finally:
+                await AsyncPokemonApi.close_client()
+
+        results = async_to_sync(fetch_all)()
+
+        assert all(result["id"] == 1 for result in results)
+
+    def test_waits_for_another_worker(self, stub_pokeapi):
+        # Test that a worker reuses the result another worker is fetching
+        api = PokemonApi()
+        endpoint = f"{api.BASE_URI}pokemon/1"
+        upstream_cache = UpstreamCache()
+        single_flight = SingleFlight()
+        single_flight._cache.add(single_flight.lock_key(endpoint), 1)
+
+        def other_worker():
+            entry = upstream_cache.build_entry("pokemon", {"id": 1})
+            upstream_cache.set(endpoint, entry)
+            single_flight._cache.delete(single_flight.lock_key(endpoint))
+
+        timer = threading.Timer(0.2, other_worker)
+        timer.start()
+        data = api.get_pokemon_by_id(1)
+        timer.join()
+
+        assert data == {"id": 1}
+        assert stub_pokeapi.requests == 0
+        assert Metrics.snapshot()["singleflight.coalesced_remote"] == 1
+
+    def test_waits_for_another_worker_to_revalidate(
+        self, settings, stub_pokeapi
+    ):
+        # Test that a worker holding a stale entry in its L1 reuses the entry
+        # another worker refreshes in the shared cache
+        api = PokemonApi()
+        endpoint = f"{api.BASE_URI}pokemon/1"
+        upstream_cache = UpstreamCache()
+        single_flight = SingleFlight()
+        stale = upstream_cache.build_entry("pokemon", {"id": 1})
+        stale["expires_at"] -= settings.POKEAPI["CACHE_TTL"]["pokemon"] + 1
+        upstream_cache.set(endpoint, stale)
+        single_flight._cache.add(single_flight.lock_key(endpoint), 1)
+
+        def other_worker():
+            entry = upstream_cache.build_entry("pokemon", {"id": 1, "new": 1})
+            single_flight._cache.set(
+                upstream_cache.key(endpoint),
+                entry,
+                upstream_cache.timeout(entry),
+            )
+            single_flight._cache.delete(single_flight.lock_key(endpoint))
+
+        timer = threading.Timer(0.2, other_worker)
+        timer.start()
+        data = api.get_pokemon_by_id(1)
+        timer.join()
+
+        assert data == {"id": 1, "new": 1}
+        assert stub_pokeapi.requests == 0
+        assert Metrics.snapshot()["singleflight.coalesced_remote"] == 1
+
+    def test_metrics_are_shared(self, api_client):
+        Metrics.incr("singleflight.coalesced", 3)
+        Metrics.reset()
+        Metrics.incr("singleflight.coalesced", 2)
+
+        response = api_client.get("/api/v1/metrics/")
+
+        assert response.status_code == 200
+        assert response.data["process"]["singleflight.coalesced"] == 2
+        assert response.data["shared"]["singleflight.coalesced"] == 5
@@ -0,0 +1,89 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+
+from apps.wrapper.classes.metrics import Metrics
+from apps.wrapper.classes.tiered_cache import TieredCache
+
+
+@pytest.fixture
+def tiered_settings(settings):
+    settings.TIERED_CACHE = {
+        **settings.TIERED_CACHE,
+        "L1_MAX_BYTES": 1024,
+        "INVALIDATION_POLL_INTERVAL": 0,
+        "INVALIDATION_LOG_SIZE": 2,
+    }
+    TieredCache.reset()
+    return settings
+
+
+def other_worker_writes(key, value):
+    """
+    Writes to L2 and to the invalidation log, as another worker would.
+    """
+    cache.set(key, value)
+    TieredCache("default", "other")._broadcast(key)
+
+
+class TestTieredCache:
+    def test_reads_fill_l1(self, tiered_settings):
+        cache.set("key", {"a": 1})
+        tiered = TieredCache("default", "test")
+
+        assert tiered.get("key") == {"a": 1}
+        assert tiered.get("key") == {"a": 1}
+        assert tiered.get("missing", "default") == "default"
+        metrics = Metrics.snapshot()
+        assert metrics["tiered.test.l1.hit"] == 1
+        assert metrics["tiered.test.l1.miss"] == 2
+        assert metrics["tiered.test.l2.hit"] == 1
+        assert metrics["tiered.test.l2.miss"] == 1
+
+    def test_l1_returns_copies(self, tiered_settings):
+        tiered = TieredCache("default", "test")
+        tiered.set("key", {"a": 1}, 60)
+
+        tiered.get("key")["a"] = 2
+
+        assert tiered.get("key") == {"a": 1}
+
+    def test_l1_evicts_by_size(self, tiered_settings):
+        tiered = TieredCache("default", "test", broadcast=False)
+        for key in ("first", "second", "third"):
+            tiered.set(key, "x" * 400, 60)
+
+        assert TieredCache.l1().size <= 1024
+        assert TieredCache.l1().get("first") is None
+        assert TieredCache.l1().get("third") is not None
+        assert tiered.get("first") == "x" * 400
+
+    def test_writes_invalidate_other_workers(self, tiered_settings):
+        tiered = TieredCache("default", "test")
+        tiered.set("key", "old", 60)
+        tiered.get("other")
+
+        other_worker_writes("key", "new")
+
+        assert tiered.get("key") == "new"
+
+    def test_l1_is_dropped_when_behind(self, tiered_settings):
+        tiered = TieredCache("default", "test")
+        tiered.set("key", "old", 60)
+        tiered.get("key")
+        cache.set("key", "new")
+
+        for other_key in ("a", "b", "c"):
+            other_worker_writes(other_key, 1)
+
+        assert tiered.get("key") == "new"
+
+    def test_async(self, tiered_settings):
+        tiered = TieredCache("default", "test")
+
+        async def roundtrip():
+            await tiered.aset("key", [1, 2], 60)
+            return await tiered.aget("key")
+
+        assert async_to_sync(roundtrip)() == [1, 2]
+        assert Metrics.snapshot()["tiered.test.l1.hit"] == 1
@@ -4,6 +4,7 @@ import pytest
 
 
 @pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures("pokemon_catalog")
 class TestPokemonApiV1List:
     def test_pokemon_list(self, api_client):
         # Test that the list endpoint returns a list of pokemons
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+
+from apps.wrapper.classes.async_pokemon_api import AsyncPokemonApi
+
+
+@pytest.fixture
+def async_client(settings, stub_pokeapi):
+    settings.ROOT_URLCONF = "config.urls_asgi"
+    return AsyncClient()
+
+
+async def fetch_all(async_client, urls):
+    try:
+        return await asyncio.gather(*(async_client.get(url) for url in urls))
+    finally:
+        await AsyncPokemonApi.close_client()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPokemonAsyncApiV1:
+    def test_pokemon_list(self, async_client, stub_pokeapi, pokemon_catalog):
+        (response,) = async_to_sync(fetch_all)(
+            async_client, ["/api/v1/pokemon/?offset=10&limit=5"]
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == stub_pokeapi.count
+        assert len(data["results"]) == 5
+        assert data["results"][0]["name"] == stub_pokeapi.name(11)
+        assert "/api/v1/pokemon/11/" in data["results"][0]["url"]
+
+    def test_pokemon_export(self, async_client, stub_pokeapi, pokemon_catalog):
+        async def export():
+            response = await async_client.get(
+                "/api/v1/pokemon/export/?output=ndjson"
+            )
+            return [chunk async for chunk in response.streaming_content]
+
+        chunks = async_to_sync(export)()
+
+        lines = b"".join(chunks).decode().splitlines()
+        assert len(lines) == stub_pokeapi.count
+
+    def test_pokemon_retrieve(self, async_client):
+        (response,) = async_to_sync(fetch_all)(
+            async_client, ["/api/v1/pokemon/4/"]
+        )
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "charmander"
+
+    def test_pokemon_batch(self, async_client, stub_pokeapi):
+        (response,) = async_to_sync(fetch_all)(
+            async_client,
+            [f"/api/v1/pokemon/batch/?ids=4,{stub_pokeapi.count + 1},1"],
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [(entry["id"], entry["status"]) for entry in results] == [
+            (4, 200),
+            (stub_pokeapi.count + 1, 404),
+            (1, 200),
+        ]
+        assert results[0]["detail"]["name"] == "charmander"
+
+    def test_pokemon_retrieve_not_modified(self, async_client):
+        async def retrieve():
+            try:
+                response = await async_client.get("/api/v1/pokemon/4/")
+                return await async_client.get(
+                    "/api/v1/pokemon/4/",
+                    headers={"If-None-Match": response["ETag"]},
+                )
+            finally:
+                await AsyncPokemonApi.close_client()
+
+        response = async_to_sync(retrieve)()
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_pokemon_retrieve_not_found(self, async_client):
+        (response,) = async_to_sync(fetch_all)(
+            async_client, ["/api/v1/pokemon/999/"]
+        )
+
+        assert response.status_code == 404
+
+    def test_concurrent_retrieves_share_the_worker(
+        self, async_client, stub_pokeapi
+    ):
+        # Test that slow upstream calls are awaited concurrently
+        async_to_sync(fetch_all)(async_client, ["/api/v1/pokemon/1/"])
+        stub_pokeapi.latency = 0.2
+        urls = [f"/api/v1/pokemon/{pk}/" for pk in range(1, 11)]
+
+        start = time.perf_counter()
+        responses = async_to_sync(fetch_all)(async_client, urls)
+        elapsed = time.perf_counter() - start
+
+        assert [r.json()["id"] for r in responses] == list(range(1, 11))
+        assert elapsed < 10 * stub_pokeapi.latency / 2
+
+    def test_clients_are_closed_with_their_loop(self, stub_pokeapi):
+        async def fetch(pokeapi_id):
+            await AsyncPokemonApi().get_pokemon_by_id(pokeapi_id)
+            return await AsyncPokemonApi.get_client()
+
+        first = async_to_sync(fetch)(1)
+        second = async_to_sync(fetch)(2)
+
+        assert first is not second
+        assert first.is_closed and second.is_closed
+        assert AsyncPokemonApi._clients == {}
+
+    def test_modified_pokemon_retrieve(
+        self, async_client, db_pokemon, pokemon_params
+    ):
+        (response,) = async_to_sync(fetch_all)(
+            async_client, ["/api/v1/pokemon/1/"]
+        )
+
+        assert response.status_code == 200
+        assert response.json()["name"] == pokemon_params["name"]
+
+    def test_pokemon_import(self, async_client, pokemon_params):
+        async def bulk_import():
+            return await async_client.post(
+                "/api/v1/pokemon/import/",
+                json.dumps(pokemon_params),
+                content_type="application/x-ndjson",
+            )
+
+        response = async_to_sync(bulk_import)()
+
+        assert response.status_code == 200
+        assert response.json()["created"] == 1
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+
+from apps.wrapper.classes.async_pokemon_api import AsyncPokemonApi
+from apps.wrapper.classes.pokemon_api import PokemonApi
+from apps.wrapper.classes.pokemon_api_wrapper import PokemonApiWrapper
+from apps.wrapper.classes.pokemon_mirror import PokemonMirror
+
+
+@pytest.fixture
+def in_flight(settings, monkeypatch):
+    """
+    Limits batches to 2 concurrent PokeAPI requests, and records the peak
+    number of requests in flight, each taking 50 ms.
+    """
+    settings.POKEMON_BATCH = {**settings.POKEMON_BATCH, "CONCURRENCY": 2}
+    PokemonApiWrapper.close_batch_executor()
+    PokemonApiWrapper._batch_semaphores.clear()
+    counts = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def enter():
+        with lock:
+            counts["now"] += 1
+            counts["peak"] = max(counts["peak"], counts["now"])
+
+    def leave():
+        with lock:
+            counts["now"] -= 1
+
+    def get_pokemon_by_id(self, pokeapi_id):
+        enter()
+        time.sleep(0.05)
+        leave()
+        return {}
+
+    async def aget_pokemon_by_id(self, pokeapi_id):
+        enter()
+        await asyncio.sleep(0.05)
+        leave()
+        return {}
+
+    monkeypatch.setattr(PokemonApi, "get_pokemon_by_id", get_pokemon_by_id)
+    monkeypatch.setattr(
+        AsyncPokemonApi, "get_pokemon_by_id", aget_pokemon_by_id
+    )
+    monkeypatch.setattr(
+        PokemonApiWrapper,
+        "stored_pokemons",
+        classmethod(lambda cls, pokeapi_ids, selection: {}),
+    )
+    yield counts
+    PokemonApiWrapper.close_batch_executor()
+
+
+def batch_wrapper():
+    return PokemonApiWrapper(RequestFactory().get("/api/v1/pokemon/batch/"))
+
+
+@pytest.mark.django_db
+class TestPokemonBatchApiV1:
+    def test_batch(self, api_client, stub_pokeapi, pokemon_params):
+        pokemon_params["name"] = "local-charmander"
+        api_client.put("/api/v1/pokemon/4/", pokemon_params, format="json")
+
+        response = api_client.get(
+            f"/api/v1/pokemon/batch/?ids=7,4,{stub_pokeapi.count + 1},7,1"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 4
+        assert [
+            (entry["id"], entry["status"]) for entry in data["results"]
+        ] == [(7, 200), (4, 200), (stub_pokeapi.count + 1, 404), (1, 200)]
+        details = [entry["detail"] for entry in data["results"]]
+        assert details[0]["name"] == stub_pokeapi.name(7)
+        assert details[1]["name"] == "local-charmander"
+        assert details[2] is None
+        assert details[3]["name"] == stub_pokeapi.name(1)
+        assert stub_pokeapi.requests == 3
+
+    def test_batch_reads_the_mirror(
+        self, api_client, stub_pokeapi, pokemon_catalog
+    ):
+        PokemonMirror(rate_limit=0).crawl()
+        requests = stub_pokeapi.requests
+
+        response = api_client.get("/api/v1/pokemon/batch/?ids=1,2,3")
+
+        assert [entry["detail"] for entry in response.json()["results"]] == [
+            PokemonMirror.get(pokeapi_id) for pokeapi_id in (1, 2, 3)
+        ]
+        assert stub_pokeapi.requests == requests
+
+    def test_batch_field_selection(self, api_client, stub_pokeapi):
+        response = api_client.get(
+            "/api/v1/pokemon/batch/?ids=1,2&fields=id,name"
+        )
+
+        assert [entry["detail"] for entry in response.json()["results"]] == [
+            {"id": 1, "name": stub_pokeapi.name(1)},
+            {"id": 2, "name": stub_pokeapi.name(2)},
+        ]
+
+    def test_batch_upstream_unavailable(
+        self, settings, api_client, stub_pokeapi
+    ):
+        stub_pokeapi.failures = [503] * (settings.POKEAPI["MAX_RETRIES"] + 1)
+
+        response = api_client.get("/api/v1/pokemon/batch/?ids=1")
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"id": 1, "status": 503, "detail": None}
+        ]
+
+    @pytest.mark.parametrize(
+        "ids", ["", "1,bulbasaur", "0", "1,,-2", "%C2%B2", "1,%D9%A3"]
+    )
+    def test_batch_invalid_ids(self, api_client, stub_pokeapi, ids):
+        response = api_client.get(f"/api/v1/pokemon/batch/?ids={ids}")
+
+        assert response.status_code == 400
+        assert "ids" in response.json()
+
+    def test_batch_too_many_ids(self, settings, api_client, stub_pokeapi):
+        settings.POKEMON_BATCH = {**settings.POKEMON_BATCH, "MAX_IDS": 2}
+
+        response = api_client.get("/api/v1/pokemon/batch/?ids=1,2,3")
+
+        assert response.status_code == 400
+
+
+class TestPokemonBatchConcurrency:
+    def test_threads_are_shared_by_batches(self, in_flight):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: batch_wrapper().batch("1,2,3,4"), range(4)
+                )
+            )
+
+        assert in_flight["peak"] == 2
+        assert all(response.data["count"] == 4 for response in responses)
+
+    def test_tasks_are_shared_by_batches(self, in_flight):
+        async def batches():
+            return await asyncio.gather(
+                *(batch_wrapper().abatch("1,2,3,4") for _ in range(4))
+            )
+
+        responses = async_to_sync(batches)()
+
+        assert in_flight["peak"] == 2
+        assert all(response.data["count"] == 4 for response in responses)
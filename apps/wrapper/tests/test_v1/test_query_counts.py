@@ -0,0 +1,148 @@
+import copy
+
+import pytest
+
+
+@pytest.fixture
+def pokemon_with_abilities(pokemon_params):
+    def build(count):
+        params = copy.deepcopy(pokemon_params)
+        params["abilities"] = [
+            dict(params["abilities"][0], slot=slot)
+            for slot in range(1, count + 1)
+        ]
+        return params
+
+    return build
+
+
+@pytest.mark.django_db
+class TestPokemonApiV1QueryCounts:
+    @pytest.mark.parametrize("abilities", [1, 5])
+    def test_create(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_with_abilities,
+        django_assert_num_queries,
+        abilities,
+    ):
+        # The shared abilities and types are inserted too
+        with django_assert_num_queries(20):
+            response = api_client.put(
+                "/api/v1/pokemon/1/", pokemon_with_abilities(abilities)
+            )
+
+        assert response.status_code == 201
+
+        # The shared abilities and types are only read from then on
+        with django_assert_num_queries(16):
+            response = api_client.put(
+                "/api/v1/pokemon/2/", pokemon_with_abilities(abilities)
+            )
+
+        assert response.status_code == 201
+
+    @pytest.mark.parametrize(
+        "abilities, queries",
+        [
+            # Two abilities are dropped
+            (1, 11),
+            # Two abilities are added
+            (5, 12),
+        ],
+    )
+    def test_update(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_with_abilities,
+        django_assert_num_queries,
+        abilities,
+        queries,
+    ):
+        api_client.put("/api/v1/pokemon/1/", pokemon_with_abilities(3))
+
+        with django_assert_num_queries(queries):
+            response = api_client.put(
+                "/api/v1/pokemon/1/", pokemon_with_abilities(abilities)
+            )
+
+        assert response.status_code == 200
+        assert len(response.data["abilities"]) == abilities
+
+    def test_update_name(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_with_abilities,
+        django_assert_num_queries,
+    ):
+        params = pokemon_with_abilities(3)
+        api_client.put("/api/v1/pokemon/1/", params)
+        params["name"] = "renamed"
+
+        # Abilities and types are read to be compared, then only the Pokemon
+        # and its catalog entry are written
+        with django_assert_num_queries(10):
+            response = api_client.put("/api/v1/pokemon/1/", params)
+
+        assert response.data["name"] == "renamed"
+
+    def test_unchanged_update(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_with_abilities,
+        django_assert_num_queries,
+    ):
+        params = pokemon_with_abilities(3)
+        api_client.put("/api/v1/pokemon/1/", params)
+
+        # Only the lookup of the Pokemon, and the savepoint of the write
+        with django_assert_num_queries(3):
+            response = api_client.put("/api/v1/pokemon/1/", params)
+
+        assert response.status_code == 200
+        assert response.data["id"] == 1
+        assert response.data["name"] == params["name"]
+
+    @pytest.mark.parametrize("abilities", [1, 5])
+    def test_retrieve(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_with_abilities,
+        django_assert_num_queries,
+        abilities,
+    ):
+        api_client.put("/api/v1/pokemon/1/", pokemon_with_abilities(abilities))
+
+        # The snapshot of the Pokemon
+        with django_assert_num_queries(1):
+            response = api_client.get("/api/v1/pokemon/1/")
+        assert len(response.data["abilities"]) == abilities
+
+        # The rendered detail is cached from then on
+        with django_assert_num_queries(0):
+            api_client.get("/api/v1/pokemon/1/")
+
+    def test_batch(
+        self,
+        api_client,
+        stub_pokeapi,
+        pokemon_with_abilities,
+        django_assert_num_queries,
+    ):
+        for pokeapi_id in (1, 2):
+            api_client.put(
+                f"/api/v1/pokemon/{pokeapi_id}/", pokemon_with_abilities(2)
+            )
+
+        # The overrides, then the mirror entries of the rest
+        with django_assert_num_queries(2):
+            response = api_client.get("/api/v1/pokemon/batch/?ids=1,2,3,4")
+
+        assert [entry["status"] for entry in response.data["results"]] == [
+            200
+        ] * 4
@@ -0,0 +1,226 @@
+from asgiref.sync import sync_to_async
+from django.views import View
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
+
+from apps.wrapper.classes.metrics import Metrics
+from apps.wrapper.classes.pokemon_api_wrapper import PokemonApiWrapper
+from apps.wrapper.viewsets import PokemonViewSet
+
+
+class PokemonAsyncView(View):
+    """
+    An async view that serves the `list` and `retrieve` operations of
+    `PokemonViewSet` under ASGI.
+
+    GET requests wait on PokeAPI through `AsyncPokemonApi`, so a single worker
+    can keep many of them in flight. Any other method is handed over to
+    `PokemonViewSet`, which keeps create and update behaving as under WSGI.
+
+    Attributes:
+        viewset_actions: The actions of `PokemonViewSet` used for the methods
+                         that aren't served asynchronously.
+    """
+
+    viewset_actions = {}
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """
+        Returns the view function, exempted from CSRF checks as
+        `PokemonViewSet` is.
+        """
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    @staticmethod
+    def render(response: Response) -> Response:
+        """
+        Renders a DRF response built outside of an `APIView`.
+
+        Args:
+            response (Response): The response to render.
+
+        Returns:
+            Response: The rendered response.
+        """
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        response.accepted_renderer = renderer
+        response.accepted_media_type = renderer.media_type
+        response.renderer_context = {}
+        return response.render()
+
+    def throttled(self, request) -> bool:
+        """
+        Checks the request against the default throttles of the API.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            bool: Whether the request must be rejected.
+        """
+        return not all(
+            throttle().allow_request(request, self)
+            for throttle in api_settings.DEFAULT_THROTTLE_CLASSES
+        )
+
+    @staticmethod
+    def throttled_response() -> Response:
+        """
+        Builds the response of a throttled request.
+
+        Returns:
+            Response: The 429 response.
+        """
+        return Response(
+            {"detail": "Request was throttled."},
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+
+    async def delegate(self, request, *args, **kwargs):
+        """
+        Hands the request over to `PokemonViewSet`.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Response: The response of `PokemonViewSet`.
+        """
+        view = PokemonViewSet.as_view(self.viewset_actions)
+        return await sync_to_async(view)(request, *args, **kwargs)
+
+    async def get(self, request, *args, **kwargs):
+        if await sync_to_async(self.throttled)(request):
+            return self.render(self.throttled_response())
+        try:
+            if "pokeapi_id" in kwargs:
+                response = await self.retrieve(request, kwargs["pokeapi_id"])
+            else:
+                response = await self.list(request)
+        except APIException as error:
+            response = Response(
+                {"detail": error.detail}, status=error.status_code
+            )
+        return self.render(response)
+
+    async def list(self, request):
+        """
+        Retrieves a list of Pokemon based on the given query parameters.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            Response: A list of Pokemon objects that match the given query
+                      parameters.
+        """
+        limit, offset = PokemonApiWrapper.limit_offset(request.GET)
+        query_params = {
+            "name": request.GET.get("name", None),
+            "pokedex_id": request.GET.get("pokedex_id", None),
+        }
+        cursor = request.GET.get("cursor", None)
+        wrapper = PokemonApiWrapper(request)
+        return await wrapper.alist(query_params, limit, offset, cursor)
+
+    async def retrieve(self, request, pokeapi_id):
+        """
+        Retrieves a specific Pokemon by pokeapi_id, preferring the local
+        override over PokeAPI.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+            pokeapi_id (str): The ID of the Pokemon to retrieve.
+
+        Returns:
+            Response: The HTTP response containing the serialized Pokemon data.
+        """
+        wrapper = PokemonApiWrapper(request)
+        return await wrapper.aretrieve(pokeapi_id)
+
+    async def post(self, request, *args, **kwargs):
+        return await self.delegate(request, *args, **kwargs)
+
+    async def put(self, request, *args, **kwargs):
+        return await self.delegate(request, *args, **kwargs)
+
+    async def patch(self, request, *args, **kwargs):
+        return await self.delegate(request, *args, **kwargs)
+
+
+class PokemonExportAsyncView(PokemonAsyncView):
+    """
+    An async view that streams the export of `PokemonViewSet` under ASGI from
+    an async iterator, so the server sends it chunk by chunk instead of
+    buffering it.
+    """
+
+    http_method_names = ["get", "options"]
+
+    async def get(self, request, *args, **kwargs):
+        if await sync_to_async(self.throttled)(request):
+            return self.render(self.throttled_response())
+        wrapper = PokemonApiWrapper(request)
+        try:
+            return await wrapper.aexport(request.GET.get("output", None))
+        except APIException as error:
+            return self.render(
+                Response({"detail": error.detail}, status=error.status_code)
+            )
+
+
+class PokemonBatchAsyncView(PokemonAsyncView):
+    """
+    An async view that serves the batch retrieve of `PokemonViewSet` under
+    ASGI, waiting on PokeAPI for many Pokemon at once.
+    """
+
+    http_method_names = ["get", "options"]
+
+    async def get(self, request, *args, **kwargs):
+        if await sync_to_async(self.throttled)(request):
+            return self.render(self.throttled_response())
+        wrapper = PokemonApiWrapper(request)
+        try:
+            response = await wrapper.abatch(
+                request.GET.get(PokemonApiWrapper.IDS_PARAM, None)
+            )
+        except APIException as error:
+            response = Response(
+                {"detail": error.detail}, status=error.status_code
+            )
+        return self.render(response)
+
+
+@extend_schema(exclude=True)
+class MetricsView(APIView):
+    """
+    A view that reports the counters of the PokeAPI client, both for the
+    worker that serves the request and for every worker together.
+    """
+
+    def get(self, request, *args, **kwargs):
+        """
+        Returns the counters of the PokeAPI client.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Response: The counters of this worker and of every worker.
+        """
+        Metrics.flush()
+        return Response({
+            "process": Metrics.snapshot(), "shared": Metrics.shared_snapshot()
+        })
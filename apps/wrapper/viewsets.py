@@ -1,13 +1,34 @@
-from django.conf import settings
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.views.decorators.vary import vary_on_cookie
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema
 from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from wrapper.classes.pokemon_api_wrapper import PokemonApiWrapper
+from rest_framework.settings import api_settings
 
 from apps.wrapper import models, serializers
+from apps.wrapper.classes.pokemon_api_wrapper import PokemonApiWrapper
+from apps.wrapper.classes.pokemon_importer import PokemonImporter
+
+FIELD_SELECTION_PARAMETERS = [
+    OpenApiParameter(
+        "fields",
+        OpenApiTypes.STR,
+        OpenApiParameter.QUERY,
+        description=(
+            "Comma separated fields to return, with dots for nested ones,"
+            " e.g. `id,name,types,sprites.front_default`."
+        ),
+    ),
+    OpenApiParameter(
+        "exclude",
+        OpenApiTypes.STR,
+        OpenApiParameter.QUERY,
+        description=(
+            "Comma separated fields to leave out, with dots for nested ones,"
+            " e.g. `sprites.other,sprites.versions`."
+        ),
+    ),
+]
 
 
 @extend_schema(operation_id="pokemon")
@@ -62,10 +83,17 @@ class PokemonViewSet(
             OpenApiParameter(
                 "pokedex_id", OpenApiTypes.INT, OpenApiParameter.QUERY
             ),
+            OpenApiParameter(
+                "cursor",
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                description=(
+                    "Pages by Pokedex ID instead of by offset. Leave it empty"
+                    " for the first page and follow the `next` links."
+                ),
+            ),
         ]
     )
-    @method_decorator(cache_page(60 * 60 * 24))  # 1 day
-    @method_decorator(vary_on_cookie)
     def list(self, request, *args, **kwargs):
         """
         Retrieves a list of Pokemon based on the given query parameters.
@@ -78,18 +106,119 @@ class PokemonViewSet(
         Returns:
             A list of Pokemon objects that match the given query parameters.
         """
-        limit = int(
-            request.query_params.get(
-                "limit", settings.REST_FRAMEWORK["PAGE_SIZE"]
-            )
-        )
-        offset = int(request.query_params.get("offset", 0))
+        limit, offset = PokemonApiWrapper.limit_offset(request.query_params)
         name = request.query_params.get("name", None)
         pokedex_id = request.query_params.get("pokedex_id", None)
+        cursor = request.query_params.get("cursor", None)
         query_params = {"name": name, "pokedex_id": pokedex_id}
         wrapper = PokemonApiWrapper(request)
-        return wrapper.list(query_params, limit, offset)
+        return wrapper.list(query_params, limit, offset, cursor)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "output",
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                enum=tuple(PokemonApiWrapper.EXPORT_OUTPUTS),
+            )
+        ],
+        responses={(200, "application/json"): OpenApiTypes.OBJECT},
+    )
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request, *args, **kwargs):
+        """
+        Streams every Pokemon of the list endpoint as a JSON array, or as
+        NDJSON with `?output=ndjson`.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            StreamingHttpResponse: The catalog export.
+        """
+        wrapper = PokemonApiWrapper(request)
+        return wrapper.export(request.query_params.get("output", None))
+
+    @extend_schema(
+        request={
+            "application/json": serializers.PokemonUpdateSerializer(many=True),
+            PokemonImporter.MEDIA_TYPE_NDJSON: OpenApiTypes.STR,
+        },
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @action(detail=False, methods=["post"], url_path="import")
+    def bulk_import(self, request, *args, **kwargs):
+        """
+        Creates or updates many Pokemon at once, from a JSON array or from an
+        NDJSON body with one Pokemon per line, which is read line by line.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Response: The number of created, updated and unchanged Pokemon,
+                      and the errors of the invalid ones by their index.
+
+        Raises:
+            ValidationError: If a JSON body isn't an array.
+        """
+        importer = PokemonImporter()
+        if request.content_type.startswith(PokemonImporter.MEDIA_TYPE_NDJSON):
+            return Response(
+                importer.run(importer.ndjson(request.stream or ()))
+            )
+        if not isinstance(request.data, list):
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    "Expected a list of items but got"
+                    f" type \"{type(request.data).__name__}\"."
+                ]
+            })
+        return Response(importer.run(request.data))
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                PokemonApiWrapper.IDS_PARAM,
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                required=True,
+                description="Comma separated Pokemon IDs, e.g. `1,4,7`.",
+            ),
+            *FIELD_SELECTION_PARAMETERS,
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @action(detail=False, methods=["get"], url_path="batch")
+    def batch(self, request, *args, **kwargs):
+        """
+        Retrieves many Pokemon at once, in the order of the `ids` query
+        parameter, each with its own status code.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Response: The ID, status code and detail of each Pokemon.
+
+        Note:
+            Local overrides and mirrored details are read with a query each,
+            and the rest are requested from PokeAPI concurrently. See
+            `PokemonApiWrapper.batch`.
+        """
+        wrapper = PokemonApiWrapper(request)
+        return wrapper.batch(
+            request.query_params.get(PokemonApiWrapper.IDS_PARAM, None)
+        )
 
+    @extend_schema(parameters=FIELD_SELECTION_PARAMETERS)
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve and return a specific Pokemon instance by pokeapi_id.
@@ -103,20 +232,11 @@ class PokemonViewSet(
             Response: The HTTP response containing the serialized Pokemon data.
 
         Note:
-            This function first attempts to retrieve the Pokemon instance from
-            the querysetbased on the provided pokeapi_id. If the instance is
-            found, it is serialized andreturned as an HTTP response. If the
-            instance does not exist, the function createsan instance of
-            `PokemonApiWrapper` using the given request and invokes its
-            `retrieve` method with the pokeapi_id to get the Pokemon data
-            from the external API.
+            The local override of the Pokemon is preferred over PokeAPI, and
+            both are served from the `RenderedCache` once rendered. The
+            `fields` and `exclude` query parameters select the fields of the
+            response. See `PokemonApiWrapper.retrieve`.
         """
-        try:
-            instance = self.queryset.get(pokeapi_id=kwargs["pokeapi_id"])
-            serializer = self.get_serializer(instance)
-            return Response(serializer.data)
-        except models.Pokemon.DoesNotExist:
-            pass
         wrapper = PokemonApiWrapper(request)
         return wrapper.retrieve(kwargs["pokeapi_id"])
 
@@ -141,7 +261,10 @@ class PokemonViewSet(
         """
         request.data["id"] = kwargs["pokeapi_id"]
         try:
-            instance = self.queryset.get(pokeapi_id=kwargs["pokeapi_id"])
+            # Abilities and types are replaced, so only sprites are joined
+            instance = self.queryset.select_related("sprites").get(
+                pokeapi_id=kwargs["pokeapi_id"]
+            )
         except models.Pokemon.DoesNotExist:
             return self.create(request, *args, **kwargs)
         partial = kwargs.pop("partial", False)
@@ -0,0 +1,69 @@
+"""
+Benchmark of `CatalogMerge` with a growing number of local overrides.
+
+Up to half of the overrides rename Pokemon of the upstream index and the rest
+add new ones, so both paths of the merge are measured. The time per entry
+should stay flat as the overrides grow. Run it from the project root:
+
+    python -m benchmarks.catalog_merge --upstream 1300 --repeat 5
+"""
+
+import argparse
+import time
+
+from apps.wrapper.classes.catalog_merge import CatalogMerge
+
+
+def run(upstream: int, overrides: int, repeat: int) -> dict:
+    """
+    Merges `overrides` overrides into an index of `upstream` Pokemon.
+
+    Args:
+        upstream (int): The number of Pokemon in the upstream index.
+        overrides (int): The number of local overrides.
+        repeat (int): The number of runs, the best one is kept.
+
+    Returns:
+        dict: The best time in milliseconds, the number of merged entries and
+        the time per entry in nanoseconds.
+    """
+    index = [
+        (pokeapi_id, f"pokemon-{pokeapi_id}")
+        for pokeapi_id in range(1, upstream + 1)
+    ]
+    renamed = min(overrides // 2, upstream)
+    ids = [
+        *range(1, renamed + 1),
+        *range(upstream + 1, upstream + 1 + overrides - renamed),
+    ]
+    names = {pokeapi_id: f"override-{pokeapi_id}" for pokeapi_id in ids}
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        entries = sum(1 for _ in CatalogMerge(names).merge(iter(index)))
+        best = min(best, time.perf_counter() - start)
+    return {
+        "ms": best * 1000,
+        "entries": entries,
+        "ns_per_entry": best * 1e9 / entries,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--upstream", type=int, default=1300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'overrides':<12}{'entries':>10}{'ms':>12}{'ns/entry':>12}")
+    for overrides in (1_000, 10_000, 100_000):
+        result = run(args.upstream, overrides, args.repeat)
+        print(
+            f"{overrides:<12}{result['entries']:>10}"
+            f"{result['ms']:>12.3f}{result['ns_per_entry']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark of the orjson renderer and parser against the ones of DRF.
+
+Encodes and decodes Pokemon details shaped like PokeAPI's ones, with the full
+`sprites.other` and `sprites.versions` trees, and reports the throughput of
+each backend. Run it from the project root:
+
+    python -m benchmarks.json_backend --pokemon 100 --repeat 5
+"""
+
+import argparse
+import io
+import time
+
+import django
+from django.conf import settings
+
+from config import settings as project_settings
+
+settings.configure(REST_FRAMEWORK=project_settings.REST_FRAMEWORK)
+django.setup()
+
+# pylint: disable=wrong-import-position
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.wrapper.parsers import ORJSONParser  # noqa: E402
+from apps.wrapper.renderers import ORJSONRenderer  # noqa: E402
+from tests.stub_pokeapi import StubPokeApi  # noqa: E402
+
+
+def best(function, repeat: int) -> float:
+    """
+    Times a function.
+
+    Args:
+        function (Callable): The function to time.
+        repeat (int): The number of runs, the best one is kept.
+
+    Returns:
+        float: The best time in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run(renderer, parser, details: list, repeat: int) -> dict:
+    """
+    Encodes and decodes `details` with a renderer and a parser.
+
+    Args:
+        renderer (JSONRenderer): The renderer to measure.
+        parser (JSONParser): The parser to measure.
+        details (list): The details to encode.
+        repeat (int): The number of runs, the best one is kept.
+
+    Returns:
+        dict: The encode and decode throughput in MB/s.
+    """
+    contents = [renderer.render(data) for data in details]
+    size = sum(len(content) for content in contents) / 1e6
+    encode = best(lambda: [renderer.render(data) for data in details], repeat)
+    decode = best(
+        lambda: [parser.parse(io.BytesIO(content)) for content in contents],
+        repeat,
+    )
+    return {"encode": size / encode, "decode": size / decode}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pokemon", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stub = StubPokeApi(count=args.pokemon)
+    details = [
+        stub.full_pokemon(index) for index in range(1, args.pokemon + 1)
+    ]
+    for data in details:
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    print(f"{'backend':<10}{'encode (MB/s)':>16}{'decode (MB/s)':>16}")
+    for name, renderer, json_parser in (
+        ("stdlib", JSONRenderer(), JSONParser()),
+        ("orjson", ORJSONRenderer(), ORJSONParser()),
+    ):
+        result = run(renderer, json_parser, details, args.repeat)
+        print(f"{name:<10}{result['encode']:>16.1f}{result['decode']:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
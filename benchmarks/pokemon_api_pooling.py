@@ -0,0 +1,88 @@
+"""
+Benchmark of `PokemonApi` latency with the pooled session on and off.
+
+Runs against a local PokeAPI stub, so it measures the client side cost of
+opening connections rather than PokeAPI itself. Run it from the project root:
+
+    python -m benchmarks.pokemon_api_pooling --requests 2000 --threads 8
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+from django.conf import settings
+
+from config import settings as project_settings
+
+# The upstream cache is disabled, so every call reaches the stub
+settings.configure(
+    POKEAPI=dict(project_settings.POKEAPI, POOL_MAXSIZE=32),
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+    },
+)
+django.setup()
+
+# pylint: disable=wrong-import-position
+from apps.wrapper.classes.pokemon_api import PokemonApi  # noqa: E402
+from tests.stub_pokeapi import StubPokeApi  # noqa: E402
+
+
+def run(pooling: bool, requests: int, threads: int) -> dict:
+    """
+    Sends `requests` detail requests to a fresh stub from `threads` threads.
+
+    Args:
+        pooling (bool): Whether the shared session is used.
+        requests (int): The number of requests to send.
+        threads (int): The number of concurrent threads.
+
+    Returns:
+        dict: The latency percentiles in milliseconds and the number of TCP
+        connections the stub accepted.
+    """
+    with StubPokeApi(count=100) as stub:
+        settings.POKEAPI["BASE_URI"] = stub.base_uri
+        settings.POKEAPI["POOLING"] = pooling
+        PokemonApi.close_session()
+        api = PokemonApi()
+
+        def timed(index):
+            start = time.perf_counter()
+            api.get_pokemon_by_id(index % stub.count + 1)
+            return (time.perf_counter() - start) * 1000
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            latencies = list(executor.map(timed, range(requests)))
+        PokemonApi.close_session()
+        connections = stub.connections
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "p50": percentiles[49],
+        "p99": percentiles[98],
+        "connections": connections,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'pooling':<10}{'p50 (ms)':>12}{'p99 (ms)':>12}{'conns':>8}")
+    for pooling in (False, True):
+        result = run(pooling, args.requests, args.threads)
+        print(
+            f"{'on' if pooling else 'off':<10}"
+            f"{result['p50']:>12.3f}{result['p99']:>12.3f}"
+            f"{result['connections']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
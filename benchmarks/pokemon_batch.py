@@ -0,0 +1,113 @@
+"""
+Benchmark of the batch retrieve against a retrieve per Pokemon.
+
+Retrieves a team of Pokemon from a local PokeAPI stub that answers after a
+fixed latency, first one by one with `PokemonApiWrapper.retrieve`, as a
+client calling the detail endpoint in a row does, then at once with
+`PokemonApiWrapper.batch`. The caches are emptied before each run, so every
+Pokemon reaches the stub. Run it from the project root:
+
+    python -m benchmarks.pokemon_batch --team 12 --latency 0.05
+"""
+
+import argparse
+import time
+
+import django
+from django.conf import settings
+
+from config import settings as project_settings
+
+settings.configure(
+    INSTALLED_APPS=["apps.wrapper"],
+    ALLOWED_HOSTS=["testserver"],
+    DATABASES={
+        "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+    },
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    },
+    REST_FRAMEWORK=project_settings.REST_FRAMEWORK,
+    TIERED_CACHE=project_settings.TIERED_CACHE,
+    RENDERED_CACHE=project_settings.RENDERED_CACHE,
+    POKEAPI=dict(project_settings.POKEAPI),
+    POKEMON_LIST=project_settings.POKEMON_LIST,
+    POKEMON_BATCH=project_settings.POKEMON_BATCH,
+    HTTP_CACHE=project_settings.HTTP_CACHE,
+    COMPRESSION=project_settings.COMPRESSION,
+    USE_TZ=True,
+)
+django.setup()
+
+# pylint: disable=wrong-import-position
+from django.core.cache import cache  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+from apps.wrapper.classes.pokemon_api import PokemonApi  # noqa: E402
+from apps.wrapper.classes.pokemon_api_wrapper import (  # noqa: E402
+    PokemonApiWrapper,
+)
+from apps.wrapper.classes.tiered_cache import TieredCache  # noqa: E402
+from tests.stub_pokeapi import StubPokeApi  # noqa: E402
+
+
+def one_by_one(team: list) -> float:
+    """
+    Retrieves `team` with a retrieve per Pokemon.
+
+    Args:
+        team (list): The IDs of the Pokemon.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    for pokeapi_id in team:
+        request = RequestFactory().get(f"/api/v1/pokemon/{pokeapi_id}/")
+        response = PokemonApiWrapper(request).retrieve(pokeapi_id)
+        assert response.status_code == 200
+    return time.perf_counter() - start
+
+
+def batch(team: list) -> float:
+    """
+    Retrieves `team` with a single batch.
+
+    Args:
+        team (list): The IDs of the Pokemon.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    ids = ",".join(map(str, team))
+    start = time.perf_counter()
+    request = RequestFactory().get("/api/v1/pokemon/batch/", {"ids": ids})
+    response = PokemonApiWrapper(request).batch(ids)
+    assert response.status_code == 200
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--team", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    team = list(range(1, args.team + 1))
+    with StubPokeApi(count=args.team, latency=args.latency) as stub:
+        settings.POKEAPI["BASE_URI"] = stub.base_uri
+        PokemonApi.close_session()
+        print(f"{'retrieve':<12}{'seconds':>10}{'requests':>10}")
+        for label, run in (("one by one", one_by_one), ("batch", batch)):
+            cache.clear()
+            TieredCache.reset()
+            requests = stub.requests
+            elapsed = run(team)
+            print(f"{label:<12}{elapsed:>10.3f}{stub.requests - requests:>10}")
+        PokemonApi.close_session()
+
+
+if __name__ == "__main__":
+    main()
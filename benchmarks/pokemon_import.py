@@ -0,0 +1,121 @@
+"""
+Benchmark of the bulk import of Pokemon overrides.
+
+Imports Pokemon shaped like PokeAPI's ones into an in-memory SQLite database,
+first with a write of `PokemonUpdateSerializer` per Pokemon, as the update
+endpoint does, then with `PokemonImporter` at growing batch sizes, and
+reports the rows written per second. Each run starts from an empty table, so
+every row is inserted. Run it from the project root:
+
+    python -m benchmarks.pokemon_import --pokemon 1000
+"""
+
+import argparse
+import time
+
+import django
+from django.conf import settings
+
+from config import settings as project_settings
+
+settings.configure(
+    INSTALLED_APPS=["apps.wrapper"],
+    DATABASES={
+        "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+    },
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    },
+    REST_FRAMEWORK=project_settings.REST_FRAMEWORK,
+    TIERED_CACHE=project_settings.TIERED_CACHE,
+    RENDERED_CACHE=project_settings.RENDERED_CACHE,
+    POKEAPI=project_settings.POKEAPI,
+    POKEMON_IMPORT=project_settings.POKEMON_IMPORT,
+    USE_TZ=True,
+)
+django.setup()
+
+# pylint: disable=wrong-import-position
+from django.core.management import call_command  # noqa: E402
+
+from apps.wrapper import models  # noqa: E402
+from apps.wrapper.classes.pokemon_importer import PokemonImporter  # noqa: E402
+from apps.wrapper.serializers import PokemonUpdateSerializer  # noqa: E402
+from tests.stub_pokeapi import StubPokeApi  # noqa: E402
+
+
+def reset():
+    """
+    Empties the tables written by an import.
+    """
+    for model in (
+        models.Pokemon,
+        models.PokemonAbility,
+        models.PokemonSprite,
+        models.PokemonType,
+        models.PokemonCatalogEntry,
+    ):
+        model.objects.all().delete()
+
+
+def one_by_one(items: list) -> float:
+    """
+    Writes `items` with a serializer write per Pokemon.
+
+    Args:
+        items (list): The Pokemon to write.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    reset()
+    start = time.perf_counter()
+    for item in items:
+        serializer = PokemonUpdateSerializer(data=item)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+    return time.perf_counter() - start
+
+
+def bulk(items: list, batch_size: int) -> float:
+    """
+    Writes `items` with `PokemonImporter`.
+
+    Args:
+        items (list): The Pokemon to write.
+        batch_size (int): The number of Pokemon per transaction.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    reset()
+    start = time.perf_counter()
+    report = PokemonImporter(batch_size).run(items)
+    elapsed = time.perf_counter() - start
+    assert report["created"] == len(items), report["errors"][:1]
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pokemon", type=int, default=1000)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[50, 200, 500, 1000]
+    )
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    stub = StubPokeApi(count=args.pokemon)
+    items = [stub.pokemon(index) for index in range(1, args.pokemon + 1)]
+
+    print(f"{'write':<16}{'seconds':>10}{'rows/s':>10}")
+    elapsed = one_by_one(items)
+    print(f"{'one by one':<16}{elapsed:>10.2f}{len(items) / elapsed:>10.0f}")
+    for batch_size in args.batch_sizes:
+        elapsed = bulk(items, batch_size)
+        label = f"batch of {batch_size}"
+        print(f"{label:<16}{elapsed:>10.2f}{len(items) / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark of the compression of rendered Pokemon details.
+
+Renders details shaped like PokeAPI's ones, with the full `sprites.other` and
+`sprites.versions` trees, and reports the bytes sent and the CPU time per
+detail with no compression and with each encoding of `ContentEncoding`, at
+the configured levels. Run it from the project root:
+
+    python -m benchmarks.response_compression --pokemon 100 --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+
+import django
+from django.conf import settings
+
+from config import settings as project_settings
+
+settings.configure(
+    REST_FRAMEWORK=project_settings.REST_FRAMEWORK,
+    COMPRESSION=project_settings.COMPRESSION,
+)
+django.setup()
+
+# pylint: disable=wrong-import-position
+from apps.wrapper.classes.content_encoding import ContentEncoding  # noqa: E402
+from apps.wrapper.renderers import ORJSONRenderer  # noqa: E402
+from tests.stub_pokeapi import StubPokeApi  # noqa: E402
+
+
+def run(contents: list, encoding: str, repeat: int) -> dict:
+    """
+    Compresses `contents` with an encoding.
+
+    Args:
+        contents (list): The rendered details.
+        encoding (str): One of `ContentEncoding.ENCODINGS`.
+        repeat (int): The number of runs, the best one is kept.
+
+    Returns:
+        dict: The median size in bytes and the CPU time per detail in
+        microseconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.process_time()
+        bodies = [
+            ContentEncoding.compress(content, encoding) for content in contents
+        ]
+        times.append(time.process_time() - start)
+    return {
+        "bytes": statistics.median(len(body) for body in bodies),
+        "cpu": min(times) / len(contents) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pokemon", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stub = StubPokeApi(count=args.pokemon)
+    renderer = ORJSONRenderer()
+    contents = [
+        renderer.render(stub.full_pokemon(index))
+        for index in range(1, args.pokemon + 1)
+    ]
+
+    print(f"{'encoding':<10}{'bytes':>10}{'ratio':>8}{'cpu (us)':>10}")
+    size = statistics.median(len(content) for content in contents)
+    print(f"{'identity':<10}{size:>10.0f}{1:>8.2f}{0:>10.1f}")
+    for encoding in ContentEncoding.ENCODINGS:
+        result = run(contents, encoding, args.repeat)
+        print(
+            f"{encoding:<10}{result['bytes']:>10.0f}"
+            f"{size / result['bytes']:>8.2f}{result['cpu']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,35 @@ ASGI config for poke_api_manager project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Requests served through it are resolved with ``config.urls_asgi``, which
+routes the Pokemon ``list`` and ``retrieve`` operations to async views.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+
+class PokemonASGIHandler(ASGIHandler):
+    """
+    ASGI handler that resolves requests with the async URL configuration.
+    """
+
+    urlconf = "config.urls_asgi"
+
+    def create_request(self, scope, body_file):
+        request, error_response = super().create_request(scope, body_file)
+        if request is not None:
+            request.urlconf = self.urlconf
+        return request, error_response
+
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "poke_api_manager.settings")
+django.setup(set_prefix=False)
 
-application = get_asgi_application()
+application = PokemonASGIHandler()
@@ -157,11 +157,27 @@ TEMPLATES = [
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# JSON backend of the API: "orjson", or "stdlib" for the renderer and parser
+# of DRF. Both render the same bytes.
+JSON_BACKENDS = {
+    "orjson": (
+        "apps.wrapper.renderers.ORJSONRenderer",
+        "apps.wrapper.parsers.ORJSONParser",
+    ),
+    "stdlib": (
+        "rest_framework.renderers.JSONRenderer",
+        "rest_framework.parsers.JSONParser",
+    ),
+}
+JSON_RENDERER, JSON_PARSER = JSON_BACKENDS[
+    os.environ.get("JSON_BACKEND", "orjson")
+]
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [],
     "DEFAULT_PERMISSION_CLASSES": [],
-    "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
-    "DEFAULT_PARSER_CLASSES": ["rest_framework.parsers.JSONParser"],
+    "DEFAULT_RENDERER_CLASSES": [JSON_RENDERER],
+    "DEFAULT_PARSER_CLASSES": [JSON_PARSER],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend"
@@ -175,6 +191,137 @@ REST_FRAMEWORK = {
     "DEFAULT_THROTTLE_RATES": {"anon": "120/min"},
 }
 
+# Caches
+# Workers share REDIS_URL when it is set; LocMemCache is per process.
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+    }
+else:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+# Per-process LRU in front of the shared cache, see `TieredCache`
+TIERED_CACHE = {
+    "L1_MAX_BYTES": int(
+        os.environ.get("TIERED_CACHE_L1_MAX_BYTES", 64 * 1024 * 1024)
+    ),
+    "L1_TIMEOUT": float(os.environ.get("TIERED_CACHE_L1_TIMEOUT", 300)),
+    "INVALIDATION_POLL_INTERVAL": float(
+        os.environ.get("TIERED_CACHE_INVALIDATION_POLL_INTERVAL", 1)
+    ),
+    "INVALIDATION_LOG_SIZE": 1000,
+}
+
+# Rendered Pokemon details, see `RenderedCache`
+# Details of local overrides are rendered again after OVERRIDE_TTL seconds,
+# details fetched from PokeAPI after the TTL of their upstream response.
+RENDERED_CACHE = {
+    "OVERRIDE_TTL": int(os.environ.get("RENDERED_CACHE_OVERRIDE_TTL", 300))
+}
+
+# Pokemon list endpoint
+# MAX_LIMIT caps the `limit` of a page; the whole catalog is served by the
+# streaming export instead.
+POKEMON_LIST = {
+    "MAX_LIMIT": int(os.environ.get("POKEMON_LIST_MAX_LIMIT", 100)),
+    "EXPORT_CHUNK_SIZE": int(
+        os.environ.get("POKEMON_LIST_EXPORT_CHUNK_SIZE", 500)
+    ),
+    "CACHE_ALIAS": "default",
+    "CACHE_TTL": int(os.environ.get("POKEMON_LIST_CACHE_TTL", 60 * 60 * 24)),
+}
+
+# Bulk import of Pokemon overrides, see `PokemonImporter`
+# Each batch of BATCH_SIZE items is written in its own transaction.
+POKEMON_IMPORT = {
+    "BATCH_SIZE": int(os.environ.get("POKEMON_IMPORT_BATCH_SIZE", 500))
+}
+
+# Batch retrieve of Pokemon details, see `PokemonApiWrapper.batch`
+# At most MAX_IDS per request; the ones that aren't stored locally are
+# requested from PokeAPI CONCURRENCY at a time by the whole process, so it
+# should be at most POKEAPI["POOL_MAXSIZE"].
+POKEMON_BATCH = {
+    "MAX_IDS": int(os.environ.get("POKEMON_BATCH_MAX_IDS", 50)),
+    "CONCURRENCY": int(os.environ.get("POKEMON_BATCH_CONCURRENCY", 8)),
+}
+
+# Local mirror of the Pokemon details of PokeAPI, see `PokemonMirror`
+# RATE_LIMIT is in requests per second, 0 for no limit; entries older than
+# MAX_AGE seconds are fetched again by the next crawl. CONCURRENCY should be
+# at most POKEAPI["POOL_MAXSIZE"], the connections the workers share.
+POKEMON_MIRROR = {
+    "CONCURRENCY": int(os.environ.get("POKEMON_MIRROR_CONCURRENCY", 8)),
+    "RATE_LIMIT": float(os.environ.get("POKEMON_MIRROR_RATE_LIMIT", 20)),
+    "MAX_AGE": int(os.environ.get("POKEMON_MIRROR_MAX_AGE", 60 * 60 * 24 * 7)),
+    "BATCH_SIZE": int(os.environ.get("POKEMON_MIRROR_BATCH_SIZE", 100)),
+}
+
+# Cache-Control header of the responses of each action, empty to send none
+HTTP_CACHE = {
+    "list": os.environ.get(
+        "HTTP_CACHE_LIST", "public, max-age=60, s-maxage=300"
+    ),
+    "retrieve": os.environ.get(
+        "HTTP_CACHE_RETRIEVE", "public, max-age=300, s-maxage=3600"
+    ),
+}
+
+# Compression of list pages and details. Bodies shorter than MIN_SIZE bytes
+# are sent uncompressed; compressed variants are cached for CACHE_TTL seconds.
+COMPRESSION = {
+    "MIN_SIZE": int(os.environ.get("COMPRESSION_MIN_SIZE", 1024)),
+    "GZIP_LEVEL": int(os.environ.get("COMPRESSION_GZIP_LEVEL", 6)),
+    "BROTLI_QUALITY": int(os.environ.get("COMPRESSION_BROTLI_QUALITY", 5)),
+    "CACHE_TTL": int(os.environ.get("COMPRESSION_CACHE_TTL", 60 * 60 * 24)),
+}
+
+# PokeAPI client
+# The session is shared by the whole process, so POOL_MAXSIZE should be at
+# least the number of threads that may call PokeAPI at the same time.
+POKEAPI = {
+    "BASE_URI": os.environ.get(
+        "POKEAPI_BASE_URI", "https://pokeapi.co/api/v2/"
+    ),
+    "TIMEOUT": float(os.environ.get("POKEAPI_TIMEOUT", 10)),
+    "CONNECT_TIMEOUT": float(os.environ.get("POKEAPI_CONNECT_TIMEOUT", 3.05)),
+    "POOLING": bool(int(os.environ.get("POKEAPI_POOLING", 1))),
+    "POOL_CONNECTIONS": int(os.environ.get("POKEAPI_POOL_CONNECTIONS", 4)),
+    "POOL_MAXSIZE": int(os.environ.get("POKEAPI_POOL_MAXSIZE", 20)),
+    "POOL_BLOCK": False,
+    "MAX_RETRIES": int(os.environ.get("POKEAPI_MAX_RETRIES", 3)),
+    "BACKOFF_FACTOR": float(os.environ.get("POKEAPI_BACKOFF_FACTOR", 0.3)),
+    "BACKOFF_JITTER": float(os.environ.get("POKEAPI_BACKOFF_JITTER", 0.3)),
+    "RETRY_STATUS_FORCELIST": [429, 500, 502, 503, 504],
+    # Upstream response cache, in seconds. Stale entries are kept for
+    # CACHE_STALE_TTL more seconds so they can be revalidated with a 304.
+    "CACHE_ALIAS": "default",
+    "CACHE_TTL": {
+        "pokemon_list": int(os.environ.get("POKEAPI_LIST_TTL", 60 * 60)),
+        "pokemon": int(os.environ.get("POKEAPI_DETAIL_TTL", 60 * 60 * 24)),
+    },
+    "CACHE_STALE_TTL": int(
+        os.environ.get("POKEAPI_STALE_TTL", 60 * 60 * 24 * 7)
+    ),
+    # Coalescing of concurrent requests to the same URL, in seconds
+    "SINGLE_FLIGHT_LOCK_TIMEOUT": 30,
+    "SINGLE_FLIGHT_POLL_INTERVAL": 0.05,
+    "METRICS_FLUSH_INTERVAL": 10,
+    # Circuit breaker: consecutive failures that open the circuit, and
+    # seconds before a half-open probe is let through.
+    "CIRCUIT_FAILURE_THRESHOLD": int(
+        os.environ.get("POKEAPI_CIRCUIT_FAILURE_THRESHOLD", 5)
+    ),
+    "CIRCUIT_RESET_TIMEOUT": float(
+        os.environ.get("POKEAPI_CIRCUIT_RESET_TIMEOUT", 30)
+    ),
+}
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Uniandes PokéAPI",
     "DESCRIPTION": (
@@ -22,6 +22,7 @@ from django.contrib import admin
 from django.urls import path, re_path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from apps.wrapper.views import MetricsView
 from config.api import api
 
 urlpatterns = [
@@ -30,6 +31,7 @@ urlpatterns = [
         r"api/v1/docs/?$", SpectacularSwaggerView.as_view(), name="swagger"
     ),
     re_path(r"api/v1/schema/?$", SpectacularAPIView.as_view(), name="schema"),
+    re_path(r"api/v1/metrics/?$", MetricsView.as_view(), name="metrics"),
     path(
         "api-auth/", include("rest_framework.urls", namespace="rest_framework")
     ),
@@ -0,0 +1,54 @@
+"""
+URL configuration used by the ASGI entry point.
+
+It serves the `list` and `retrieve` operations of the Pokemon API with the
+async `PokemonAsyncView`, streams its export with `PokemonExportAsyncView`,
+serves its batch retrieve with `PokemonBatchAsyncView`, hands its bulk
+import over to `PokemonViewSet`, and falls back to `config.urls` for
+everything else.
+"""
+
+from django.urls import re_path
+
+from apps.wrapper.views import (
+    PokemonAsyncView,
+    PokemonBatchAsyncView,
+    PokemonExportAsyncView,
+)
+from config.urls import urlpatterns as wsgi_urlpatterns
+
+urlpatterns = [
+    re_path(
+        r"^api/v1/pokemon/?$",
+        PokemonAsyncView.as_view(
+            viewset_actions={"get": "list", "post": "create"}
+        ),
+        name="pokemon-async-list",
+    ),
+    re_path(
+        r"^api/v1/pokemon/export/?$",
+        PokemonExportAsyncView.as_view(),
+        name="pokemon-async-export",
+    ),
+    re_path(
+        r"^api/v1/pokemon/batch/?$",
+        PokemonBatchAsyncView.as_view(),
+        name="pokemon-async-batch",
+    ),
+    re_path(
+        r"^api/v1/pokemon/import/?$",
+        PokemonAsyncView.as_view(viewset_actions={"post": "bulk_import"}),
+        name="pokemon-async-import",
+    ),
+    re_path(
+        r"^api/v1/pokemon/(?P<pokeapi_id>[^/.]+)/?$",
+        PokemonAsyncView.as_view(
+            viewset_actions={
+                "get": "retrieve",
+                "put": "update",
+                "patch": "partial_update",
+            }
+        ),
+        name="pokemon-async-detail",
+    ),
+] + wsgi_urlpatterns
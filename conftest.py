@@ -1,9 +1,17 @@
 from abc import ABC
 
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
 from apps.wrapper import models, serializers
+from apps.wrapper.classes.catalog_index import CatalogIndex
+from apps.wrapper.classes.circuit_breaker import CircuitBreaker
+from apps.wrapper.classes.metrics import Metrics
+from apps.wrapper.classes.pokemon_api import PokemonApi
+from apps.wrapper.classes.pokemon_catalog import PokemonCatalog
+from apps.wrapper.classes.tiered_cache import TieredCache
+from tests.stub_pokeapi import StubPokeApi
 
 
 # Model factories
@@ -270,3 +278,43 @@ def db_pokemon(db, pokemon_params):
 @pytest.fixture
 def api_client():
     return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Empties the caches, the metrics, the circuit breakers and the catalog
+    index, so they don't leak between tests.
+    """
+    cache.clear()
+    TieredCache.reset()
+    Metrics.reset()
+    CircuitBreaker.reset_all()
+    CatalogIndex.reset()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def stub_pokeapi(settings):
+    """
+    Serves a local PokeAPI stub and points the `PokemonApi` client at it.
+    """
+    with StubPokeApi() as stub:
+        settings.POKEAPI = {
+            **settings.POKEAPI,
+            "BASE_URI": stub.base_uri,
+            "BACKOFF_FACTOR": 0,
+            "BACKOFF_JITTER": 0,
+        }
+        PokemonApi.close_session()
+        yield stub
+        PokemonApi.close_session()
+
+
+@pytest.fixture
+def pokemon_catalog(db):
+    """
+    Syncs the catalog of the list endpoint from the configured PokeAPI.
+    """
+    return PokemonCatalog().sync()
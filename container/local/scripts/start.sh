@@ -6,5 +6,6 @@ set -o nounset
 set -o xtrace
 
 python manage.py migrate --noinput &&
+(python manage.py sync_pokemon_catalog || echo "Pokemon catalog sync failed, serving the last synced catalog") &&
 python manage.py collectstatic --noinput --verbosity 0 &&
 python manage.py runserver 0.0.0.0:8000
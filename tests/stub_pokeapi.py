@@ -0,0 +1,297 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+NAMES = [
+    "bulbasaur",
+    "ivysaur",
+    "venusaur",
+    "charmander",
+    "charmeleon",
+    "charizard",
+    "squirtle",
+    "wartortle",
+    "blastoise",
+    "caterpie",
+    "metapod",
+    "butterfree",
+    "weedle",
+    "kakuna",
+    "beedrill",
+    "pidgey",
+    "pidgeotto",
+    "pidgeot",
+    "rattata",
+    "raticate",
+]
+
+SPRITES = (
+    "back_default",
+    "back_female",
+    "back_shiny",
+    "back_shiny_female",
+    "front_default",
+    "front_female",
+    "front_shiny",
+    "front_shiny_female",
+)
+VERSIONS = {
+    "generation-i": ("red-blue", "yellow"),
+    "generation-ii": ("crystal", "gold", "silver"),
+    "generation-iii": ("emerald", "firered-leafgreen", "ruby-sapphire"),
+    "generation-iv": ("diamond-pearl", "heartgold-soulsilver", "platinum"),
+    "generation-v": ("black-white",),
+    "generation-vi": ("omegaruby-alphasapphire", "x-y"),
+    "generation-vii": ("icons", "ultra-sun-ultra-moon"),
+    "generation-viii": ("icons",),
+}
+
+
+class StubPokeApi:
+    """
+    A tiny local lookalike of PokeAPI used by tests and benchmarks.
+
+    It serves `/api/v2/pokemon` and `/api/v2/pokemon/{id}` over HTTP/1.1 with
+    keep-alive, answers conditional requests with 304, and records how many
+    requests and TCP connections it received.
+    """
+
+    LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    def __init__(self, count: int = 20, latency: float = 0.0):
+        self.count = count
+        self.latency = latency
+        self.failures = []
+        self.requests = 0
+        self.not_modified = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_uri(self) -> str:
+        """
+        Returns the base URI of the stub, shaped like PokeAPI's one.
+
+        Returns:
+            str: The base URI ending with `/api/v2/`.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v2/"
+
+    def name(self, pokeapi_id: int) -> str:
+        """
+        Returns the name of the Pokemon with the given ID.
+
+        Args:
+            pokeapi_id (int): The ID of the Pokemon.
+
+        Returns:
+            str: The name of the Pokemon.
+        """
+        if pokeapi_id <= len(NAMES):
+            return NAMES[pokeapi_id - 1]
+        return f"pokemon-{pokeapi_id}"
+
+    def pokemon(self, pokeapi_id: int) -> dict:
+        """
+        Builds the detail payload of a Pokemon.
+
+        Args:
+            pokeapi_id (int): The ID of the Pokemon.
+
+        Returns:
+            dict: A payload with the same shape as PokeAPI's one.
+        """
+        sprite = (
+            "https://raw.githubusercontent.com/PokeAPI/sprites/master/"
+            f"sprites/pokemon/{pokeapi_id}.png"
+        )
+        return {
+            "id": pokeapi_id,
+            "name": self.name(pokeapi_id),
+            "abilities": [
+                {
+                    "ability": {
+                        "name": "overgrow",
+                        "url": "https://pokeapi.co/api/v2/ability/65/",
+                    },
+                    "slot": 1,
+                    "is_hidden": False,
+                }
+            ],
+            "sprites": {
+                "back_default": None,
+                "back_female": None,
+                "back_shiny": None,
+                "back_shiny_female": None,
+                "front_default": sprite,
+                "front_female": None,
+                "front_shiny": None,
+                "front_shiny_female": None,
+                "other": {},
+                "versions": {},
+            },
+            "types": [
+                {
+                    "slot": 1,
+                    "type": {
+                        "name": "grass",
+                        "url": "https://pokeapi.co/api/v2/type/12/",
+                    },
+                }
+            ],
+        }
+
+    def full_pokemon(self, pokeapi_id: int) -> dict:
+        """
+        Builds the detail payload of a Pokemon with every sprite PokeAPI
+        returns, in `sprites.other` and `sprites.versions`.
+
+        Args:
+            pokeapi_id (int): The ID of the Pokemon.
+
+        Returns:
+            dict: A payload with the same shape and size as PokeAPI's one.
+        """
+        base = (
+            "https://raw.githubusercontent.com/PokeAPI/sprites/master/"
+            "sprites/pokemon"
+        )
+
+        def sprites(path: str) -> dict:
+            return {
+                name: f"{base}/{path}/{name}/{pokeapi_id}.png"
+                for name in SPRITES
+            }
+
+        data = self.pokemon(pokeapi_id)
+        data["sprites"]["other"] = {
+            other: sprites(f"other/{other}")
+            for other in (
+                "dream_world",
+                "home",
+                "official-artwork",
+                "showdown",
+            )
+        }
+        data["sprites"]["versions"] = {
+            generation: {
+                game: sprites(f"versions/{generation}/{game}")
+                for game in games
+            }
+            for generation, games in VERSIONS.items()
+        }
+        return data
+
+    def pokemon_list(self, limit: int, offset: int) -> dict:
+        """
+        Builds a page of the Pokemon index.
+
+        Args:
+            limit (int): The maximum number of Pokemon in the page.
+            offset (int): The number of Pokemon to skip.
+
+        Returns:
+            dict: A payload with the same shape as PokeAPI's one.
+        """
+        ids = range(offset + 1, min(offset + limit, self.count) + 1)
+        return {
+            "count": self.count,
+            "next": None,
+            "previous": None,
+            "results": [
+                {
+                    "name": self.name(pokeapi_id),
+                    "url": f"{self.base_uri}pokemon/{pokeapi_id}/",
+                }
+                for pokeapi_id in ids
+            ],
+        }
+
+    def start(self) -> "StubPokeApi":
+        """
+        Starts serving in a daemon thread on a free local port.
+
+        Returns:
+            StubPokeApi: The running stub.
+        """
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                with stub._lock:
+                    stub.requests += 1
+                    status = stub.failures.pop(0) if stub.failures else 200
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if status != 200:
+                    self._send(status, {"detail": "Stub failure"})
+                    return
+                url = urlparse(self.path)
+                match = re.fullmatch(r"/api/v2/pokemon/(\d+)/?", url.path)
+                if match and 0 < int(match.group(1)) <= stub.count:
+                    self._send(200, stub.pokemon(int(match.group(1))))
+                elif re.fullmatch(r"/api/v2/pokemon/?", url.path):
+                    query = parse_qs(url.query)
+                    limit = int(query.get("limit", ["20"])[0])
+                    offset = int(query.get("offset", ["0"])[0])
+                    self._send(200, stub.pokemon_list(limit, offset))
+                else:
+                    self._send(404, {"detail": "Not found"})
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode("utf-8")
+                etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+                if status == 200 and self.headers["If-None-Match"] == etag:
+                    with stub._lock:
+                        stub.not_modified += 1
+                    status, body = 304, b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", stub.LAST_MODIFIED)
+                self.end_headers()
+                self.wfile.write(body)
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 128
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server and waits for its thread to finish.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> "StubPokeApi":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()